@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Uygulamanın kalıcı dosyaları (istatistik, önbellek) için klasör yolları
+"""
+
+import os
+
+# Kullanıcı klasöründeki uygulama veri dizini (MAPMINER_HOME ile değiştirilebilir)
+APP_DATA_DIR = os.environ.get('MAPMINER_HOME') or os.path.join(os.path.expanduser('~'), '.mapminer')
+
+
+def app_data_path(*parts):
+    """Uygulama veri dizini altında bir yol döndür, klasörü gerekirse oluştur"""
+    path = os.path.join(APP_DATA_DIR, *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Arama akışı: thread'den tüketiciye sınırlı kuyrukla kayıt aktarımı
+
+Selenium çağrıları bloklayıcıdır; arama kendi scraper'ı (ve driver'ı) ile
+arka plan thread'inde çalışır, kesinleşen her kayıt sınırlı bir kuyruğa
+aktarılır. Aynı köprü hem generator hem asyncio API'sini besler:
+
+    for record in stream_search(scraper, 'restoran', 'Kadıköy'):
+        ...
+
+    async for record in scraper.search_async('restoran', 'Kadıköy'):
+        ...
+
+    async for index, record in search_many_async(jobs, concurrency=3):
+        ...
+
+Kuyruk sınırlıdır (queue_size): tüketici yavaşsa kuyruk dolar ve tarama
+thread'i kayıt eklerken bekler - geri basınç driver'a kadar iner. Tüketici
+döngüden erken çıkarsa generator kapanırken (close()/aclose() veya
+döngünün sonlandırıcısı) tarama request_stop() ile sıradaki kartta durdurulur.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_QUEUE_SIZE = 100
+DEFAULT_CONCURRENCY = 2
+
+_DONE = object()  # Tarama bitti işareti
+
+logger = logging.getLogger(__name__)
+
+
+def _default_scraper():
+    from google_maps_scraper import GoogleMapsScraper
+
+    return GoogleMapsScraper(headless=True, notify=False, lean=True)
+
+
+def stream_search(scraper, query, location="", max_results=50, queue_size=DEFAULT_QUEUE_SIZE, **search_options):
+    """
+    Tek aramayı arka plan thread'inde çalıştır, kayıtları geldikçe ver (generator)
+
+    Args:
+        scraper (GoogleMapsScraper): Aramayı yapacak scraper (driver'ı bu aramaya ayrılır)
+        query, location, max_results: search_businesses ile aynı
+        queue_size (int): Tüketilmeyi bekleyen en fazla kayıt (dolunca tarama bekler)
+        **search_options: search_businesses'e geçen diğer seçenekler (extraction_mode, tile_zoom ...)
+
+    Yields:
+        BusinessRecord: Detaylarıyla kesinleşen her yeni kayıt
+
+    Raises:
+        RuntimeError: Arama başarısız olursa (akış bittikten sonra)
+    """
+    records = queue.Queue(maxsize=queue_size)
+    outcome = {}
+
+    def on_record(record):
+        # Tarama thread'i: kuyruk doluysa yer açılana kadar bekler (geri basınç)
+        while not scraper.stop_requested:
+            try:
+                records.put(record, timeout=0.2)
+                return
+            except queue.Full:
+                continue
+
+    def run():
+        try:
+            outcome['ok'] = scraper.search_businesses(query=query, location=location, max_results=max_results,
+                                                      record_callback=on_record, **search_options)
+        except Exception as e:
+            outcome['error'] = e
+        finally:
+            records.put(_DONE)
+
+    thread = threading.Thread(target=run, name='mapminer-search', daemon=True)
+    thread.start()
+    finished = False
+    try:
+        while True:
+            record = records.get()
+            if record is _DONE:
+                finished = True
+                break
+            yield record
+    finally:
+        if not finished:
+            # Tüketici erken çıktı: taramayı durdur, kuyruğu boşaltıp thread'in bitmesini bekle
+            scraper.request_stop()
+            while thread.is_alive():
+                try:
+                    records.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+        thread.join()
+
+    if 'error' in outcome:
+        raise outcome['error']
+    if not outcome.get('ok'):
+        raise RuntimeError(f"Arama başarısız: {query} {location}".strip())
+
+
+async def search_async(scraper, query, location="", max_results=50, queue_size=DEFAULT_QUEUE_SIZE, executor=None,
+                       **search_options):
+    """
+    stream_search'ün asyncio sürümü (async generator)
+
+    Kuyruktan her kayıt executor thread'inde beklenir; olay döngüsü bloklanmaz.
+
+    Args:
+        executor (Executor): Kuyruk beklemelerinin çalışacağı havuz (varsayılan: döngünün varsayılanı)
+        Diğerleri: stream_search ile aynı
+
+    Yields:
+        BusinessRecord: Detaylarıyla kesinleşen her yeni kayıt
+    """
+    loop = asyncio.get_running_loop()
+    records = stream_search(scraper, query, location, max_results, queue_size, **search_options)
+    waiting = None
+    try:
+        while True:
+            # shield: iptal edilirsek bekleyen next() thread'de sürer, aşağıda bitmesi beklenir
+            waiting = loop.run_in_executor(executor, next, records, _DONE)
+            record = await asyncio.shield(waiting)
+            if record is _DONE:
+                break
+            yield record
+    finally:
+        if waiting is not None and not waiting.done():
+            # İptal: taramayı durdur; kuyruk _DONE verince next() döner
+            scraper.request_stop()
+            await asyncio.wait({waiting})
+            waiting.exception()  # İptalden sonra gelen hata "alınmadı" uyarısı vermesin
+        await loop.run_in_executor(executor, records.close)
+
+
+async def search_many_async(jobs, concurrency=DEFAULT_CONCURRENCY, scraper_factory=None, queue_size=DEFAULT_QUEUE_SIZE,
+                            on_job_done=None, **search_options):
+    """
+    Birden çok aramayı en fazla `concurrency` tanesi aynı anda olacak şekilde çalıştır
+
+    Her arama kendi scraper'ı ve driver'ıyla ayrı thread'de yürür; kayıtlar
+    tek bir sınırlı kuyrukta birleşir. Tekrarlar elenmez (bkz. batch_engine.record_key).
+
+    Args:
+        jobs (list): (query, location, max_results) demetleri
+        concurrency (int): Aynı anda açık driver sayısı (semafor)
+        scraper_factory (callable): Yeni scraper döndürür (varsayılan: headless, hafif mod)
+        queue_size (int): Tüketilmeyi bekleyen en fazla kayıt
+        on_job_done (function): (iş_indeksi, hata veya None, süre) ile her iş bitince çağrılır
+        **search_options: Her aramaya geçen search_businesses seçenekleri
+
+    Yields:
+        tuple: (iş_indeksi, BusinessRecord)
+    """
+    scraper_factory = scraper_factory or _default_scraper
+    semaphore = asyncio.Semaphore(concurrency)
+    queue = asyncio.Queue(maxsize=queue_size)
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='mapminer-search')
+    loop = asyncio.get_running_loop()
+
+    async def run_job(index, query, location, max_results):
+        async with semaphore:
+            started = time.perf_counter()
+            error = None
+            scraper = scraper_factory()
+            # Aynı arama + konumlu işler aynı anda yürüyebilir: her iş kendi günlüğünü tutar
+            records = search_async(scraper, query, location, max_results, queue_size=queue_size,
+                                   executor=executor, journal_key=index, **search_options)
+            try:
+                async for record in records:
+                    await queue.put((index, record))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                error = e
+                logger.error(f"Arama başarısız: {query} {location} - {e}")
+            finally:
+                # İptalde de tarama durdurulup thread beklenir (async generator hemen kapatılır)
+                await records.aclose()
+                await loop.run_in_executor(executor, scraper.close)
+            if on_job_done:
+                on_job_done(index, error, time.perf_counter() - started)
+
+    tasks = [asyncio.ensure_future(run_job(index, *job)) for index, job in enumerate(jobs)]
+    all_done = asyncio.ensure_future(asyncio.wait(tasks))
+    try:
+        while not (all_done.done() and queue.empty()):
+            getter = asyncio.ensure_future(queue.get())
+            await asyncio.wait({getter, all_done}, return_when=asyncio.FIRST_COMPLETED)
+            if getter.done():
+                yield getter.result()
+            else:
+                getter.cancel()
+    finally:
+        # Erken çıkışta işler iptal edilir; her search_async kendi taramasını durdurup bekler
+        all_done.cancel()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        executor.shutdown(wait=False)
+
+
+if __name__ == "__main__":
+    import sys
+
+    # Örnek: python async_search.py "restoran;Kadıköy;20" "kafe;Beşiktaş;20"
+    jobs = []
+    for arg in sys.argv[1:] or ["restoran;Kadıköy;10", "kafe;Beşiktaş;10"]:
+        parts = arg.split(';')
+        jobs.append((parts[0], parts[1] if len(parts) > 1 else '', int(parts[2]) if len(parts) > 2 else 20))
+
+    async def main():
+        started = time.perf_counter()
+        first = None
+        count = 0
+        async for index, record in search_many_async(jobs):
+            first = first or time.perf_counter() - started
+            count += 1
+            print(f"[{index + 1}] {record.get('Ad')} - {record.get('Telefon') or '-'}")
+        print(f"{count} kayıt, ilk kayıt {first or 0:.1f} sn, toplam {time.perf_counter() - started:.1f} sn")
+
+    asyncio.run(main())
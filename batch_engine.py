@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Çoklu arama (batch) motoru
+
+(arama, konum, maksimum sonuç) işleri bir süreç havuzunda çalıştırılır;
+her işçi süreç kendi Chrome driver'ına sahiptir. Sonuçlar geldikçe tek,
+tekrarsız bir veri kümesinde birleştirilir.
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.util import Finalize
+
+# İş durumları
+PENDING = 'bekliyor'
+RUNNING = 'çalışıyor'
+RETRYING = 'tekrar deneniyor'
+DONE = 'tamamlandı'
+FAILED = 'hata'
+
+# İşçi süreç başına tek scraper (driver işler arasında yeniden kullanılır)
+_worker_scraper = None
+
+
+def _init_worker(headless, wait_timeout, lean):
+    """İşçi süreç başlangıcı: süreç boyunca kullanılacak scraper'ı hazırla"""
+    global _worker_scraper
+    from google_maps_scraper import GoogleMapsScraper
+
+    _worker_scraper = GoogleMapsScraper(headless=headless, wait_timeout=wait_timeout, notify=False, lean=lean)
+    # İşçi süreçler atexit çalıştırmadan çıkar; driver'ı multiprocessing finalizer'ı kapatır
+    Finalize(None, _worker_scraper.close, exitpriority=10)
+
+
+def _run_job(query, location, max_results, extraction_mode, resume=False, job_id=None):
+    """
+    Tek bir işi işçi sürecin driver'ıyla çalıştır ve kayıtları döndür
+
+    resume: tekrar denemede günlükten devam; günlük job_id ile anahtarlanır,
+    böylece aynı arama + konumlu başka bir işin kayıtlarından devam edilmez.
+    """
+    scraper = _worker_scraper
+    scraper.business_data = []
+    # Önceki işlerin işletmeleri atlanmaz, sadece detayları indeksten alınır (search_businesses yeni oturum açar)
+    scraper.seen_place_ids = set()
+
+    success = scraper.search_businesses(
+        query=query,
+        location=location,
+        max_results=max_results,
+        extraction_mode=extraction_mode,
+        resume=resume,
+        journal_key=job_id
+    )
+    if not success:
+        # Driver çökmüş olabilir - sonraki denemede yeniden açılsın
+        scraper.close()
+        raise RuntimeError(f"Arama başarısız: {query} {location}".strip())
+    return scraper.business_data
+
+
+def record_key(record):
+    """Birleştirme için kayıt anahtarı: place id, yoksa ad + adres"""
+    return record.get('Yer ID') or (record.get('Ad', '').strip().lower(), record.get('Adres', '').strip().lower())
+
+
+class BatchEngine:
+    def __init__(self, jobs, workers=None, retries=2, headless=True, wait_timeout=10,
+                 extraction_mode='bulk', progress_callback=None, record_callback=None, lean=True, job_callback=None):
+        """
+        Args:
+            jobs (list): (query, location, max_results) demetleri
+            workers (int): Paralel süreç (Chrome) sayısı, varsayılan çekirdek sayısı
+            retries (int): Başarısız bir işin tekrar deneme sayısı
+            headless (bool): İşçi tarayıcıları görünmez modda çalıştır
+            wait_timeout (float): Scraper bekleme üst sınırı
+            extraction_mode (str): Scraper kart okuma modu
+            progress_callback (function): (biten_iş, toplam_iş, toplam_kayıt) ile çağrılır
+            record_callback (function): Birleştirilen her yeni kayıt için çağrılır
+            lean (bool): İşçi tarayıcılarında hafif modu kullan
+            job_callback (function): Başarılı her iş birleştirildikten sonra (iş, kayıtlar) ile çağrılır;
+                add_job ile yeni iş ekleyebilir (örn. doygun karonun alt karoları)
+        """
+        self.jobs = []
+        for query, location, max_results in jobs:
+            self.add_job(query, location, max_results)
+        self.workers = workers or os.cpu_count() or 1
+        self.retries = retries
+        self.headless = headless
+        self.wait_timeout = wait_timeout
+        self.extraction_mode = extraction_mode
+        self.lean = lean
+        self.progress_callback = progress_callback
+        self.record_callback = record_callback
+        self.job_callback = job_callback
+        self.results = []  # Birleştirilmiş, tekrarsız kayıtlar
+        self._seen = set()
+        self.logger = logging.getLogger(__name__)
+
+    def add_job(self, query, location, max_results):
+        """
+        İş ekle; run() sürerken (job_callback içinden) eklenen iş ilk boşalan işçide başlar
+
+        Returns:
+            dict: Eklenen iş
+        """
+        job = {'id': len(self.jobs), 'query': query, 'location': location, 'max_results': max_results,
+               'status': PENDING, 'attempts': 0, 'records': 0, 'new_records': 0, 'error': '', 'seconds': 0.0}
+        self.jobs.append(job)
+        return job
+
+    def run(self):
+        """Tüm işleri çalıştır; birleştirilmiş kayıt listesini döndür"""
+        started = time.perf_counter()
+        # İş eklenebiliyorsa havuz baştaki iş sayısıyla sınırlanmaz (süreçler gerektikçe açılır)
+        with ProcessPoolExecutor(
+            max_workers=(self.workers if self.job_callback else min(self.workers, len(self.jobs))) or 1,
+            initializer=_init_worker,
+            initargs=(self.headless, self.wait_timeout, self.lean)
+        ) as executor:
+            futures = {self._submit(executor, job): job for job in self.jobs}
+            while futures:
+                future = next(as_completed(futures))
+                job = futures.pop(future)
+                job['seconds'] += time.perf_counter() - job.pop('_started')
+                try:
+                    records = future.result()
+                    self._merge(job, records)
+                    job['status'] = DONE
+                except Exception as e:
+                    job['error'] = str(e)
+                    if job['attempts'] <= self.retries:
+                        job['status'] = RETRYING
+                        self.logger.warning(f"İş tekrar deneniyor ({job['attempts']}/{self.retries}): "
+                                            f"{job['query']} {job['location']} - {e}")
+                        futures[self._submit(executor, job)] = job
+                        continue
+                    job['status'] = FAILED
+                    self.logger.error(f"İş başarısız: {job['query']} {job['location']} - {e}")
+                else:
+                    if self.job_callback:
+                        self.job_callback(job, records)
+                # job_callback'in eklediği işler
+                for pending in self.jobs:
+                    if pending['status'] == PENDING:
+                        futures[self._submit(executor, pending)] = pending
+                self._report_progress()
+
+        elapsed = time.perf_counter() - started
+        self.logger.info(f"Batch tamamlandı: {len(self.results)} tekil işletme, "
+                         f"{sum(job['status'] == DONE for job in self.jobs)}/{len(self.jobs)} iş, {elapsed:.1f} sn")
+        return self.results
+
+    def _submit(self, executor, job):
+        job['attempts'] += 1
+        job['status'] = RUNNING
+        job['_started'] = time.perf_counter()
+        # Tekrar denemeler önceki denemenin günlüğünden devam eder
+        return executor.submit(_run_job, job['query'], job['location'], job['max_results'],
+                               self.extraction_mode, job['attempts'] > 1, job['id'])
+
+    async def run_async(self, queue_size=100):
+        """
+        İşleri tek süreçte asyncio ile çalıştır (async_search.search_many_async)
+
+        Her iş kendi driver'ıyla bir thread'de yürür, en fazla `workers` tanesi
+        aynı anda. Kayıtlar iş bitmeden, geldikçe birleştirilir ve record_callback'e
+        verilir. Tekrar deneme yoktur; başarısız iş 'hata' olarak kalır.
+        """
+        from functools import partial
+
+        from async_search import search_many_async
+        from google_maps_scraper import GoogleMapsScraper
+
+        started = time.perf_counter()
+
+        def job_done(index, error, seconds):
+            job = self.jobs[index]
+            job['seconds'] += seconds
+            job['status'] = FAILED if error else DONE
+            job['error'] = str(error) if error else ''
+            self._report_progress()
+
+        for job in self.jobs:
+            job['attempts'] += 1
+            job['status'] = RUNNING
+            job['records'] = job['new_records'] = 0
+
+        factory = partial(GoogleMapsScraper, headless=self.headless, wait_timeout=self.wait_timeout, notify=False,
+                          lean=self.lean)
+        async for index, record in search_many_async(
+                [(job['query'], job['location'], job['max_results']) for job in self.jobs],
+                concurrency=self.workers, scraper_factory=factory, queue_size=queue_size, on_job_done=job_done,
+                extraction_mode=self.extraction_mode):
+            job = self.jobs[index]
+            job['records'] += 1
+            self._merge_record(job, record)
+
+        elapsed = time.perf_counter() - started
+        self.logger.info(f"Batch (asyncio) tamamlandı: {len(self.results)} tekil işletme, "
+                         f"{sum(job['status'] == DONE for job in self.jobs)}/{len(self.jobs)} iş, {elapsed:.1f} sn")
+        return self.results
+
+    def _merge(self, job, records):
+        """İşin kayıtlarını tekrarsız veri kümesine ekle"""
+        job['records'] = len(records)
+        job['new_records'] = 0
+        for record in records:
+            self._merge_record(job, record)
+
+    def _merge_record(self, job, record):
+        """Tek kaydı (daha önce görülmediyse) veri kümesine ekle"""
+        key = record_key(record)
+        if key in self._seen:
+            return
+        self._seen.add(key)
+        record['Arama'] = job['query']
+        record['Konum'] = job['location']
+        record['Sıra'] = len(self.results) + 1
+        self.results.append(record)
+        job['new_records'] += 1
+        if self.record_callback:
+            self.record_callback(record)
+
+    def _report_progress(self):
+        finished = sum(job['status'] in (DONE, FAILED) for job in self.jobs)
+        if self.progress_callback:
+            self.progress_callback(finished, len(self.jobs), len(self.results))
+        self.logger.info(f"Batch ilerleme: {finished}/{len(self.jobs)} iş, {len(self.results)} tekil işletme")
+
+    def status_report(self):
+        """İş bazında durum tablosunu metin olarak döndür"""
+        lines = [f"{'#':>3}  {'Durum':<17} {'Deneme':>6} {'Kayıt':>6} {'Yeni':>6} {'Süre':>7}  Arama"]
+        for job in self.jobs:
+            lines.append(
+                f"{job['id'] + 1:>3}  {job['status']:<17} {job['attempts']:>6} {job['records']:>6} "
+                f"{job['new_records']:>6} {job['seconds']:>6.1f}s  {job['query']} {job['location']}".rstrip()
+            )
+        return "\n".join(lines)
+
+    def save_to_excel(self, filename=None, **shard_options):
+        """
+        Birleştirilmiş sonuçları scraper'ın Excel biçimiyle kaydet
+
+        shard_options (shard_rows, group_by, shard_mode, workers) büyük veri
+        kümesini parçalı Excel'e bölmek için GoogleMapsScraper.save_to_excel'e geçer.
+        """
+        from google_maps_scraper import GoogleMapsScraper
+
+        scraper = GoogleMapsScraper(notify=False, selector_stats_path=False, result_store=False)
+        scraper.business_data = self.results
+        scraper.current_query = 'Batch'
+        return scraper.save_to_excel(filename, **shard_options)
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Büyük taramalar için kompakt işletme kaydı
+
+Kayıtlar önceden sözlük olarak tutuluyordu; yüz binlerce satırlık çoklu
+şehir işlerinde sözlük başına hash tablosu belleğin büyük kısmını
+kaplıyordu. BusinessRecord bilinen alanları __slots__ içinde tutar, seyrek
+ek alanlar (Saatler, Fiyat vb.) için küçük bir sözlük açılır. Sözlük API'si
+(rec['Ad'], rec.get, update, items, 'Telefon' in rec ...) aynen çalışır,
+böylece toplayıcılar, dışa aktarıcılar ve arayüz değişmeden kullanır.
+Sınırlarda sözlüğe / DataFrame'e çevrilir. Bellek ölçümü:
+    python business_record.py [kayıt sayısı ...]
+"""
+
+import sys
+from collections.abc import MutableMapping
+from operator import attrgetter
+
+import pandas as pd
+
+# (kayıt anahtarı, slot adı) - sıra, sözlüğe çevrilirken sütun sırasıdır
+FIELDS = (
+    ('Sıra', 'index'),
+    ('Yer ID', 'place_id'),
+    ('Ad', 'name'),
+    ('Adres', 'address'),
+    ('Telefon', 'phone'),
+    ('Puan/Yorum', 'rating_text'),
+    ('Kategori', 'category'),
+    ('Website', 'website'),
+    ('Harita Linki', 'map_url'),
+    ('Enlem', 'latitude'),
+    ('Boylam', 'longitude'),
+    ('Arama', 'query'),
+    ('Konum', 'location'),
+)
+_SLOT_OF = dict(FIELDS)
+# Az sayıda farklı değeri olan alanlar tek kopya tutulur
+_INTERNED_SLOTS = frozenset(['category', 'query', 'location'])
+
+
+class BusinessRecord(MutableMapping):
+    """Sözlük gibi davranan, __slots__ tabanlı işletme kaydı"""
+
+    __slots__ = tuple(slot for _, slot in FIELDS) + ('_extra',)
+
+    def __init__(self, values=None, **kwargs):
+        self._extra = None
+        if values:
+            for key, value in values.items():
+                self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    @classmethod
+    def from_dict(cls, values):
+        """Sözlükten kayıt (zaten BusinessRecord ise aynen döner); None/NaN değerler atlanır"""
+        if isinstance(values, cls):
+            return values
+        record = cls()
+        for key, value in values.items():
+            if value is not None and value == value:
+                record[key] = value
+        return record
+
+    def to_dict(self):
+        """Düz sözlük (JSON, pickle dışı dış API'ler için)"""
+        return dict(self.items())
+
+    def __getitem__(self, key):
+        slot = _SLOT_OF.get(key)
+        if slot is not None:
+            try:
+                return getattr(self, slot)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key, value):
+        slot = _SLOT_OF.get(key)
+        if slot is None:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+            return
+        if slot in _INTERNED_SLOTS and type(value) is str:
+            value = sys.intern(value)
+        setattr(self, slot, value)
+
+    def __delitem__(self, key):
+        slot = _SLOT_OF.get(key)
+        if slot is not None:
+            try:
+                delattr(self, slot)
+            except AttributeError:
+                raise KeyError(key) from None
+            return
+        if self._extra is None:
+            raise KeyError(key)
+        del self._extra[key]
+        if not self._extra:
+            self._extra = None
+
+    def __iter__(self):
+        for key, slot in FIELDS:
+            if hasattr(self, slot):
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _, slot in FIELDS if hasattr(self, slot)) + len(self._extra or ())
+
+    def __contains__(self, key):
+        slot = _SLOT_OF.get(key)
+        if slot is not None:
+            return hasattr(self, slot)
+        return self._extra is not None and key in self._extra
+
+    def get(self, key, default=None):
+        slot = _SLOT_OF.get(key)
+        if slot is not None:
+            return getattr(self, slot, default)
+        if self._extra is None:
+            return default
+        return self._extra.get(key, default)
+
+    def copy(self):
+        return BusinessRecord(self)
+
+    def __repr__(self):
+        return f"BusinessRecord({self.to_dict()!r})"
+
+
+def records_to_frame(records):
+    """BusinessRecord listesini sütun sütun DataFrame'e çevir (kayıt başına sözlük kurulmaz)"""
+    columns = {}
+    for key, slot in FIELDS:
+        try:
+            # Tüm kayıtlarda dolu alan: C seviyesinde hızlı yol
+            values = list(map(attrgetter(slot), records))
+        except AttributeError:
+            values = [getattr(record, slot, None) for record in records]
+        if any(value is not None for value in values):
+            columns[key] = values
+
+    extra_keys = {}
+    for record in records:
+        if record._extra:
+            extra_keys.update(dict.fromkeys(record._extra))
+    for key in extra_keys:
+        columns[key] = [record._extra.get(key) if record._extra else None for record in records]
+    return pd.DataFrame(columns, index=pd.RangeIndex(len(records)))
+
+
+def records_from_frame(df):
+    """DataFrame satırlarını BusinessRecord listesine çevir"""
+    return [BusinessRecord.from_dict(row) for row in df.to_dict('records')]
+
+
+class RecordCount:
+    """
+    Kayıt tutmayan business_data: yalnızca sayar
+
+    Akışla tüketilen aramalarda (keep_records=False) kayıtlar scraper'da
+    birikmez. len() sıra numarası, ilerleme ve hedef kontrolü için toplamı
+    verir; yineleme, dilimleme ve doğruluk değeri boş liste gibidir, böylece
+    dışa aktarıcılar "kaydedilecek veri yok" der.
+    """
+
+    __slots__ = ('count',)
+
+    def __init__(self, count=0):
+        self.count = count
+
+    def append(self, record):
+        self.count += 1
+
+    def __len__(self):
+        return self.count
+
+    def __bool__(self):
+        return False
+
+    def __iter__(self):
+        return iter(())
+
+    def __getitem__(self, index):
+        return [][index]
+
+
+def is_record_list(records):
+    """Liste tamamen BusinessRecord'lardan mı oluşuyor (hızlı DataFrame yolu için)"""
+    return isinstance(records, list) and bool(records) and all(type(record) is BusinessRecord for record in records)
+
+
+if __name__ == "__main__":
+    import gc
+    import time
+    import tracemalloc
+
+    categories = ['Restoran', 'Kafe', 'Berber', 'Eczane', 'Market', 'Kuaför', 'Otel', 'Oto Servisi']
+
+    def raw_values(i):
+        # Her kart ayrı okunur: değerler (kategori dahil) her kayıtta yeni string
+        return {
+            'Sıra': i + 1,
+            'Yer ID': f"ChIJ{i:024d}",
+            'Ad': f"İşletme {i}",
+            'Adres': f"Caferağa Mah. Moda Cd. No:{i % 400}, 34710 Kadıköy/İstanbul",
+            'Telefon': f"0216 {i % 1000:03d} {i // 1000 % 100:02d} {i % 97:02d}",
+            'Puan/Yorum': f"4,{i % 10}({i % 900})",
+            'Kategori': ''.join(categories[i % 8]),
+            'Harita Linki': f"https://www.google.com/maps/place/data=!19sChIJ{i:024d}",
+            **({'Website': f"isletme{i}.com"} if i % 3 == 0 else {}),
+        }
+
+    def measure(build, total):
+        gc.collect()
+        tracemalloc.start()
+        started = time.perf_counter()
+        records = [build(raw_values(i)) for i in range(total)]
+        elapsed = time.perf_counter() - started
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return records, size, elapsed
+
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    print(f"{'Kayıt':>10} {'dict (MB)':>10} {'Record (MB)':>12} {'Kazanç':>7} {'B/kayıt dict':>13} {'B/kayıt Record':>15}")
+    for total in sizes:
+        records, dict_size, _ = measure(dict, total)
+        del records
+        records, record_size, _ = measure(BusinessRecord.from_dict, total)
+
+        started = time.perf_counter()
+        df = records_to_frame(records)
+        frame_seconds = time.perf_counter() - started
+        del records, df
+
+        print(f"{total:>10,} {dict_size / 1048576:>10.1f} {record_size / 1048576:>12.1f} "
+              f"{(1 - record_size / dict_size) * 100:>6.0f}% {dict_size / total:>13.0f} {record_size / total:>15.0f}"
+              f"   (DataFrame'e çevirme: {frame_seconds:.2f} sn)")
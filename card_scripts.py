@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sayfa içinde çalıştırılan toplu kart okuma script'leri
+
+Her script tek bir execute_script çağrısıyla çalışır; böylece kart başına
+onlarca chromedriver isteği yerine tüm feed tek seferde okunur.
+Akış (stream) modunda feed'e bir MutationObserver kurulur; yeni kartlar
+göründükçe sayfa içi tampona yazılır, Python tamponu tek çağrıda boşaltır.
+"""
+
+from wait_conditions import FEED_ENDED_JS
+
+# Kart bulma ve kartı ham alanlarıyla seri hale getirme (toplu ve akış script'leri ortak kullanır)
+_CARD_SERIALIZER_JS = """
+function findCards(root) {
+    var cards = root.querySelectorAll('.Nv2PK');
+    if (!cards.length) {
+        cards = root.querySelectorAll("[data-result-index], [role='article']");
+    }
+    return cards;
+}
+
+function view(el) {
+    return {
+        t: (el.innerText || '').trim(),
+        a: el.getAttribute('aria-label') || '',
+        h: el.href || el.getAttribute('href') || ''
+    };
+}
+
+function serializeCard(card, i, fieldSelectors) {
+    var link = card.querySelector("a[href*='/maps/place/']");
+    var fields = {};
+    for (var field in fieldSelectors) {
+        fields[field] = {};
+        fieldSelectors[field].forEach(function (selector) {
+            try {
+                fields[field][selector] = Array.prototype.map.call(card.querySelectorAll(selector), view);
+            } catch (e) {
+                fields[field][selector] = [];
+            }
+        });
+    }
+    return {
+        index: i,
+        element: card,
+        href: link ? link.href : '',
+        data: Object.assign({}, card.dataset, link ? link.dataset : {}),
+        label: link ? (link.getAttribute('aria-label') || '') : '',
+        text: (card.innerText || '').trim(),
+        fields: fields
+    };
+}
+"""
+
+# Feed'deki kartları gezip ham alanları JSON dizisi olarak döndür.
+# arguments[0]: {alan_adı: [selector, ...]} sözlüğü
+# Dönüş: her kart için {index, element, href, data, label, text, fields: {alan: {selector: [eleman]}}}
+# (element: detay için tekrar arama yapmadan tıklanabilecek kart tutamacı)
+# arguments[1]: başlangıç indeksi (bu indeksten önceki kartlar atlanır)
+BULK_CARDS_SCRIPT = """
+var fieldSelectors = arguments[0] || {};
+var start = arguments[1] || 0;
+var root = document.querySelector("[role='feed']") || document;
+""" + _CARD_SERIALIZER_JS + """
+var cards = findCards(root);
+var out = [];
+for (var i = start; i < cards.length; i++) {
+    out.push(serializeCard(cards[i], i, fieldSelectors));
+}
+return out;
+"""
+
+# Akış modu: feed'e MutationObserver kur, mevcut kartları döndür.
+# arguments[0]: {alan_adı: [selector, ...]}, arguments[1]: başlangıç indeksi
+# Dönüş: BULK_CARDS_SCRIPT ile aynı biçimde kart listesi (feed yoksa null)
+# Yeni kartlar window.__mapminerStream.buffer'a eklenir; henüz içeriği dolmamış
+# (linksiz ve metinsiz) kart, dolana kadar sırada bekletilir.
+STREAM_INSTALL_SCRIPT = """
+var fieldSelectors = arguments[0] || {};
+var start = arguments[1] || 0;
+var feed = document.querySelector("[role='feed']");
+if (window.__mapminerStream) { window.__mapminerStream.observer.disconnect(); }
+window.__mapminerStream = null;
+if (!feed) { return null; }
+""" + _CARD_SERIALIZER_JS + FEED_ENDED_JS + """
+var state = {feed: feed, next: start, buffer: [], ended: false, waiters: []};
+
+state.collect = function () {
+    var cards = findCards(feed);
+    while (state.next < cards.length) {
+        var card = cards[state.next];
+        if (!card.querySelector("a[href*='/maps/place/']") && !(card.innerText || '').trim()) { break; }
+        state.buffer.push(serializeCard(card, state.next, fieldSelectors));
+        state.next++;
+    }
+    state.ended = feedEnded(feed);
+    if (state.buffer.length || state.ended) {
+        state.waiters.splice(0).forEach(function (notify) { notify(); });
+    }
+};
+
+state.observer = new MutationObserver(state.collect);
+state.observer.observe(feed, {childList: true, subtree: true, characterData: true});
+window.__mapminerStream = state;
+state.collect();
+return state.buffer.splice(0);
+"""
+
+# Akış tamponunu boşalt. Dönüş: {cards, ended}; gözlemci yoksa/feed yenilendiyse null
+STREAM_DRAIN_SCRIPT = """
+var state = window.__mapminerStream;
+if (!state || !state.feed.isConnected) { return null; }
+state.collect();
+return {cards: state.buffer.splice(0), ended: state.ended};
+"""
+
+# execute_async_script: feed'i sayfa içinden kaydır, yeni kart gelince (veya liste
+# bitince / süre dolunca) tamponu boşaltıp dön. arguments[0]: bekleme süresi (ms)
+# Dönüş: {cards, ended}; gözlemci yoksa null
+STREAM_NEXT_SCRIPT = """
+var done = arguments[arguments.length - 1];
+var timeout = arguments[0] || 0;
+var state = window.__mapminerStream;
+if (!state || !state.feed.isConnected) { done(null); return; }
+
+var finished = false;
+var timer = null;
+function finish() {
+    if (finished) { return; }
+    finished = true;
+    clearTimeout(timer);
+    done({cards: state.buffer.splice(0), ended: state.ended});
+}
+timer = setTimeout(finish, timeout);
+state.waiters.push(finish);
+
+state.feed.scrollTop = state.feed.scrollHeight;
+var panel = document.querySelector("[role='main']");
+if (panel) { panel.scrollTop = panel.scrollHeight; }
+if (state.buffer.length || state.ended) { finish(); }
+"""
+
+# Feed'in tamamını tek HTML metni olarak döndür (html modu süreç içinde ayrıştırır)
+FEED_HTML_SCRIPT = """
+var feed = document.querySelector("[role='feed']");
+return feed ? feed.outerHTML : '';
+"""
+
+# Feed'deki n. kartın tutamacını döndür (tüm listeyi Python'a taşımadan)
+# arguments[0]: kart indeksi
+CARD_BY_INDEX_SCRIPT = """
+var root = document.querySelector("[role='feed']") || document;
+var cards = root.querySelectorAll('.Nv2PK');
+if (!cards.length) {
+    cards = root.querySelectorAll('[data-result-index]');
+}
+return cards[arguments[0]] || null;
+"""
+
+# Açık detay panelinden telefon, adres ve ek alanları tek seferde oku
+# arguments[0]: beklenen işletme adı (panel bu ada göre seçilir, yoksa tüm sayfa)
+DETAIL_SCRIPT = """
+var name = arguments[0] || '';
+var pane = null;
+if (name && window.CSS && CSS.escape) {
+    pane = document.querySelector("[role='main'][aria-label=\\"" + CSS.escape(name) + "\\"]");
+}
+pane = pane || document;
+
+function labels(selector) {
+    return Array.prototype.map.call(pane.querySelectorAll(selector), function (el) {
+        return el.getAttribute('aria-label') || '';
+    });
+}
+function text(selector) {
+    var el = pane.querySelector(selector);
+    return el ? (el.innerText || '').trim() : '';
+}
+
+var heading = pane.querySelector('h1.DUwDvf') || pane.querySelector('h1');
+var website = pane.querySelector("a[data-item-id='authority']");
+return {
+    title: heading ? (heading.innerText || '').trim() : '',
+    phone_labels: labels("[data-item-id^='phone']"),
+    address_labels: labels("[data-item-id='address']"),
+    website: website ? (website.href || '') : '',
+    category: text("button[jsaction*='category']"),
+    url: window.location.href
+};
+"""
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parça parça (chunked) CSV / JSONL / Parquet dışa aktarıcılar
+
+Excel yavaş yazılır ve 1.048.576 satırla sınırlıdır; veri hatlarımız CSV
+veya Parquet ister. Kayıtlar (business_data ya da ResultStore) belirli
+sayıda satırlık parçalar halinde normalize edilip dosyaya eklenir; tüm veri
+kümesi hiçbir zaman tek DataFrame olarak bellekte tutulmaz. Her parça aynı
+sütunlar ve tiplerle yazılır: sabit EXPORT_COLUMNS, ardından kayıtlarda
+görülen diğer ek alanlar (ilk görülme sırasıyla). Parquet için pyarrow gerekir (kurulu değilse
+bu biçim kullanılamaz; kuruluysa CSV de pyarrow'un hızlı yazıcısıyla
+yazılır). Hız ölçümü:
+    python data_export.py [kayıt sayısı]
+"""
+
+import bz2
+import gzip
+import lzma
+import os
+from functools import partial
+
+import pandas as pd
+
+from normalize import PHONE_E164, RATING, REVIEW_COUNT, normalize_records
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet isteğe bağlı; CSV pandas ile yazılır
+    pa = pa_csv = pq = None
+
+EXPORT_FORMATS = ('xlsx', 'csv', 'jsonl', 'parquet')
+
+# Biçim başına sıkıştırma seçenekleri (ilki varsayılan, sıkıştırma verilmezse kullanılır)
+COMPRESSIONS = {
+    'csv': (None, 'gzip', 'bz2', 'xz'),
+    'jsonl': (None, 'gzip', 'bz2', 'xz'),
+    'parquet': ('snappy', 'zstd', 'gzip', 'none'),
+}
+# gzip varsayılan 9. seviye çok yavaş; 6 boyutta neredeyse aynı
+_TEXT_OPENERS = {None: open, 'gzip': partial(gzip.open, compresslevel=6), 'bz2': bz2.open, 'xz': lzma.open}
+_COMPRESSION_SUFFIXES = {'gzip': '.gz', 'bz2': '.bz2', 'xz': '.xz'}
+
+# Dışa aktarılan sütunlar - her parçada aynı sıra ve tip
+EXPORT_COLUMNS = [
+    'Sıra', 'Yer ID', 'Ad', 'Adres', 'Telefon', PHONE_E164, 'Puan/Yorum', RATING, REVIEW_COUNT,
+    'Kategori', 'Website', 'Açılış Saatleri', 'Durum', 'Fiyat Seviyesi', 'Harita Linki', 'Enlem', 'Boylam',
+    'Arama', 'Konum'
+]
+_INT_COLUMNS = frozenset(['Sıra', REVIEW_COUNT])
+_FLOAT_COLUMNS = frozenset([RATING, 'Enlem', 'Boylam'])
+
+DEFAULT_CHUNK_SIZE = 50_000
+
+
+def export_filename(filename, fmt, compression=None):
+    """Dosya adının uzantısını biçime (ve metin biçimlerinde sıkıştırmaya) göre düzelt"""
+    base = filename
+    for suffix in _COMPRESSION_SUFFIXES.values():
+        if base.endswith(suffix):
+            base = base[:-len(suffix)]
+    root, extension = os.path.splitext(base)
+    if extension.lstrip('.').lower() not in EXPORT_FORMATS:
+        root = base
+    suffix = _COMPRESSION_SUFFIXES.get(compression, '') if fmt in ('csv', 'jsonl') else ''
+    return f"{root}.{fmt}{suffix}"
+
+
+def format_of(filename):
+    """
+    Dosya adından (biçim, sıkıştırma) çıkar: 'a.csv.gz' -> ('csv', 'gzip')
+
+    Bilinmeyen uzantıda biçim None döner.
+    """
+    compression = None
+    base = filename.lower()
+    for name, suffix in _COMPRESSION_SUFFIXES.items():
+        if base.endswith(suffix):
+            compression, base = name, base[:-len(suffix)]
+    fmt = os.path.splitext(base)[1].lstrip('.')
+    return (fmt if fmt in EXPORT_FORMATS else None), compression
+
+
+def export_columns(records):
+    """EXPORT_COLUMNS + kayıtlarda görülen diğer alanlar (ilk görülme sırasıyla)"""
+    known = set(EXPORT_COLUMNS)
+    extra = {}
+    for record in records:
+        for key in record.keys():
+            if key not in known:
+                extra[key] = None
+    return EXPORT_COLUMNS + list(extra)
+
+
+def typed_chunk(df, columns=EXPORT_COLUMNS):
+    """Normalize edilmiş parçayı sabit sütun ve tiplere getir"""
+    df = df.reindex(columns=columns)
+    for column in columns:
+        if column in _INT_COLUMNS:
+            df[column] = pd.to_numeric(df[column], errors='coerce').astype('Int64')
+        elif column in _FLOAT_COLUMNS:
+            df[column] = pd.to_numeric(df[column], errors='coerce').astype('float64')
+        elif not (pd.api.types.is_object_dtype(df[column]) or pd.api.types.is_string_dtype(df[column])):
+            # Hiç dolu olmayan sütun float NaN gelir; metin sütunu olarak boş yazılır
+            df[column] = df[column].astype(object).where(df[column].notna(), None)
+    return df
+
+
+def record_chunks(records, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Kayıt listesini normalize edilmiş, tipli DataFrame parçalarına böl (ek alanlar dahil)"""
+    columns = export_columns(records)
+    for start in range(0, len(records), chunk_size):
+        yield typed_chunk(normalize_records(records[start:start + chunk_size]), columns)
+
+
+def stream_chunks(normalized_records, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Tek tek gelen normalize kayıtları (iter_businesses) tipli parçalara topla
+
+    Her parça dolar dolmaz verilir, son yarım parça akış bitince; bellekte
+    en fazla bir parça tutulur. Sütunlar akış başında bilinmediğinden
+    EXPORT_COLUMNS dışındaki ek alanlar yazılmaz:
+        export_chunks(stream_chunks(scraper.iter_businesses('kafe', 'Moda'), 500), 'kafe.csv', 'csv')
+    """
+    batch = []
+    for record in normalized_records:
+        batch.append(record)
+        if len(batch) >= chunk_size:
+            yield typed_chunk(pd.DataFrame(batch))
+            batch = []
+    if batch:
+        yield typed_chunk(pd.DataFrame(batch))
+
+
+def _write_text(chunks, path, compression, write_chunk):
+    if compression not in _TEXT_OPENERS:
+        raise ValueError(f"Geçersiz sıkıştırma: {compression}")
+    rows = 0
+    with _TEXT_OPENERS[compression](path, 'wt', encoding='utf-8', newline='') as f:
+        for i, chunk in enumerate(chunks):
+            write_chunk(chunk, f, i == 0)
+            rows += len(chunk)
+    return rows
+
+
+def write_csv(chunks, path, compression=None):
+    """Parçaları tek CSV dosyasına ekle (başlık bir kez); yazılan satır sayısını döndür"""
+    if pa is None:
+        return _write_text(chunks, path, compression,
+                           lambda chunk, f, first: chunk.to_csv(f, header=first, index=False))
+
+    # pyarrow'un CSV yazıcısı pandas'tan birkaç kat hızlı
+    if compression not in _TEXT_OPENERS:
+        raise ValueError(f"Geçersiz sıkıştırma: {compression}")
+    with _TEXT_OPENERS[compression](path, 'wb') as f:
+        return _write_arrow(chunks, lambda schema: pa_csv.CSVWriter(f, schema))
+
+
+def write_jsonl(chunks, path, compression=None):
+    """Parçaları satır başına bir JSON kaydı olarak yaz (boş alanlar null)"""
+    def write_chunk(chunk, f, first):
+        if len(chunk):
+            text = chunk.to_json(orient='records', lines=True, force_ascii=False)
+            f.write(text if text.endswith('\n') else text + '\n')
+    return _write_text(chunks, path, compression, write_chunk)
+
+
+def _arrow_schema(columns):
+    return pa.schema([
+        (column, pa.int64() if column in _INT_COLUMNS else pa.float64() if column in _FLOAT_COLUMNS else pa.string())
+        for column in columns
+    ])
+
+
+def _write_arrow(chunks, open_writer):
+    """Şema ilk parçanın sütunlarından kurulur (hiç parça yoksa EXPORT_COLUMNS); yazılan satır sayısını döndür"""
+    writer = schema = None
+    rows = 0
+    try:
+        for chunk in chunks:
+            if writer is None:
+                schema = _arrow_schema(list(chunk.columns))
+                writer = open_writer(schema)
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            rows += len(chunk)
+        if writer is None:
+            writer = open_writer(_arrow_schema(EXPORT_COLUMNS))
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def write_parquet(chunks, path, compression='snappy'):
+    """Her parçayı ayrı row group olarak Parquet dosyasına yaz (pyarrow gerekir)"""
+    if pa is None:
+        raise RuntimeError("Parquet için pyarrow kurulu değil (pip install pyarrow)")
+    return _write_arrow(chunks, lambda schema: pq.ParquetWriter(path, schema, compression=compression or 'none'))
+
+
+def export_chunks(chunks, path, fmt, compression=None):
+    """
+    Parçaları seçilen biçimde yaz
+
+    Args:
+        chunks (iterable): typed_chunk ile hazırlanmış DataFrame parçaları
+        path (str): Hedef dosya
+        fmt (str): 'csv', 'jsonl' veya 'parquet'
+        compression (str): Biçime göre COMPRESSIONS'daki seçeneklerden biri (None: biçimin varsayılanı)
+
+    Returns:
+        int: Yazılan satır sayısı
+    """
+    if fmt not in COMPRESSIONS:
+        raise ValueError(f"Geçersiz biçim: {fmt} (seçenekler: {', '.join(COMPRESSIONS)})")
+    if compression is None:
+        compression = COMPRESSIONS[fmt][0]
+    if compression not in COMPRESSIONS[fmt]:
+        raise ValueError(f"{fmt} için geçersiz sıkıştırma: {compression}")
+    if fmt == 'csv':
+        return write_csv(chunks, path, compression)
+    if fmt == 'jsonl':
+        return write_jsonl(chunks, path, compression)
+    return write_parquet(chunks, path, compression)
+
+
+if __name__ == "__main__":
+    import sys
+    import tempfile
+    import time
+
+    from business_record import BusinessRecord
+
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    records = [
+        BusinessRecord({
+            'Sıra': i + 1,
+            'Yer ID': f"ChIJ{i:024d}",
+            'Ad': f"İşletme {i}",
+            'Adres': f"Caferağa Mah. Moda Cd. No:{i % 400}, 34710 Kadıköy/İstanbul",
+            'Telefon': f"0216 {i % 1000:03d} {i // 1000 % 100:02d} {i % 97:02d}",
+            'Puan/Yorum': f"4,{i % 10}({i % 900})",
+            'Kategori': 'Kafe',
+        })
+        for i in range(total)
+    ]
+
+    directory = tempfile.mkdtemp()
+    for fmt in ('csv', 'jsonl', 'parquet'):
+        for compression in COMPRESSIONS[fmt][:2]:
+            if fmt == 'parquet' and pa is None:
+                print("parquet: pyarrow kurulu değil, atlandı")
+                break
+            path = export_filename(os.path.join(directory, 'kayitlar'), fmt, compression)
+            started = time.perf_counter()
+            rows = export_chunks(record_chunks(records), path, fmt, compression)
+            elapsed = time.perf_counter() - started
+            print(f"{os.path.basename(path):<18} {compression or 'yok':<7} {rows:,} satır: {elapsed:5.2f} sn "
+                  f"({os.path.getsize(path) / 1048576:.1f} MB)")
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Taramalar arası tekrar (dedup) indeksi
+
+"restoran İstanbul", "restoran Kadıköy", "kafe Kadıköy" gibi aramalar büyük
+ölçüde aynı işletmeleri döndürür. Her işletme şu anahtarlarla tanınır
+(öncelik sırasıyla):
+    id:<place id>
+    tel:<E.164 telefon>
+    na:<normalize edilmiş ad + adres özeti>
+Aynı taramada tekrar eden kayıt atlanır; önceki bir taramada detayları
+okunmuş (telefonu bilinen) işletmenin detayları indeksten kopyalanır ve
+pahalı detay tıklaması yapılmaz. İndeks ~/.mapminer/dedup.db dosyasında kalıcıdır.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+from datetime import datetime
+
+from app_paths import app_data_path
+from normalize import phone_to_e164
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS dedup_keys (
+    key TEXT PRIMARY KEY,
+    place_id TEXT,
+    record TEXT NOT NULL,
+    seen_at TEXT
+);
+"""
+
+# check() sonuçları
+DUPLICATE = 'tekrar'   # Bu taramada zaten toplandı - atla
+KNOWN = 'biliniyor'    # Önceki taramadan detaylarıyla biliniyor - detay okuma
+
+# Detay panelinden okunan alanlar (bilinen kayıttan kopyalanır)
+DETAIL_FIELDS = ('Telefon', 'Adres', 'Website', 'Kategori')
+
+_ADDRESS_PREFIX_RE = re.compile(r'^\s*Adres:\s*', re.IGNORECASE)
+_NON_WORD_RE = re.compile(r'[\W_]+')
+
+
+def _normalize_text(text):
+    text = (text or '').replace('İ', 'i').replace('I', 'ı').lower()
+    return _NON_WORD_RE.sub(' ', text).strip()
+
+
+def record_keys(record):
+    """Kaydın dedup anahtarları, güçlüden zayıfa"""
+    keys = []
+    place_id = record.get('Yer ID')
+    if place_id:
+        keys.append(f"id:{place_id}")
+    phone = phone_to_e164(record.get('Telefon'))
+    if phone:
+        keys.append(f"tel:{phone}")
+    name = _normalize_text(record.get('Ad'))
+    address = _normalize_text(_ADDRESS_PREFIX_RE.sub('', record.get('Adres') or ''))
+    if name and address:
+        keys.append('na:' + hashlib.sha1(f"{name}|{address}".encode('utf-8')).hexdigest()[:20])
+    return keys
+
+
+def has_details(record):
+    """
+    Kayıt detay paneli okunmuş sayılır mı
+
+    Adres liste kartından da gelebilir; yalnızca telefonu olan kayıt bilinir
+    sayılır, telefonsuz kayıt sonraki taramalarda yeniden zenginleştirilir.
+    """
+    return bool(record.get('Telefon'))
+
+
+def _same_place(place_id, other_place_id):
+    """İki kimlik de varsa ve farklıysa (örn. ortak çağrı merkezi numarası) aynı işletme sayılmaz"""
+    return not (place_id and other_place_id and place_id != other_place_id)
+
+
+class DedupIndex:
+    def __init__(self, path=None, batch_size=100):
+        """
+        Args:
+            path (str): İndeks dosyası (varsayılan: ~/.mapminer/dedup.db)
+            batch_size (int): Bu kadar kayıt birikince tek işlemde yazılır
+        """
+        self.path = path or app_data_path('dedup.db')
+        self.batch_size = batch_size
+        self._session = {}  # Bu taramada görülen anahtar -> place id
+        self._pending = {}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+        self.connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        # Batch işçileri aynı dosyaya yazar
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+
+    def new_session(self):
+        """Yeni tarama: bu oturumda görülenleri unut (kalıcı indeks korunur)"""
+        with self._lock:
+            self._session = {}
+
+    def check(self, record):
+        """
+        Kaydın daha önce görülüp görülmediğini kontrol et
+
+        Returns:
+            tuple: (DUPLICATE, None) bu taramada zaten var,
+                (KNOWN, kayıt) önceki taramadan detaylarıyla biliniyor,
+                (None, None) yeni işletme
+        """
+        keys = record_keys(record)
+        if not keys:
+            return None, None
+        place_id = record.get('Yer ID') or ''
+
+        with self._lock:
+            for key in keys:
+                if key in self._session and _same_place(place_id, self._session[key]):
+                    return DUPLICATE, None
+
+            try:
+                rows = dict(
+                    (key, (owner, stored)) for key, owner, stored in self.connection.execute(
+                        f"SELECT key, place_id, record FROM dedup_keys WHERE key IN ({', '.join('?' * len(keys))})",
+                        keys
+                    )
+                )
+            except sqlite3.Error as e:
+                self.logger.warning(f"Dedup indeksi okunamadı: {e}")
+                return None, None
+
+        for key in keys:
+            if key in rows and _same_place(place_id, rows[key][0]):
+                stored = json.loads(rows[key][1])
+                if has_details(stored):
+                    return KNOWN, stored
+        return None, None
+
+    def remember(self, record):
+        """Kaydı bu taramada görülmüş say ve kalıcı indekse ekle/güncelle"""
+        keys = record_keys(record)
+        if not keys:
+            return
+        place_id = record.get('Yer ID') or ''
+        stored = json.dumps({key: value for key, value in record.items() if key != 'Sıra'},
+                            ensure_ascii=False, default=str)
+        now = datetime.now().isoformat(timespec='seconds')
+
+        with self._lock:
+            for key in keys:
+                self._session.setdefault(key, place_id)
+                self._pending[key] = (key, place_id, stored, now)
+            due = len(self._pending) >= self.batch_size
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Bekleyen anahtarları tek işlemde yaz"""
+        with self._lock:
+            rows, self._pending = list(self._pending.values()), {}
+            if not rows:
+                return
+            try:
+                with self.connection:
+                    self.connection.executemany(
+                        "INSERT OR REPLACE INTO dedup_keys (key, place_id, record, seen_at) VALUES (?, ?, ?, ?)",
+                        rows
+                    )
+            except sqlite3.Error as e:
+                self.logger.warning(f"Dedup indeksi yazılamadı: {e}")
+
+    def close(self):
+        self.flush()
+        self.connection.close()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Paralel detay zenginleştirme
+
+Liste taramasında toplanan işletme linkleri, her biri kendi headless
+driver'ına sahip bir işçi havuzunda açılır; telefon/adres gibi detaylar
+place id ile kayıtlara geri yazılır.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class DetailEnricher:
+    def __init__(self, scraper_factory, pool_size=3):
+        """
+        Args:
+            scraper_factory (function): Driver'ı henüz açılmamış yeni bir GoogleMapsScraper döndürür
+            pool_size (int): Aynı anda çalışan driver sayısı
+        """
+        self.scraper_factory = scraper_factory
+        self.pool_size = max(1, int(pool_size))
+        self.records_per_minute = 0.0
+        self.logger = logging.getLogger(__name__)
+
+    def enrich(self, records):
+        """
+        Kayıtları 'Harita Linki' üzerinden paralel olarak zenginleştir
+
+        Args:
+            records (list): 'Yer ID' ve 'Harita Linki' anahtarları olan işletme sözlükleri
+
+        Returns:
+            int: Detayı başarıyla okunan kayıt sayısı
+        """
+        jobs = queue.Queue()
+        for record in records:
+            if record.get('Yer ID') and record.get('Harita Linki'):
+                jobs.put((record['Yer ID'], record['Harita Linki'], record.get('Ad', '')))
+
+        total = jobs.qsize()
+        if not total:
+            return 0
+
+        results = {}
+        results_lock = threading.Lock()
+        workers = min(self.pool_size, total)
+        started = time.perf_counter()
+        self.logger.info(f"Detay zenginleştirme başlıyor: {total} işletme, {workers} paralel driver")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for _ in range(workers):
+                executor.submit(self._worker, jobs, results, results_lock)
+
+        # Detayları place id ile kayıtlara geri yaz
+        for record in records:
+            detail = results.get(record.get('Yer ID'))
+            if detail:
+                record.update(detail)
+
+        elapsed = time.perf_counter() - started
+        self.records_per_minute = len(results) / elapsed * 60 if elapsed > 0 else 0.0
+        self.logger.info(f"Detay zenginleştirme tamamlandı: {len(results)}/{total} işletme, "
+                         f"{self.records_per_minute:.1f} kayıt/dakika")
+        return len(results)
+
+    def _worker(self, jobs, results, results_lock):
+        """Kendi driver'ıyla kuyruk boşalana kadar detay sayfalarını oku"""
+        scraper = self.scraper_factory()
+        if not scraper.setup_driver():
+            self.logger.error("Detay işçisi için driver açılamadı")
+            return
+        try:
+            while True:
+                try:
+                    place_id, url, name = jobs.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    detail = scraper.fetch_place_details(url, name)
+                    if detail:
+                        with results_lock:
+                            results[place_id] = detail
+                except Exception as e:
+                    self.logger.warning(f"Detay okunamadı ({name}): {e}")
+        finally:
+            scraper.close()
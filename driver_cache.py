@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ChromeDriver yolu önbelleği
+
+ChromeDriverManager().install() her açılışta sürüm tespiti yapar ve ağa
+çıkabilir. Çözümlenen driver yolu eşleştiği Chrome sürümüyle birlikte
+diske yazılır; yerel Chrome sürümü değişmedikçe ağa çıkmadan yeniden
+kullanılır. İnternetsiz makineler için driver yolu elle verilebilir
+(parametre veya MAPMINER_CHROMEDRIVER ortam değişkeni).
+"""
+
+import json
+import logging
+import os
+
+from app_paths import app_data_path
+
+CACHE_VERSION = 1
+DRIVER_PATH_ENV = 'MAPMINER_CHROMEDRIVER'
+
+logger = logging.getLogger(__name__)
+
+
+def local_chrome_version():
+    """Kurulu Chrome sürümünü ağa çıkmadan oku (bulunamazsa None)"""
+    try:
+        from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+        return OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception as e:
+        logger.warning(f"Chrome sürümü okunamadı: {e}")
+        return None
+
+
+def _major(version):
+    return str(version).split('.')[0] if version else None
+
+
+def _load_cache(cache_path):
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if data.get('version') == CACHE_VERSION else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache_path, driver_path, chrome_version):
+    try:
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'driver_path': driver_path, 'chrome_version': chrome_version},
+                      f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Driver önbelleği kaydedilemedi: {e}")
+
+
+def resolve_driver_path(explicit_path=None, cache_path=None):
+    """
+    Kullanılacak chromedriver yolunu döndür
+
+    Sıra: elle verilen yol -> önbellek (Chrome ana sürümü eşleşiyorsa)
+    -> ChromeDriverManager. İndirme başarısız olursa eski önbellek
+    kaydı son çare olarak kullanılır.
+
+    Args:
+        explicit_path (str): Elle verilen chromedriver yolu
+        cache_path (str): Önbellek dosyası (varsayılan: ~/.mapminer/driver_cache.json)
+
+    Returns:
+        tuple: (driver_yolu, kaynak) - kaynak 'explicit', 'cache', 'download' veya 'stale-cache'
+    """
+    explicit_path = explicit_path or os.environ.get(DRIVER_PATH_ENV)
+    if explicit_path:
+        if not os.path.isfile(explicit_path):
+            raise FileNotFoundError(f"Chromedriver bulunamadı: {explicit_path}")
+        return explicit_path, 'explicit'
+
+    cache_path = cache_path or app_data_path('driver_cache.json')
+    cached = _load_cache(cache_path)
+    cached_path = cached.get('driver_path')
+    cached_usable = bool(cached_path) and os.path.isfile(cached_path)
+
+    chrome_version = local_chrome_version()
+    if cached_usable and chrome_version and _major(cached.get('chrome_version')) == _major(chrome_version):
+        return cached_path, 'cache'
+
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+        driver_path = ChromeDriverManager().install()
+    except Exception as e:
+        if cached_usable:
+            logger.warning(f"Driver indirilemedi, önbellekteki sürüm kullanılıyor: {e}")
+            return cached_path, 'stale-cache'
+        raise
+
+    _save_cache(cache_path, driver_path, chrome_version)
+    return driver_path, 'download'
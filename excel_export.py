@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Akışlı (write-only) renkli Excel yazıcı
+
+Eski yol önce pandas ile yazıp başlık için tüm hücreleri kaydırıyor, sonra
+her hücreye ayrı ayrı yeni PatternFill/Font/Border atıyordu; 50 bin satırda
+dakikalar sürüyordu. Burada:
+    - Stiller kitaba bir kez NamedStyle olarak kaydedilir, hücreler sadece
+      stil adını taşır (sütun başına tek hücre nesnesi yeniden kullanılır)
+    - Başlık satırı en başta yazılır, satır eklenip kaydırılmaz
+    - Zebra satır renkleri ve puan renkleri aralık bazlı koşullu biçimdir
+    - Satır yüksekliği sayfa varsayılanı olarak bir kez verilir
+    - openpyxl write-only modu satırları doğrudan diske akıtır
+Görünüm eski çıktıyla aynıdır. Hız ölçümü:
+    python excel_export.py [satır sayısı ...]
+"""
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.formatting.rule import CellIsRule, FormulaRule
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import get_column_letter
+
+SHEET_NAME = 'İşletme Verileri'
+
+# Dışa aktarılan sütunlar ve genişlikleri
+EXCEL_COLUMNS = ['Sıra', 'Ad', 'Adres', 'Telefon', 'Puan/Yorum']
+COLUMN_WIDTHS = {'Sıra': 8, 'Ad': 45, 'Adres': 60, 'Telefon': 25, 'Puan/Yorum': 18}
+CENTERED_COLUMNS = frozenset(['Sıra', 'Puan/Yorum'])
+ROW_HEIGHT = 25
+
+# Renk paleti
+COLORS = {
+    'header_bg': '2E86AB',      # Mavi
+    'header_text': 'FFFFFF',    # Beyaz
+    'title_bg': 'F8F9FA',       # Başlık satırı zemini
+    'row_light': 'F8F9FA',      # Açık gri
+    'row_dark': 'E9ECEF',       # Koyu gri
+    'border': 'DEE2E6',         # Kenarlık
+    'high_rating': '28A745',    # Yeşil (yüksek puan)
+    'medium_rating': 'FFC107',  # Sarı (orta puan)
+    'low_rating': 'DC3545',     # Kırmızı (düşük puan)
+    'accent': '6F42C1'          # Mor (vurgu)
+}
+
+
+def _fill(color):
+    return PatternFill(start_color=color, end_color=color, fill_type='solid')
+
+
+def _named_styles():
+    """Kitapta bir kez tanımlanan hücre stilleri"""
+    side = Side(style='thin', color=COLORS['border'])
+    border = Border(left=side, right=side, top=side, bottom=side)
+    center = Alignment(horizontal='center', vertical='center')
+
+    return [
+        NamedStyle(name='mm_title', font=Font(name='Calibri', size=16, bold=True, color=COLORS['accent']),
+                   fill=_fill(COLORS['title_bg']), border=border, alignment=center),
+        NamedStyle(name='mm_header', font=Font(name='Calibri', size=12, bold=True, color=COLORS['header_text']),
+                   fill=_fill(COLORS['header_bg']), border=border, alignment=center),
+        NamedStyle(name='mm_cell_left', font=Font(name='Calibri', size=11), border=border,
+                   alignment=Alignment(horizontal='left', vertical='center')),
+        NamedStyle(name='mm_cell_center', font=Font(name='Calibri', size=11), border=border, alignment=center),
+    ]
+
+
+def excel_frame(df, rating_column=None):
+    """
+    Normalize edilmiş DataFrame'den Excel'e yazılacak sütunları seç
+
+    Args:
+        df (DataFrame): normalize_records çıktısı
+        rating_column (str): Sayısal puan sütunu; varsa Puan/Yorum'a sayı yazılır
+            (puanı çözülemeyen metin olduğu gibi kalır)
+    """
+    df = df.copy()
+    if rating_column and rating_column in df.columns and 'Puan/Yorum' in df.columns:
+        df['Puan/Yorum'] = df[rating_column].astype(object).where(df[rating_column].notna(), df['Puan/Yorum'])
+    return df[[column for column in EXCEL_COLUMNS if column in df.columns]]
+
+
+def new_workbook():
+    """Stilleri kayıtlı, boş write-only kitap"""
+    workbook = Workbook(write_only=True)
+    for style in _named_styles():
+        workbook.add_named_style(style)
+    return workbook
+
+
+def write_styled_excel(df, filename, sheet_name=SHEET_NAME, title=None):
+    """
+    DataFrame'i renkli tablo olarak akışlı yaz
+
+    Args:
+        df (DataFrame): Yazılacak sütunlar (bkz. excel_frame)
+        filename (str): .xlsx dosyası
+        sheet_name (str): Sayfa adı
+        title (str): 1. satırdaki başlık (varsayılan: işletme sayısıyla)
+
+    Returns:
+        int: Yazılan veri satırı sayısı
+    """
+    workbook = new_workbook()
+    add_styled_sheet(workbook, df, sheet_name, title)
+    workbook.save(filename)
+    return len(df)
+
+
+def add_styled_sheet(workbook, df, sheet_name=SHEET_NAME, title=None, column_widths=None):
+    """new_workbook() kitabına renkli veri sayfası ekle (sayfa satırları hemen diske akar)"""
+    sheet = workbook.create_sheet(sheet_name)
+
+    columns = list(df.columns)
+    width = max(1, len(columns))
+    last_column = get_column_letter(width)
+    total_rows = len(df) + 2  # +1 başlık (title) +1 sütun başlıkları
+
+    # Sütun genişlikleri ve satır yüksekliği satırlardan önce verilmeli
+    widths = {**COLUMN_WIDTHS, **(column_widths or {})}
+    for i, column in enumerate(columns, 1):
+        if column in widths:
+            sheet.column_dimensions[get_column_letter(i)].width = widths[column]
+    sheet.sheet_format.defaultRowHeight = ROW_HEIGHT
+    sheet.sheet_format.customHeight = True
+
+    def styled(value, style):
+        cell = WriteOnlyCell(sheet, value)
+        cell.style = style
+        return cell
+
+    # 1. satır: birleştirilmiş başlık
+    sheet.append([styled(title or f"🗺️ GOOGLE MAPS İŞLETME VERİLERİ - {len(df)} İşletme", 'mm_title')]
+                 + [styled(None, 'mm_title') for _ in range(width - 1)])
+    sheet.merged_cells.add(f'A1:{last_column}1')
+
+    # 2. satır: sütun başlıkları
+    sheet.append([styled(column, 'mm_header') for column in columns])
+
+    # Veri satırları - sütun başına tek hücre nesnesi, satır yazılır yazılmaz diske gider
+    row_cells = [styled(None, 'mm_cell_center' if column in CENTERED_COLUMNS else 'mm_cell_left')
+                 for column in columns]
+    values = df.astype(object).where(df.notna(), None)
+    for row in values.itertuples(index=False, name=None):
+        for cell, value in zip(row_cells, row):
+            cell.value = value
+        sheet.append(row_cells)
+
+    # Koşullu biçimler: önce eklenen kural önceliklidir (puan renkleri zebra rengini ezer)
+    if len(df):
+        if 'Puan/Yorum' in columns:
+            letter = get_column_letter(columns.index('Puan/Yorum') + 1)
+            rating_range = f'{letter}3:{letter}{total_rows}'
+            # Yüksek puan (4.5+) - Yeşil
+            sheet.conditional_formatting.add(rating_range, CellIsRule(
+                operator='greaterThan', formula=['4.4'], fill=_fill(COLORS['high_rating']),
+                font=Font(color='FFFFFF', bold=True)
+            ))
+            # Orta puan (3.5-4.4) - Sarı
+            sheet.conditional_formatting.add(rating_range, CellIsRule(
+                operator='between', formula=['3.4', '4.4'], fill=_fill(COLORS['medium_rating']),
+                font=Font(color='000000', bold=True)
+            ))
+            # Düşük puan (<3.5) - Kırmızı
+            sheet.conditional_formatting.add(rating_range, CellIsRule(
+                operator='lessThan', formula=['3.5'], fill=_fill(COLORS['low_rating']),
+                font=Font(color='FFFFFF', bold=True)
+            ))
+
+        # Zebra satırlar (çift satırlar açık, tek satırlar koyu gri)
+        data_range = f'A3:{last_column}{total_rows}'
+        sheet.conditional_formatting.add(data_range, FormulaRule(formula=['MOD(ROW(),2)=0'],
+                                                                 fill=_fill(COLORS['row_light'])))
+        sheet.conditional_formatting.add(data_range, FormulaRule(formula=['MOD(ROW(),2)=1'],
+                                                                 fill=_fill(COLORS['row_dark'])))
+    return sheet
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    import tempfile
+    import time
+
+    import pandas as pd
+
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000]
+    directory = tempfile.mkdtemp()
+    for total in sizes:
+        df = pd.DataFrame({
+            'Sıra': range(1, total + 1),
+            'Ad': [f"İşletme {i}" for i in range(total)],
+            'Adres': [f"Caferağa Mah. Moda Cd. No:{i % 400}, 34710 Kadıköy/İstanbul" for i in range(total)],
+            'Telefon': [f"0216 {i % 1000:03d} {i // 1000 % 100:02d} {i % 97:02d}" for i in range(total)],
+            'Puan/Yorum': [round(1 + (i % 41) / 10, 1) for i in range(total)],
+        })
+        path = os.path.join(directory, f"akisli_{total}.xlsx")
+        started = time.perf_counter()
+        write_styled_excel(df, path)
+        elapsed = time.perf_counter() - started
+        print(f"{total:>8,} satır: {elapsed:6.2f} sn ({total / elapsed:,.0f} satır/sn, "
+              f"{os.path.getsize(path) / 1048576:.1f} MB)")
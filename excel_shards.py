@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Çok büyük veri kümeleri için parçalı (sayfa / dosya) Excel dışa aktarımı
+
+Excel sayfası 1.048.576 satırla sınırlıdır ve yüz binlerce satırlık tek
+dosya rahat açılmaz. Veri kümesi bir satır bütçesine veya bir gruplama
+sütununa (İlçe, Şehir, Kategori ...) göre parçalanır:
+    mode='files'   Her parça ayrı .xlsx; parçalar işçi süreçlerde paralel
+                   yazılır, asıl dosya parçalara bağlantı veren dizindir
+    mode='sheets'  Tek dosya: ilk sayfa dizin, her parça ayrı sayfa
+Dizin sayfasında her parçanın işletme sayısı, telefonlu kayıt sayısı ve
+puan özeti (ortalama, en düşük, en yüksek, 4.5+) bulunur. Hız ölçümü:
+    python excel_shards.py [satır sayısı] [parça satırı]
+"""
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from excel_export import add_styled_sheet, excel_frame, new_workbook, write_styled_excel
+from normalize import RATING
+from result_store import split_city_district_column
+
+# Başlık ve sütun başlığı satırları düşülmüş sayfa kapasitesi
+EXCEL_MAX_ROWS = 1_048_576 - 2
+SHARD_MODES = ('files', 'sheets')
+INDEX_SHEET = 'Dizin'
+
+_INDEX_WIDTHS = {'Parça': 30, 'Bağlantı': 34, 'İşletme': 12, 'Telefonlu': 12, 'Ort. Puan': 12,
+                 'En Düşük': 12, 'En Yüksek': 12, '4.5+ Puanlı': 13}
+_INVALID_SHEET_CHARS = re.compile(r'[\[\]:*?/\\]')
+
+
+def group_values(df, group_by):
+    """Gruplama sütununun değerleri; İlçe/Şehir yoksa adresten çıkarılır, boşlar 'Diğer' olur"""
+    if group_by in df.columns:
+        values = df[group_by].astype(object)
+    elif group_by in ('İlçe', 'Şehir') and 'Adres' in df.columns:
+        district, city = split_city_district_column(df['Adres'].fillna('').astype(str))
+        values = district if group_by == 'İlçe' else city
+    else:
+        raise ValueError(f"Gruplama sütunu bulunamadı: {group_by}")
+    values = values.where(values.notna(), '').astype(str).str.strip()
+    return values.where(values != '', 'Diğer')
+
+
+def plan_shards(df, rows_per_shard=None, group_by=None):
+    """
+    Veri kümesini parçalara ayır
+
+    Args:
+        df (DataFrame): Normalize edilmiş kayıtlar
+        rows_per_shard (int): Parça başına en fazla satır (Excel sınırını aşamaz)
+        group_by (str): Gruplama sütunu; bütçeyi aşan grup ayrıca bölünür
+
+    Returns:
+        list: (etiket, DataFrame) demetleri
+    """
+    budget = min(rows_per_shard or EXCEL_MAX_ROWS, EXCEL_MAX_ROWS)
+    if group_by:
+        groups = list(df.groupby(group_values(df, group_by), sort=True))
+    else:
+        groups = [('', df)]
+
+    shards = []
+    for label, part in groups:
+        starts = range(0, len(part), budget)
+        for number, start in enumerate(starts, 1):
+            piece = part.iloc[start:start + budget]
+            if not label:
+                piece_label = f"{start + 1}-{start + len(piece)}"
+            elif len(starts) > 1:
+                piece_label = f"{label} ({number})"
+            else:
+                piece_label = str(label)
+            shards.append((piece_label, piece))
+    return shards
+
+
+def shard_summary(label, df, rating_column=RATING):
+    """Dizin satırı: işletme sayısı, telefonlu kayıt ve puan özeti"""
+    ratings = df[rating_column] if rating_column in df.columns else pd.Series(dtype=float)
+    phones = df['Telefon'].fillna('').astype(str) if 'Telefon' in df.columns else pd.Series(dtype=str)
+
+    def rounded(value):
+        return None if pd.isna(value) else round(float(value), 2)
+
+    return {
+        'Parça': label,
+        'İşletme': len(df),
+        'Telefonlu': int((phones != '').sum()),
+        'Ort. Puan': rounded(ratings.mean()),
+        'En Düşük': rounded(ratings.min()),
+        'En Yüksek': rounded(ratings.max()),
+        '4.5+ Puanlı': int((ratings >= 4.5).sum()),
+    }
+
+
+def _sheet_names(labels):
+    """Excel'e uygun (31 karakter, yasak karakter yok), tekil sayfa adları"""
+    used = {INDEX_SHEET.lower()}
+    names = []
+    for label in labels:
+        base = _INVALID_SHEET_CHARS.sub('-', label).strip("' ")[:31] or 'Parça'
+        name, counter = base, 2
+        while name.lower() in used:
+            suffix = f" ~{counter}"
+            name, counter = base[:31 - len(suffix)] + suffix, counter + 1
+        used.add(name.lower())
+        names.append(name)
+    return names
+
+
+def _shard_filename(filename, number, label):
+    root = os.path.splitext(filename)[0]
+    slug = re.sub(r'[^\w]+', '_', label.replace('İ', 'i').lower()).strip('_') or 'parca'
+    return f"{root}_{number:03d}_{slug}.xlsx"
+
+
+def _shard_title(label, df):
+    return f"🗺️ GOOGLE MAPS İŞLETME VERİLERİ - {label} - {len(df)} İşletme"
+
+
+def _write_shard(df, path, title):
+    """İşçi süreç: tek parçayı ayrı dosyaya yaz"""
+    return write_styled_excel(df, path, title=title)
+
+
+def _index_frame(summaries, links):
+    rows = []
+    for summary, (target, text) in zip(summaries, links):
+        target = target.replace('"', '""')
+        rows.append({'Parça': summary['Parça'], 'Bağlantı': f'=HYPERLINK("{target}","{text}")',
+                     **{key: value for key, value in summary.items() if key != 'Parça'}})
+    return pd.DataFrame(rows, columns=list(_INDEX_WIDTHS))
+
+
+def export_sharded(df, filename, rows_per_shard=None, group_by=None, mode='files', workers=None,
+                   rating_column=RATING):
+    """
+    Normalize edilmiş kayıtları parçalı Excel olarak yaz
+
+    Args:
+        df (DataFrame): normalize_records çıktısı
+        filename (str): Dizin dosyası (.xlsx); 'files' modunda parçalar yanına yazılır
+        rows_per_shard (int): Parça başına satır bütçesi
+        group_by (str): Gruplama sütunu ('İlçe', 'Şehir', 'Kategori' ...)
+        mode (str): 'files' (ayrı dosyalar, paralel) veya 'sheets' (tek dosya, çok sayfa)
+        workers (int): 'files' modunda paralel süreç sayısı (varsayılan: çekirdek sayısı)
+
+    Returns:
+        list: Parça özetleri (dizin satırları; 'files' modunda 'Dosya' yolu da)
+    """
+    if mode not in SHARD_MODES:
+        raise ValueError(f"Geçersiz parçalama modu: {mode} (seçenekler: {', '.join(SHARD_MODES)})")
+
+    shards = plan_shards(df, rows_per_shard, group_by)
+    summaries = [shard_summary(label, part, rating_column) for label, part in shards]
+    frames = [(label, excel_frame(part, rating_column)) for label, part in shards]
+    index_title = f"📑 DİZİN - {len(shards)} parça, {len(df)} İşletme"
+
+    if mode == 'files':
+        paths = [_shard_filename(filename, number, label) for number, (label, _) in enumerate(frames, 1)]
+        pool_size = max(1, min(workers or os.cpu_count() or 1, len(frames)))
+        with ProcessPoolExecutor(max_workers=pool_size) as executor:
+            futures = [executor.submit(_write_shard, part, path, _shard_title(label, part))
+                       for (label, part), path in zip(frames, paths)]
+            for future in futures:
+                future.result()
+
+        # Bağlantılar dizinle aynı klasördeki dosyalara göreli verilir
+        links = [(os.path.basename(path), 'Dosyayı aç') for path in paths]
+        workbook = new_workbook()
+        add_styled_sheet(workbook, _index_frame(summaries, links), INDEX_SHEET, index_title, _INDEX_WIDTHS)
+        workbook.save(filename)
+        for summary, path in zip(summaries, paths):
+            summary['Dosya'] = path
+        return summaries
+
+    # Tek dosya: dizin ilk sayfa, parçalar sırayla eklenir (write-only kitap tek süreçte yazılır)
+    names = _sheet_names([label for label, _ in frames])
+    links = [(f"#'{name.replace(chr(39), chr(39) * 2)}'!A1", 'Sayfaya git') for name in names]
+    workbook = new_workbook()
+    add_styled_sheet(workbook, _index_frame(summaries, links), INDEX_SHEET, index_title, _INDEX_WIDTHS)
+    for name, (label, part) in zip(names, frames):
+        add_styled_sheet(workbook, part, name, _shard_title(label, part))
+    workbook.save(filename)
+    return summaries
+
+
+if __name__ == "__main__":
+    import sys
+    import tempfile
+    import time
+
+    from normalize import normalize_records
+
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    budget = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+    districts = ['Kadıköy', 'Beşiktaş', 'Üsküdar', 'Şişli', 'Bakırköy', 'Maltepe', 'Ataşehir', 'Fatih']
+    df = normalize_records([
+        {
+            'Sıra': i + 1,
+            'Ad': f"İşletme {i}",
+            'Adres': f"Moda Cd. No:{i % 400}, 34710 {districts[i % 8]}/İstanbul",
+            'Telefon': f"0216 {i % 1000:03d} {i // 1000 % 100:02d} {i % 97:02d}" if i % 4 else '',
+            'Puan/Yorum': f"{1 + i % 41 / 10:.1f}({i % 900})".replace('.', ','),
+        }
+        for i in range(total)
+    ])
+
+    directory = tempfile.mkdtemp()
+    started = time.perf_counter()
+    write_styled_excel(excel_frame(df, RATING), os.path.join(directory, 'tek.xlsx'))
+    print(f"Tek dosya ({total:,} satır): {time.perf_counter() - started:.1f} sn")
+
+    for label, options in [
+        (f"{budget:,} satırlık dosyalar (paralel)", dict(rows_per_shard=budget)),
+        ("İlçe başına dosya (paralel)", dict(group_by='İlçe')),
+        ("İlçe başına sayfa (tek dosya)", dict(group_by='İlçe', mode='sheets')),
+    ]:
+        started = time.perf_counter()
+        summaries = export_sharded(df, os.path.join(directory, f"parcali_{len(label)}.xlsx"), **options)
+        print(f"{label}: {len(summaries)} parça, {time.perf_counter() - started:.1f} sn")
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bölgesel (karolu) arama için harita görünümü ızgarası
+
+Google Maps tek bir aramada ~120 karttan sonra sonuç döndürmez; büyük bir
+şehirde max_results=1000 hiçbir zaman dolmaz. Konum, seçilen yakınlaştırma
+düzeyinde görünüm (viewport) merkezli karolara bölünür; her karo kendi
+aramasıdır:
+    https://www.google.com/maps/search/<arama>/@<enlem>,<boylam>,<zoom>z
+Karolar biraz örtüşür, tekrar eden işletmeler place id ile elenir. Karo
+kapasitesine yaklaşan (doygun) karo bir düzey yakınlaştırılıp dörde bölünür,
+böylece sonuç sayısı alanla ve yoğunlukla birlikte büyür.
+Hesaplar Web Mercator piksel koordinatlarıyla yapılır (256 px dünya karosu).
+"""
+
+import math
+import re
+from collections import namedtuple
+from urllib.parse import quote_plus
+
+# Görünüm: harita merkezi ve yakınlaştırma düzeyi
+Viewport = namedtuple('Viewport', 'lat lng zoom')
+# Coğrafi sınır kutusu (derece)
+Bounds = namedtuple('Bounds', 'south west north east')
+
+# Bir aramanın döndürdüğü yaklaşık en fazla kart
+FEED_CAP = 120
+# Bu kadar kart gören karo doygun sayılır ve bölünür
+SATURATION = 100
+MIN_TILE_ZOOM = 3
+MAX_TILE_ZOOM = 18
+# Karolar arası örtüşme oranı (kenardaki işletmeler kaçmasın)
+DEFAULT_OVERLAP = 0.1
+# Sürücü pencere boyutu okunamazsa varsayılan görünüm (piksel)
+DEFAULT_VIEWPORT_SIZE = (1280, 800)
+
+_TILE_SIZE = 256
+_MAX_LAT = 85.05112878
+
+_VIEWPORT_RE = re.compile(r'@(-?\d+(?:\.\d+)?),(-?\d+(?:\.\d+)?),(\d+(?:\.\d+)?)z')
+_NUMBER = r'\s*(-?\d+(?:\.\d+)?)\s*'
+_BOUNDS_RE = re.compile(rf'^{_NUMBER},{_NUMBER},{_NUMBER},{_NUMBER}$')
+
+
+def parse_viewport(text):
+    """
+    Maps URL'sinden veya '@41.01,28.97,14z' biçimindeki konumdan görünümü çıkar
+
+    Returns:
+        Viewport veya None
+    """
+    match = _VIEWPORT_RE.search(text or '')
+    if not match:
+        return None
+    lat, lng, zoom = float(match.group(1)), float(match.group(2)), float(match.group(3))
+    return Viewport(lat, lng, int(zoom))
+
+
+def parse_bounds(text):
+    """'güney,batı,kuzey,doğu' biçimindeki sınır kutusu (ör. '40.80,28.60,41.25,29.40'); değilse None"""
+    match = _BOUNDS_RE.match(text or '')
+    if not match:
+        return None
+    south, west, north, east = (float(value) for value in match.groups())
+    if not (-90 <= south < north <= 90 and -180 <= west < east <= 180):
+        return None
+    return Bounds(south, west, north, east)
+
+
+def viewport_location(viewport):
+    """Görünümü arama konumu olarak yaz: '@41.012345,28.976543,14z'"""
+    return f"@{viewport.lat:.6f},{viewport.lng:.6f},{viewport.zoom}z"
+
+
+def tile_url(query, viewport):
+    """Karo merkezli arama URL'si"""
+    return f"https://www.google.com/maps/search/{quote_plus(query)}/{viewport_location(viewport)}"
+
+
+def _world_size(zoom):
+    return _TILE_SIZE * 2 ** zoom
+
+
+def _to_pixels(lat, lng, zoom):
+    world = _world_size(zoom)
+    sin_lat = math.sin(math.radians(max(-_MAX_LAT, min(_MAX_LAT, lat))))
+    x = (lng + 180) / 360 * world
+    y = (0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)) * world
+    return x, y
+
+
+def _to_lat_lng(x, y, zoom):
+    world = _world_size(zoom)
+    lng = x / world * 360 - 180
+    lat = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * y / world))))
+    return lat, lng
+
+
+def viewport_bounds(viewport, width=DEFAULT_VIEWPORT_SIZE[0], height=DEFAULT_VIEWPORT_SIZE[1]):
+    """width x height piksellik görünümün kapsadığı sınır kutusu"""
+    x, y = _to_pixels(viewport.lat, viewport.lng, viewport.zoom)
+    north, west = _to_lat_lng(x - width / 2, y - height / 2, viewport.zoom)
+    south, east = _to_lat_lng(x + width / 2, y + height / 2, viewport.zoom)
+    return Bounds(south, max(-180.0, west), north, min(180.0, east))
+
+
+def _steps(start, end, span, step):
+    """[start, end] aralığını span genişliğinde pencerelerle örten merkezler (eşit aralıklı)"""
+    length = end - start
+    if length <= span:
+        return [(start + end) / 2]
+    count = math.ceil((length - span) / step) + 1
+    first, last = start + span / 2, end - span / 2
+    return [first + (last - first) * i / (count - 1) for i in range(count)]
+
+
+def tile_grid(bounds, zoom, width=DEFAULT_VIEWPORT_SIZE[0], height=DEFAULT_VIEWPORT_SIZE[1],
+              overlap=DEFAULT_OVERLAP):
+    """
+    Sınır kutusunu zoom düzeyinde görünüm merkezli karolara böl
+
+    Args:
+        bounds (Bounds): Taranacak bölge
+        zoom (int): Karo yakınlaştırma düzeyi (büyüdükçe karo küçülür, sayı artar)
+        width, height (int): Görünüm boyutu (piksel)
+        overlap (float): Komşu karoların örtüşme oranı
+
+    Returns:
+        list: Viewport listesi; komşu karolar art arda gelsin diye yılan sırasında
+    """
+    zoom = max(MIN_TILE_ZOOM, min(MAX_TILE_ZOOM, int(zoom)))
+    left, top = _to_pixels(bounds.north, bounds.west, zoom)
+    right, bottom = _to_pixels(bounds.south, bounds.east, zoom)
+
+    columns = _steps(left, right, width, width * (1 - overlap))
+    rows = _steps(top, bottom, height, height * (1 - overlap))
+    tiles = []
+    for row, y in enumerate(rows):
+        for x in (columns if row % 2 == 0 else reversed(columns)):
+            lat, lng = _to_lat_lng(x, y, zoom)
+            tiles.append(Viewport(round(lat, 6), round(lng, 6), zoom))
+    return tiles
+
+
+def split_tile(viewport, width=DEFAULT_VIEWPORT_SIZE[0], height=DEFAULT_VIEWPORT_SIZE[1]):
+    """Doygun karoyu bir düzey yakın dört alt karoya böl (en yakın düzeyde bölünmez)"""
+    if viewport.zoom >= MAX_TILE_ZOOM:
+        return []
+    zoom = viewport.zoom + 1
+    # Bir düzey yakında piksel koordinatları iki katına çıkar; alt karolar çeyrek kaydırılır
+    x, y = _to_pixels(viewport.lat, viewport.lng, zoom)
+    children = []
+    for dy in (-height / 2, height / 2):
+        for dx in (-width / 2, width / 2):
+            lat, lng = _to_lat_lng(x + dx, y + dy, zoom)
+            children.append(Viewport(round(lat, 6), round(lng, 6), zoom))
+    return children
+
+
+def is_saturated(cards_seen):
+    """Karo kapasitesine yaklaştı mı (daha yakın düzeyde daha fazla sonuç vardır)"""
+    return cards_seen >= SATURATION
+
+
+if __name__ == "__main__":
+    import sys
+
+    location = sys.argv[1] if len(sys.argv) > 1 else '@41.0082,28.9784,11z'
+    zoom = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    viewport = parse_viewport(location)
+    bounds = parse_bounds(location) or viewport_bounds(viewport)
+    zoom = zoom or (viewport.zoom + 2 if viewport else 13)
+    tiles = tile_grid(bounds, zoom)
+    print(f"Bölge: {bounds}")
+    print(f"Zoom {zoom}: {len(tiles)} karo, en fazla ~{len(tiles) * FEED_CAP} sonuç (bölünmeden)")
+    for tile in tiles[:5]:
+        print(f"   {tile_url('restoran', tile)}")
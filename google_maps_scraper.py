@@ -1,5 +1,6 @@
+import os
 import time
-import pandas as pd
+from collections import deque
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -7,26 +8,175 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import logging
+from wait_conditions import (
+    detail_title, detail_title_matches, feed_grew_or_ended, feed_has_children, feed_state, scroll_feed
+)
+from card_scripts import (
+    BULK_CARDS_SCRIPT, CARD_BY_INDEX_SCRIPT, DETAIL_SCRIPT, FEED_HTML_SCRIPT, STREAM_DRAIN_SCRIPT,
+    STREAM_INSTALL_SCRIPT, STREAM_NEXT_SCRIPT
+)
+from place_ids import extract_place_id
+from selector_resolver import SelectorResolver
+from detail_pool import DetailEnricher
+from app_paths import app_data_path
+from driver_cache import resolve_driver_path
+from lean_mode import ByteCounter, apply_lean_options, enable_byte_tracking, enable_request_blocking
+from network_extract import NetworkCapture, records_from_response
+from html_parser import parse_feed_html, save_snapshot
+import text_classifier
+from normalize import RATING, normalize_record, normalize_records
+from record_journal import RecordJournal, journal_path
+from result_store import ResultStore
+from business_record import BusinessRecord, RecordCount
+from excel_export import excel_frame, write_styled_excel
+from excel_shards import EXCEL_MAX_ROWS, export_sharded
+from data_export import DEFAULT_CHUNK_SIZE, export_chunks, export_filename, format_of, record_chunks
+from dedup_index import DUPLICATE, KNOWN, DETAIL_FIELDS, DedupIndex
+from async_search import DEFAULT_QUEUE_SIZE, search_async, stream_search
+from geo_tiles import (DEFAULT_VIEWPORT_SIZE, MAX_TILE_ZOOM, is_saturated, parse_bounds, parse_viewport,
+                       split_tile, tile_grid, tile_url, viewport_bounds, viewport_location)
+
+# Sonuç listesindeki işletme kartları için selector'lar
+CARD_LIST_SELECTORS = [
+    "[data-result-index]",
+    "[jsaction*='pane.resultSection.click']",
+    "[role='article']",
+    ".Nv2PK",
+    ".THOPZb",
+    ".lI9IFe",
+    "[data-value='Business name']",
+    ".fontHeadlineSmall",
+    ".qBF1Pd",
+    # Ek selector'lar
+    ".VkpGBb",
+    ".Nv2PK.THOPZb",
+    ".lI9IFe.THOPZb",
+    ".qBF1Pd.fontHeadlineSmall",
+    # Daha genel selector'lar
+    "[role='button'][jsaction*='pane']",
+    ".fontHeadlineSmall[role='button']",
+    ".qBF1Pd[role='button']"
+]
+
+# Kart alanları için selector listeleri (DOM ve toplu okuma modları ortak kullanır)
+NAME_SELECTORS = [
+    "[data-value='Business name']",
+    "h3", "h2", "[role='heading']",
+    ".fontHeadlineSmall",
+    ".qBF1Pd",
+    ".fontDisplayLarge",
+    ".fontHeadlineMedium"
+]
+PHONE_SELECTORS = [
+    # Yeni Google Maps yapısı
+    "[data-item-id^='phone']",
+    "button[aria-label*='Telefon:']",
+    "a[href^='tel:']",
+    # Text elementleri
+    ".Io6YTe.fontBodyMedium"
+]
+ADDRESS_SELECTORS = [
+    # Yeni Google Maps yapısı
+    "[data-item-id='address']",
+    "button[aria-label*='Adres:']",
+    # Text elementleri
+    ".Io6YTe.fontBodyMedium"
+]
+RATING_SELECTORS = [
+    # Yeni Google Maps yapısı
+    "[role='img']",
+    "[aria-label*='star']",
+    "[aria-label*='yıldız']",
+    # Text elementleri
+    ".fontDisplayMedium",
+    ".fontBodySmall",
+    # Spesifik puan göstergeleri
+    "[data-value*='rating']"
+]
+PRICE_FALLBACK_SELECTORS = [".fontBodyMedium", ".fontBodySmall"]
+
+# Tek selector'lı opsiyonel alanlar: sözlük anahtarı -> selector
+OPTIONAL_FIELD_SELECTORS = {
+    'Website': "[data-item-id='authority']",
+    'Kategori': "[data-value='Category']",
+    'Açılış Saatleri': "[data-item-id='oh']",
+    'Durum': "[data-value='Open hours status']",
+    'Fiyat Seviyesi': "[data-value='Price']"
+}
+
+# Toplu okuma script'ine gönderilen alan -> selector listesi
+CARD_FIELD_SELECTORS = {
+    'name': NAME_SELECTORS,
+    'phone': PHONE_SELECTORS,
+    'address': ADDRESS_SELECTORS,
+    'rating': RATING_SELECTORS,
+    'price_fallback': PRICE_FALLBACK_SELECTORS,
+    **{key: [selector] for key, selector in OPTIONAL_FIELD_SELECTORS.items()}
+}
+
+EXTRACTION_MODES = ('bulk', 'dom', 'network', 'html', 'stream')
 
 class GoogleMapsScraper:
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, wait_timeout=10, selector_stats_path=None, dead_selector_after=25,
+                 notify=True, driver_path=None, lean=False, result_store=None, dedup_index=None, stall_budget=6.0):
         """
         Google Maps scraper sınıfı
         
         Args:
             headless (bool): Tarayıcıyı görünmez modda çalıştır
+            wait_timeout (float): Tüm bekleme koşulları için üst süre sınırı (saniye)
+            selector_stats_path (str): Selector istatistik dosyası (varsayılan: ~/.mapminer/selector_stats.json,
+                False ise istatistik diske yazılmaz)
+            dead_selector_after (int): Art arda bu kadar ıskalayan selector devre dışı kalır
+            notify (bool): Tarama bitince bildirim penceresi ve konsol raporu göster
+            driver_path (str): Elle verilen chromedriver yolu (internetsiz makineler için)
+            lean (bool): Hafif mod - resim, font, medya ve harita karolarını indirme
+            result_store (ResultStore): Sonuçların biriktiği SQLite deposu (varsayılan: ~/.mapminer/results.db,
+                False ise depoya yazılmaz)
+            dedup_index (DedupIndex): Taramalar arası tekrar indeksi (varsayılan: ~/.mapminer/dedup.db,
+                False ise kapalı)
+            stall_budget (float): Feed büyümeden bu kadar saniye geçerse liste tükenmiş sayılır
         """
         self.driver = None
         self.headless = headless
-        self.business_data = []
+        self.notify = notify
+        self.driver_path = driver_path  # Elle verilen chromedriver yolu (None: önbellek/indirme)
+        self.lean = lean  # Hafif mod: metin dışı kaynaklar engellenir
+        self.wait_timeout = wait_timeout  # Bekleme üst sınırı
+        self.retry_wait_timeout = min(2, wait_timeout)  # Karo ve ağ yanıtı beklemelerinde kısa sınır
+        self.stall_budget = stall_budget  # Tükenen feed'de en fazla boşa bekleme (saniye)
+        self.business_data = []  # BusinessRecord listesi (sözlük gibi kullanılır)
+        self.seen_place_ids = set()  # Toplanan işletmelerin kalıcı kimlikleri
         self.scan_count = 0  # Tarama sayacı
         self.current_query = ""  # Mevcut arama terimi
         self.current_location = ""  # Mevcut konum
         self.progress_callback = None  # İlerleme callback fonksiyonu
+        self.record_callback = None  # Her kesinleşen kayıtla çağrılır (akış API'leri)
+        self.stop_requested = False  # request_stop() ile verilen durdurma isteği
         self.max_results = 0  # Maksimum sonuç sayısı
+        self.extraction_mode = 'bulk'  # Kart okuma modu: 'bulk' (tek script), 'dom', 'network' veya 'html'
+        self.network_capture = None  # Ağ modunda performans logundan yanıt yakalayıcı
+        self.byte_counter = ByteCounter()  # Aramanın tüm sayfalarında aktarılan bayt
+        self._stream_buffer = []  # Akış modunda kaydırma beklerken gelen, henüz işlenmemiş kartlar
+        self.round_trips = 0  # chromedriver'a yapılan toplam istek sayısı
+        self.record_round_trips = []  # Her kaydın maliyeti (istek sayısı)
+        self.detail_timings = []  # Her detay panelinin açılıp okunma süresi (saniye)
+        
+        # Selector'ların isabet/gecikme istatistikleri - oturumlar arası kalıcı
+        self.selector_resolver = SelectorResolver(
+            app_data_path('selector_stats.json') if selector_stats_path is None else selector_stats_path,
+            dead_after=dead_selector_after
+        )
+        
+        self.detail_workers = 0  # Paralel detay driver sayısı (0: detaylar sayfada tıklanarak alınır)
+        self.pending_details = []  # Paralel zenginleştirmeyi bekleyen kayıtlar
+        self.metrics = {}  # Son aramanın hız ölçümleri
+        self._normalized = None  # (kayıt listesi, kayıt sayısı, tipli DataFrame) önbelleği
+        self.journal = None  # Aktif aramanın diskteki kayıt günlüğü
+        self._result_store = result_store  # İlk kullanımda açılır (None: varsayılan depo)
+        self._dedup_index = dedup_index  # İlk kullanımda açılır (None: varsayılan indeks)
         
         # Logging ayarları
         logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -34,6 +184,7 @@ class GoogleMapsScraper:
         
     def setup_driver(self):
         """Chrome driver'ı ayarla"""
+        started = time.perf_counter()
         try:
             chrome_options = Options()
             if self.headless:
@@ -46,19 +197,60 @@ class GoogleMapsScraper:
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             chrome_options.add_experimental_option('useAutomationExtension', False)
             chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+            if self.lean:
+                apply_lean_options(chrome_options)
+            if self.extraction_mode == 'network':
+                # Ağ modu XHR yanıtlarını performans logundan okur
+                chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
             
-            service = Service(ChromeDriverManager().install())
+            driver_path, source = resolve_driver_path(self.driver_path)
+            resolved = time.perf_counter()
+            service = Service(driver_path)
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            # Akış modunda kaydırma beklemesi sayfa içinde (execute_async_script) yapılır
+            self.driver.set_script_timeout(max(30, self.wait_timeout + 5))
+            self._install_round_trip_counter()
+            try:
+                enable_byte_tracking(self.driver)
+            except Exception as e:
+                # Sadece ölçüm: tampon büyütülemezse bayt sayısı alt sınır kalır, tarama sürer
+                self.logger.warning(f"Bayt sayımı etkinleştirilemedi: {e}")
+            if self.lean:
+                enable_request_blocking(self.driver)
+            if self.extraction_mode == 'network':
+                self.network_capture = NetworkCapture(self.driver, record_dir=os.environ.get('MAPMINER_RECORD_RESPONSES'))
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
-            self.logger.info("Chrome driver başarıyla ayarlandı")
+            finished = time.perf_counter()
+            self.metrics['driver_resolve_seconds'] = resolved - started
+            self.metrics['setup_driver_seconds'] = finished - started
+            self.logger.info(f"Chrome driver başarıyla ayarlandı ({finished - started:.2f} sn, "
+                             f"driver çözümleme: {resolved - started:.2f} sn, kaynak: {source})")
             return True
             
         except Exception as e:
             self.logger.error(f"Driver ayarlanırken hata: {e}")
             return False
     
-    def search_businesses(self, query, location="", max_results=50, detailed_info=True, progress_callback=None):
+    def _install_round_trip_counter(self):
+        """Driver'a giden her komutu say (WebElement çağrıları da driver.execute'tan geçer)"""
+        original_execute = self.driver.execute
+        
+        def counted_execute(driver_command, params=None):
+            self.round_trips += 1
+            return original_execute(driver_command, params)
+        
+        self.driver.execute = counted_execute
+    
+    def round_trips_per_record(self):
+        """Kayıt başına ortalama chromedriver istek sayısı"""
+        if not self.record_round_trips:
+            return 0.0
+        return sum(self.record_round_trips) / len(self.record_round_trips)
+    
+    def search_businesses(self, query, location="", max_results=50, detailed_info=True, progress_callback=None,
+                          extraction_mode='bulk', detail_workers=0, resume=False, tile_zoom=None, tile_workers=0,
+                          record_callback=None, journal_key=None, keep_records=True):
         """
         Google Maps'te işletme ara - DETAYLI MOD
         
@@ -68,16 +260,66 @@ class GoogleMapsScraper:
             max_results (int): Maksimum sonuç sayısı
             detailed_info (bool): Detaylı bilgileri topla (her zaman True)
             progress_callback (function): İlerleme güncelleme callback fonksiyonu
+            extraction_mode (str): 'bulk' tüm kartları tek script çağrısıyla okur,
+                'dom' her kartı ayrı WebDriver çağrılarıyla okur,
+                'network' kartları DOM yerine Maps'in XHR yanıtlarından okur,
+                'html' feed HTML'ini tek seferde alıp lxml ile süreç içinde ayrıştırır,
+                'stream' feed'e MutationObserver kurar; yeni kartlar göründükçe sayfa içi tampona
+                yazılır, kaydırma ve bekleme sayfada yapılır (tur başına tek istek)
+            detail_workers (int): 0'dan büyükse detaylar liste taramasından sonra bu kadar
+                paralel headless driver ile işletme linkleri açılarak toplanır
+            resume (bool): Bu aramanın günlüğünü yükle, kayıtlı işletmeleri atlayıp kaldığı yerden devam et
+            tile_zoom (int): Bölgesel tarama - konum bu yakınlaştırma düzeyinde karolara bölünür ve her karo
+                ayrı aranır ('auto': konumun görünümünden iki düzey yakın). Konum bir şehir adı,
+                'güney,batı,kuzey,doğu' sınır kutusu veya '@enlem,boylam,zoomz' görünümü olabilir
+            tile_workers (int): 0'dan büyükse karolar bu kadar paralel headless driver'da (batch motoru) aranır
+            record_callback (function): Her yeni kayıt kesinleşince (detaylarıyla) kayıtla çağrılır;
+                tarama thread'inde çalışır, uzun sürerse taramayı yavaşlatır
+            journal_key: Günlük dosyasını aynı arama + konumlu diğer işlerden ayırır (batch iş numarası)
+            keep_records (bool): False ise kayıtlar business_data'da biriktirilmez, yalnızca record_callback'e
+                verilir (bellek kayıt sayısıyla büyümez); business_data yalnızca sayar, önceki aramaların
+                kayıtları da bırakılır, dışa aktarılacak ve depoya yazılacak kayıt kalmaz
         """
+        if extraction_mode not in EXTRACTION_MODES:
+            raise ValueError(f"Geçersiz okuma modu: {extraction_mode} (seçenekler: {', '.join(EXTRACTION_MODES)})")
+        if tile_zoom and not location.strip():
+            raise ValueError("Bölgesel tarama için konum gerekli (şehir, sınır kutusu veya görünüm)")
+        
         # Arama bilgilerini sakla
         self.current_query = query
         self.current_location = location
         self.progress_callback = progress_callback
+        self.record_callback = record_callback
+        self.stop_requested = False
         self.max_results = max_results
+        self.extraction_mode = extraction_mode
+        self.detail_workers = detail_workers
+        self.pending_details = []
+        self.metrics = {'duplicates_skipped': 0, 'details_reused': 0, 'exhausted_wait_seconds': 0.0}
+        if not keep_records:
+            self.business_data = RecordCount(len(self.business_data))
+        elif isinstance(self.business_data, RecordCount):
+            self.business_data = []
+        # Yalnızca bu aramada görülenler tekrar sayılır; önceki aramaların işletmeleri bilinen (KNOWN) olur
+        if self.dedup_index:
+            self.dedup_index.new_session()
+        
+        # Kabul edilen her kayıt diskteki günlüğe yazılır; yarım kalan tarama buradan sürdürülür
+        self.journal = RecordJournal(journal_path(query, location, journal_key))
+        if resume:
+            resumed = self._resume_from_journal()
+        else:
+            self.journal.reset()
+            resumed = 0
+        remaining = max_results - resumed
         
         # Driver yeniden başlatma limiti kaldırıldı - sınırsız tarama
         # Sadece driver yoksa yeni bir tane oluştur
         
+        # Ağ modu performans logu açık bir driver ister
+        if self.driver and extraction_mode == 'network' and not self.network_capture:
+            self.close()
+        
         if not self.driver:
             if not self.setup_driver():
                 return False
@@ -85,183 +327,628 @@ class GoogleMapsScraper:
         try:
             # Scan count artık limit için kullanılmıyor - sınırsız tarama
             
-            # Google Maps'i aç
-            search_query = f"{query} {location}".strip()
-            maps_url = f"https://www.google.com/maps/search/{search_query.replace(' ', '+')}"
+            # Sonuçları topla - detaylı mod
+            started = time.perf_counter()
+            records_before = len(self.business_data)
+            self.byte_counter.start(self.driver)
+            viewport = parse_viewport(location)
+            if remaining <= 0:
+                self.logger.info(f"Günlükte zaten {resumed} işletme var, yeni tarama gerekmiyor")
+            elif tile_zoom and tile_workers > 0:
+                self._collect_tiles_parallel(query, location, remaining, tile_zoom, tile_workers)
+            elif tile_zoom:
+                self._collect_tiles(query, location, remaining, detailed_info, tile_zoom)
+            else:
+                # Tek arama; konum bir görünümse ('@enlem,boylam,zoomz') o karo aranır
+                search_query = f"{query} {location}".strip()
+                self.logger.info(f"Arama yapılıyor: {search_query}")
+                self._open_search(tile_url(query, viewport) if viewport else
+                                  f"https://www.google.com/maps/search/{search_query.replace(' ', '+')}")
+                self._collect(remaining, detailed_info, patient=viewport is None)
+            if self.stop_requested:
+                self.logger.info(f"⏹️ Tarama istek üzerine durduruldu ({len(self.business_data)} işletme)")
+            self.metrics['bytes_transferred'], self.metrics['requests'] = self.byte_counter.total(self.driver)
+            self.logger.info(f"Aktarılan veri: {self.metrics['bytes_transferred'] / 1048576:.1f} MB, "
+                             f"{self.metrics['requests']} istek (hafif mod: {'açık' if self.lean else 'kapalı'})")
             
-            self.logger.info(f"Arama yapılıyor: {search_query}")
-            self.driver.get(maps_url)
+            # Linki toplanan işletmelerin detaylarını paralel driver havuzunda oku
+            if self.pending_details:
+                enricher = DetailEnricher(self._detail_worker_factory, pool_size=self.detail_workers)
+                enricher.enrich(self.pending_details)
+                self.metrics['detail_records_per_minute'] = enricher.records_per_minute
+                # Zenginleşen kayıtlar günlüğe yeniden yazılır (okurken son hali geçerli)
+                for record in self.pending_details:
+                    self.journal.append(record)
+                    self._remember(record)
+                    self._emit(record)
+                self.pending_details = []
+            if self.dedup_index:
+                self.dedup_index.flush()
+            if self.metrics['duplicates_skipped'] or self.metrics['details_reused']:
+                self.logger.info(f"Tekrar eden {self.metrics['duplicates_skipped']} kayıt atlandı, "
+                                 f"{self.metrics['details_reused']} işletmenin detayı önceki taramalardan alındı")
             
-            # Sayfanın yüklenmesini bekle (daha uzun)
-            WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[role='main']"))
-            )
+            # Telefon/puan/adres tek seferde vektörel normalize edilir, depoya toplu yazılır
+            if self.result_store and keep_records:
+                self.result_store.add(self.normalized_data(), query, location)
+                self.result_store.flush()
             
-            # Sonuçları topla - detaylı mod
-            self._collect_business_data(max_results, detailed_info)
+            elapsed = time.perf_counter() - started
+            new_records = len(self.business_data) - records_before
+            self.metrics['records_per_minute'] = new_records / elapsed * 60 if elapsed > 0 else 0.0
+            self.logger.info(f"Arama hızı: {self.metrics['records_per_minute']:.1f} kayıt/dakika")
+            
+            # İstenilen sayıya ulaşıldı mı kontrol et
+            self._report_completion(max_results)
+            
+            # Sonuna kadar biten aramanın günlüğü silinir; durdurulan aramanınki devam için kalır
+            if not self.stop_requested:
+                self.journal.complete()
             
             return True
             
         except Exception as e:
             self.logger.error(f"Arama sırasında hata: {e}")
             return False
+        
+        finally:
+            # Öğrenilen selector sırasını sonraki oturum için sakla
+            self.selector_resolver.save()
+            self.journal.close()
     
-    def _collect_business_data(self, max_results, detailed_info=True):
-        """İşletme verilerini topla"""
+    def search_async(self, query, location="", max_results=50, queue_size=DEFAULT_QUEUE_SIZE, executor=None,
+                     **search_options):
+        """
+        search_businesses'in asyncio sürümü: kayıtlar kesinleştikçe verilir
+        
+            async for record in scraper.search_async('restoran', 'Kadıköy', 100):
+                ...
+        
+        Arama executor thread'inde yürür; tüketici yavaşsa (queue_size dolunca)
+        tarama bekler. Döngüden erken çıkılırsa tarama durdurulur.
+        Diğer seçenekler search_businesses ile aynıdır.
+        """
+        return search_async(self, query, location, max_results, queue_size=queue_size, executor=executor,
+                            **search_options)
+    
+    def iter_businesses(self, query, location="", max_results=50, queue_size=DEFAULT_QUEUE_SIZE, keep_records=True,
+                        **search_options):
+        """
+        search_businesses'in generator sürümü: normalize edilmiş kayıtlar kesinleştikçe verilir
+        
+            for record in scraper.iter_businesses('restoran', 'Kadıköy', 100):
+                print(record['Ad'], record['Telefon (E.164)'])
+        
+        Tarama arka plan thread'inde yürür, kayıtlar sınırlı kuyrukla aktarılır
+        (async_search.stream_search); tüketici yavaşsa (queue_size dolunca) tarama
+        bekler. Generator erken kapatılırsa (break sonrası close() veya çöp
+        toplama) tarama durdurulur. Kayıtlar normalize_record ile normalize
+        edilmiş düz sözlüklerdir.
+        
+        keep_records=True iken tarama bittiğinde business_data ve sonuç deposu
+        her zamanki gibi doludur; False ise kayıtlar yalnızca tüketiciye verilir,
+        bellek kayıt sayısıyla büyümez (bkz. search_businesses).
+        Diğer seçenekler search_businesses ile aynıdır.
+        
+        Raises:
+            RuntimeError: Arama başarısız olursa (akış bittikten sonra)
+        """
+        for record in stream_search(self, query, location, max_results, queue_size, keep_records=keep_records,
+                                    **search_options):
+            yield normalize_record(record)
+    
+    def _resume_from_journal(self):
+        """Günlükteki kayıtları yükle, place id'lerini görülmüş say; yüklenen sayıyı döndür"""
+        resumed = 0
+        for record in map(BusinessRecord.from_dict, self.journal.load()):
+            place_id = record.get('Yer ID')
+            if place_id and place_id in self.seen_place_ids:
+                continue
+            if place_id:
+                self.seen_place_ids.add(place_id)
+            record['Sıra'] = len(self.business_data) + 1
+            self.business_data.append(record)
+            self._remember(record)
+            resumed += 1
+            
+            # Detayı okunamadan yarıda kalanlar paralel havuzda tamamlanır
+            if self.detail_workers > 0 and not record.get('Telefon') and record.get('Harita Linki'):
+                self.pending_details.append(record)
+            else:
+                self._emit(record)
+        
+        if resumed:
+            self.logger.info(f"Günlükten {resumed} işletme yüklendi, tarama kaldığı yerden sürüyor")
+        return resumed
+    
+    def _open_search(self, maps_url):
+        """Arama URL'sini aç ve sonuç panelinin yüklenmesini bekle"""
+        if self.extraction_mode == 'network':
+            self.network_capture.reset()
+        self._stream_buffer = []
+        self._navigate(maps_url)
+        WebDriverWait(self.driver, max(15, self.wait_timeout)).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "[role='main']"))
+        )
+    
+    def _navigate(self, url):
+        """Yeni sayfa aç; ayrılan sayfanın aktardığı baytlar önce toplama eklenir"""
+        self.byte_counter.checkpoint(self.driver)
+        self.driver.get(url)
+    
+    def _collect(self, max_results, detailed_info=True, patient=True):
+        """Açık aramanın sonuçlarını okuma moduna göre topla; görülen kart sayısını döndür"""
+        if self.extraction_mode == 'network':
+            return self._collect_network_data(max_results, patient)
+        return self._collect_business_data(max_results, detailed_info, patient)
+    
+    def _location_viewport(self, location):
+        """
+        Konumun harita görünümü ve kapsadığı sınır kutusu
+        
+        Sınır kutusu veya görünüm verilmişse doğrudan kullanılır; şehir/ilçe
+        adında Maps'in konuma yaklaştığı görünüm adres çubuğundan okunur.
+        
+        Returns:
+            tuple: (Bounds, Viewport veya None)
+        """
+        bounds = parse_bounds(location)
+        if bounds:
+            return bounds, None
+        
+        viewport = parse_viewport(location)
+        if viewport is None:
+            self._navigate(f"https://www.google.com/maps/place/{location.replace(' ', '+')}")
+            viewport = WebDriverWait(self.driver, max(15, self.wait_timeout), poll_frequency=0.2).until(
+                lambda driver: '/place/' in driver.current_url and parse_viewport(driver.current_url)
+            )
+        return viewport_bounds(viewport, *self._viewport_size()), viewport
+    
+    def _viewport_size(self):
+        """Tarayıcı penceresinin piksel boyutu (okunamazsa varsayılan)"""
+        try:
+            size = self.driver.get_window_size()
+            return size['width'], size['height']
+        except Exception:
+            return DEFAULT_VIEWPORT_SIZE
+    
+    def _plan_tiles(self, location, tile_zoom):
+        """Konumu karolara böl; (karolar, görünüm genişliği, yüksekliği) döndür"""
+        bounds, viewport = self._location_viewport(location)
+        if tile_zoom == 'auto':
+            tile_zoom = min(viewport.zoom + 2 if viewport else 13, MAX_TILE_ZOOM)
+        width, height = self._viewport_size()
+        tiles = tile_grid(bounds, tile_zoom, width, height)
+        self.logger.info(f"🧩 Bölgesel tarama: {len(tiles)} karo (zoom {tile_zoom})")
+        return tiles, width, height
+    
+    def _collect_tiles(self, query, location, max_results, detailed_info, tile_zoom):
+        """
+        Konumu karolara bölüp her karoyu ayrı ara (tek driver)
+        
+        Tekrar eden işletmeler place id ile atlanır. Kapasitesine yaklaşan karo
+        dört alt karoya bölünüp kuyruğa eklenir; tükenen karoda uzun agresif
+        kaydırma yapılmaz.
+        """
+        tiles, width, height = self._plan_tiles(location, tile_zoom)
+        pending_tiles = deque(tiles)
+        records_before = len(self.business_data)
+        searched = split = 0
+        
+        while pending_tiles and len(self.business_data) - records_before < max_results and not self.stop_requested:
+            tile = pending_tiles.popleft()
+            tile_started = time.perf_counter()
+            tile_before = len(self.business_data)
+            try:
+                self._open_search(tile_url(query, tile))
+                seen = self._collect(max_results - (tile_before - records_before), detailed_info, patient=False)
+            except Exception as e:
+                self.logger.warning(f"Karo aranamadı ({viewport_location(tile)}): {e}")
+                continue
+            searched += 1
+            
+            new_records = len(self.business_data) - tile_before
+            self.logger.info(f"🧩 Karo {searched} ({viewport_location(tile)}): {seen} kart, {new_records} yeni işletme, "
+                             f"{time.perf_counter() - tile_started:.1f} sn - kuyrukta {len(pending_tiles)} karo")
+            if is_saturated(seen):
+                children = split_tile(tile, width, height)
+                pending_tiles.extend(children)
+                split += bool(children)
+        
+        self.metrics['tiles_searched'] = searched
+        self.metrics['tiles_split'] = split
+    
+    def _collect_tiles_parallel(self, query, location, max_results, tile_zoom, workers):
+        """
+        Karoları batch motoruyla paralel driver'larda ara, sonuçları place id ile birleştir
+        
+        Sıralı taramadaki gibi kapasitesine yaklaşan karonun dört alt karosu
+        motora yeni iş olarak eklenir.
+        """
+        from batch_engine import DONE, BatchEngine
+        
+        tiles, width, height = self._plan_tiles(location, tile_zoom)
+        
+        def show_progress(finished, total, record_count):
+            if self.progress_callback:
+                self.progress_callback(finished / total * 100, min(record_count, max_results), '')
+        
+        collected = 0
+        
+        def accept(record):
+            # Her karo biter bitmez kayıtları gelir; ilerleme ve record_callback beklemez
+            nonlocal collected
+            if collected >= max_results or self.stop_requested:
+                return
+            place_id = record.get('Yer ID')
+            if place_id and place_id in self.seen_place_ids:
+                return
+            if place_id:
+                self.seen_place_ids.add(place_id)
+            record['Konum'] = location
+            record['Sıra'] = len(self.business_data) + 1
+            self.business_data.append(record)
+            self.journal.append(record)
+            self._remember(record)
+            self._emit(record)
+            collected += 1
+        
+        split = 0
+        
+        def split_saturated(job, records):
+            # İşçi her karoda kayıtlarını sıfırlar: kayıt sayısı karoda görülen işletme sayısıdır
+            nonlocal split
+            self.logger.info(f"🧩 Karo {job['location']}: {len(records)} kart, {job['new_records']} yeni işletme, "
+                             f"{job['seconds']:.1f} sn")
+            if collected >= max_results or self.stop_requested or not is_saturated(len(records)):
+                return
+            children = split_tile(parse_viewport(job['location']), width, height)
+            for child in children:
+                engine.add_job(query, viewport_location(child), max_results)
+            split += bool(children)
+        
+        engine = BatchEngine([(query, viewport_location(tile), max_results) for tile in tiles],
+                             workers=workers, wait_timeout=self.wait_timeout, extraction_mode=self.extraction_mode,
+                             progress_callback=show_progress, record_callback=accept, lean=self.lean,
+                             job_callback=split_saturated)
+        engine.run()
+        
+        self.metrics['tiles_searched'] = sum(job['status'] == DONE for job in engine.jobs)
+        self.metrics['tiles_split'] = split
+    
+    def _collect_business_data(self, max_results, detailed_info=True, patient=True):
+        """
+        İşletme verilerini topla; feed'de görülen kart sayısını döndür
+        
+        Liste sonu işaretçisi görününce ya da feed (kart sayısı / kendi
+        kaydırma yüksekliği) stall_budget saniye büyümeyince durulur.
+        patient=False (bölgesel tarama karoları): bütçe kısa tutulur.
+        """
         collected = 0
-        last_height = 0
+        cursor = 0  # DOM'da işlenmiş kart sayısı - sonraki turda buradan devam edilir
         scroll_attempts = 0
-        max_scroll_attempts = 100  # Artırıldı - sınırsız tarama için
+        max_scroll_attempts = 100  # Güvenlik sınırı (asıl sınır bekleme bütçesi)
+        stalled = 0.0  # Feed son büyüdüğünden beri boşa beklenen süre
+        budget = self._stall_budget(patient)
+        list_ended = False
         
-        # Sayfanın tam yüklenmesini bekle - detaylı mod
-        time.sleep(4)
+        # İlk kartlar feed'e düşene kadar bekle (sabit süre yerine)
+        self._wait_until(feed_has_children())
+        round_trip_mark = self.round_trips
         
-        while collected < max_results and scroll_attempts < max_scroll_attempts:
+        while collected < max_results and scroll_attempts < max_scroll_attempts and not self.stop_requested:
             try:
-                # Farklı selector'ları dene
-                business_cards = []
+                # Sadece imleçten sonraki (henüz görülmemiş) kartları al
+                if self.extraction_mode in ('bulk', 'html', 'stream'):
+                    new_cards = [(raw['index'], raw) for raw in self._fetch_raw_cards(start=cursor)]
+                else:
+                    new_cards = list(enumerate(self._find_business_cards()))[cursor:]
                 
-                # Yeni Google Maps selector'ları - genişletilmiş
-                selectors = [
-                    "[data-result-index]",
-                    "[jsaction*='pane.resultSection.click']", 
-                    "[role='article']",
-                    ".Nv2PK",
-                    ".THOPZb",
-                    ".lI9IFe",
-                    "[data-value='Business name']",
-                    ".fontHeadlineSmall",
-                    ".qBF1Pd",
-                    # Ek selector'lar
-                    "[data-result-index]",
-                    ".VkpGBb",
-                    ".Nv2PK.THOPZb",
-                    ".lI9IFe.THOPZb",
-                    "[jsaction*='pane.resultSection.click']",
-                    ".fontHeadlineSmall",
-                    ".qBF1Pd.fontHeadlineSmall",
-                    # Daha genel selector'lar
-                    "[role='button'][jsaction*='pane']",
-                    ".fontHeadlineSmall[role='button']",
-                    ".qBF1Pd[role='button']"
-                ]
-                
-                for selector in selectors:
-                    try:
-                        cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        if cards:
-                            business_cards = cards
-                            self.logger.info(f"Selector '{selector}' ile {len(cards)} kart bulundu")
-                            break
-                    except:
-                        continue
-                
-                # Eğer hiç kart bulunamadıysa, sayfayı kaydır ve tekrar dene
-                if not business_cards:
+                if new_cards:
+                    stalled = 0.0
+                    self.logger.info(f"Yeni işletme kartı sayısı: {len(new_cards)} (önceden taranan: {cursor})")
+                elif cursor == 0:
                     self.logger.info("İşletme kartı bulunamadı, sayfa kaydırılıyor...")
-                    self._scroll_page()
-                    time.sleep(4)  # Daha uzun bekle
-                    scroll_attempts += 1
-                    continue
-                
-                self.logger.info(f"Bulunan işletme kartı sayısı: {len(business_cards)}")
                 
-                # Her işletme kartını işle
-                for i, card in enumerate(business_cards[collected:], collected):
-                    if collected >= max_results:
+                # Her yeni işletme kartını işle (i: kartın DOM'daki sırası)
+                for i, card in new_cards:
+                    if collected >= max_results or self.stop_requested:
                         break
+                    cursor = i + 1
                     
                     try:
+                        # Daha önce toplanan işletmeyi tekrar işleme
+                        place_id, place_url = self._card_identity(card)
+                        if place_id and place_id in self.seen_place_ids:
+                            continue
+                        
                         business_info = self._extract_business_info(card, i)
                         if business_info and business_info.get('Ad'):
+                            if place_id:
+                                business_info['Yer ID'] = place_id
+                            # Telefon veya ad + adresle aynı taramada tekrar eden kart atlanır
+                            duplicate_status = self._check_duplicate(business_info)
+                            if duplicate_status == DUPLICATE:
+                                continue
+                            business_info['Sıra'] = len(self.business_data) + 1
+                            if place_id:
+                                self.seen_place_ids.add(place_id)
+                            if place_url:
+                                business_info['Harita Linki'] = place_url
+                            
                             # Detaylı bilgileri topla - her zaman detaylı mod
-                            try:
-                                detailed_info_data = self.get_detailed_info(i)
-                                business_info.update(detailed_info_data)
-                                self.logger.info(f"Detaylı bilgiler toplandı: {business_info['Ad']}")
-                            except Exception as e:
-                                self.logger.warning(f"Detaylı bilgi toplama hatası: {e}")
+                            # Önceki taramadan bilinen işletmenin detayları zaten kopyalandı
+                            # Paralel modda linki olan kayıtlar tarama sonunda havuzda zenginleştirilir
+                            deferred = False
+                            if duplicate_status == KNOWN:
+                                self.logger.info(f"Detaylar önceki taramadan alındı: {business_info['Ad']}")
+                            elif self.detail_workers > 0 and place_id and place_url:
+                                self.pending_details.append(business_info)
+                                deferred = True
+                            else:
+                                try:
+                                    detailed_info_data = self.get_detailed_info(
+                                        i, card=card, expected_name=business_info['Ad']
+                                    )
+                                    business_info.update(detailed_info_data)
+                                    self.logger.info(f"Detaylı bilgiler toplandı: {business_info['Ad']}")
+                                except Exception as e:
+                                    self.logger.warning(f"Detaylı bilgi toplama hatası: {e}")
                             
                             self.business_data.append(business_info)
+                            self.journal.append(business_info)
+                            self._remember(business_info)
+                            if not deferred:
+                                self._emit(business_info)
                             collected += 1
-                            self.logger.info(f"Toplanan işletme sayısı: {collected} - {business_info['Ad']}")
+                            
+                            # Bu kaydın chromedriver maliyeti (önceki kayıttan bu yana yapılan istekler)
+                            self.record_round_trips.append(self.round_trips - round_trip_mark)
+                            round_trip_mark = self.round_trips
+                            self.logger.info(f"Toplanan işletme sayısı: {collected} - {business_info['Ad']} "
+                                             f"({self.record_round_trips[-1]} istek)")
                             
                             # İlerleme çubuğunu güncelle
+                            # (bölgesel taramada her karo ayrı toplanır; ilerleme toplam kayıtla verilir)
                             if self.progress_callback:
-                                progress_percent = (collected / self.max_results) * 100
-                                self.progress_callback(progress_percent, collected, business_info['Ad'])
-                            
-                            # 10 tane bulunca özel bekleme ve scroll
-                            if collected == 10:
-                                self.logger.info("10 işletme bulundu, özel scroll yapılıyor...")
-                                time.sleep(1)  # 1 saniye bekle
-                                
-                                # 1 kez scroll yap
-                                self.logger.info("Özel scroll yapılıyor...")
-                                self._scroll_page()
-                                time.sleep(1)
-                                
-                                self.logger.info("Özel scroll tamamlandı, devam ediliyor...")
+                                total = len(self.business_data)
+                                progress_percent = (total / self.max_results) * 100
+                                self.progress_callback(progress_percent, total, business_info['Ad'])
                             
                     except Exception as e:
                         self.logger.warning(f"İşletme bilgisi çıkarılırken hata: {e}")
                         continue
                 
-                # Sayfayı aşağı kaydır
-                if collected < max_results:
-                    self._scroll_page()
-                    # Detaylı mod için bekleme süresi
-                    time.sleep(4)
-                    scroll_attempts += 1
-                    
-                    # Yeni içerik yüklenip yüklenmediğini kontrol et
-                    new_height = self.driver.execute_script("return document.body.scrollHeight")
-                    if new_height == last_height:
-                        # Daha agresif kaydırma dene
-                        self.logger.info("Sayfa yüksekliği değişmedi, daha agresif kaydırma deneniyor...")
-                        
-                        # Daha fazla kez kaydır - sayfa sonlarında daha derinlemesine
-                        for _ in range(5):  # 3'ten 5'e çıkarıldı
-                            self._scroll_page()
-                            time.sleep(2)
-                            
-                            # Ekstra derinlemesine kaydırma
-                            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight + 1000);")
-                            time.sleep(1)
-                            
-                            new_height = self.driver.execute_script("return document.body.scrollHeight")
-                            if new_height != last_height:
-                                break
-                        
-                        # Son bir kez daha agresif kaydırma
-                        if new_height == last_height:
-                            self.logger.info("Son deneme: Çok agresif kaydırma...")
-                            for _ in range(3):
-                                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight + 2000);")
-                                time.sleep(2)
-                                self._scroll_page()
-                                time.sleep(2)
-                                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                                if new_height != last_height:
-                                    break
-                        
-                    if new_height == last_height:
-                        self.logger.info("Daha fazla sonuç bulunamadı")
-                        break
-                    last_height = new_height
+                if collected >= max_results:
+                    break
+                # Liste sonu görüldükten sonra son kartlar da okundu
+                if list_ended:
+                    self.logger.info("Liste sonuna ulaşıldı, daha fazla sonuç yok")
+                    break
+                
+                # Kaydır ve yeni kartlar gelene (veya liste bitene) kadar bekle - bütçeden artan süre kadar
+                scroll_started = time.perf_counter()
+                scroll_result = self._scroll_page(timeout=max(0.5, budget - stalled))
+                scroll_attempts += 1
+                if scroll_result == 'grew':
+                    stalled = 0.0
+                    continue
+                stalled += time.perf_counter() - scroll_started
+                if scroll_result == 'end':
+                    list_ended = True
+                elif stalled >= budget:
+                    self.logger.info(f"{stalled:.1f} sn boyunca yeni sonuç gelmedi, daha fazla sonuç yok")
+                    break
                 
             except Exception as e:
                 self.logger.error(f"Veri toplama sırasında hata: {e}")
                 break
         
-        # İstenilen sayıya ulaşıldı mı kontrol et
+        # Tükenen feed'de boşa geçen süre (bölgesel taramada karolar toplanır)
+        self.metrics['exhausted_wait_seconds'] = self.metrics.get('exhausted_wait_seconds', 0.0) + stalled
+        return cursor
+    
+    def _stall_budget(self, patient=True):
+        """Feed büyümeden beklenecek en fazla süre (karolarda kısa)"""
+        return self.stall_budget if patient else min(self.stall_budget, self.retry_wait_timeout)
+    
+    def _collect_network_data(self, max_results, patient=True):
+        """
+        İşletmeleri Maps'in arama yanıtlarından topla (ağ modu)
+        
+        Kartlar DOM'dan okunmaz; kaydırma yalnızca sonraki sonuç sayfasının
+        isteğini tetikler. Hiç yanıt yakalanamazsa toplu DOM moduna dönülür.
+        """
+        collected = 0
+        seen = 0
+        stalled = 0.0
+        budget = self._stall_budget(patient)
+        capture = self.network_capture
+        
+        self._wait_until(feed_has_children())
+        round_trip_mark = self.round_trips
+        responses = capture.initial_state() + capture.drain()
+        if not responses:
+            self.logger.warning("Ağ yanıtı yakalanamadı, toplu DOM moduna geçiliyor")
+            self.extraction_mode = 'bulk'
+            return self._collect_business_data(max_results, patient=patient)
+        
+        while collected < max_results and not self.stop_requested:
+            for url, body in responses:
+                for record in map(BusinessRecord.from_dict, records_from_response(url, body)):
+                    if collected >= max_results or self.stop_requested:
+                        break
+                    seen += 1
+                    place_id = record.get('Yer ID')
+                    if place_id and place_id in self.seen_place_ids:
+                        continue
+                    duplicate_status = self._check_duplicate(record)
+                    if duplicate_status == DUPLICATE:
+                        continue
+                    if place_id:
+                        self.seen_place_ids.add(place_id)
+                    record['Sıra'] = len(self.business_data) + 1
+                    
+                    # Yanıtta telefonu olmayanlar paralel havuzda tamamlanabilir
+                    deferred = (self.detail_workers > 0 and duplicate_status != KNOWN and not record['Telefon']
+                                and record.get('Harita Linki'))
+                    if deferred:
+                        self.pending_details.append(record)
+                    
+                    self.business_data.append(record)
+                    self.journal.append(record)
+                    self._remember(record)
+                    if not deferred:
+                        self._emit(record)
+                    collected += 1
+                    self.record_round_trips.append(self.round_trips - round_trip_mark)
+                    round_trip_mark = self.round_trips
+                    
+                    if self.progress_callback:
+                        total = len(self.business_data)
+                        self.progress_callback((total / self.max_results) * 100, total, record['Ad'])
+            
+            self.logger.info(f"Ağ yanıtlarından toplanan işletme sayısı: {collected} ({capture.responses} yanıt)")
+            if collected >= max_results:
+                break
+            
+            # Kaydırma sonraki sayfanın isteğini tetikler; yanıt DOM'dan biraz sonra gelebilir
+            scroll_started = time.perf_counter()
+            scroll_result = self._scroll_page(timeout=max(0.5, budget - stalled))
+            responses = capture.drain() or self._wait_until(
+                lambda driver: capture.drain() or False, timeout=self.retry_wait_timeout
+            ) or []
+            if responses:
+                stalled = 0.0
+                continue
+            stalled += time.perf_counter() - scroll_started
+            if scroll_result == 'end':
+                self.logger.info("Liste sonuna ulaşıldı, daha fazla sonuç yok")
+                break
+            if stalled >= budget:
+                self.logger.info(f"{stalled:.1f} sn boyunca yeni yanıt gelmedi, daha fazla sonuç yok")
+                break
+        
+        self.metrics['exhausted_wait_seconds'] = self.metrics.get('exhausted_wait_seconds', 0.0) + stalled
+        return seen
+    
+    def _emit(self, record):
+        """Kesinleşen kaydı record_callback'e ver"""
+        if self.record_callback:
+            self.record_callback(record)
+    
+    def request_stop(self):
+        """Devam eden taramayı sıradaki kartta durdur (başka thread'den çağrılabilir; toplananlar korunur)"""
+        self.stop_requested = True
+    
+    def _report_completion(self, max_results):
+        """İstenilen sayıya ulaşıldıysa bildirim ve rapor göster"""
         if len(self.business_data) >= max_results:
             self.logger.info(f"🎉 HEDEF ULAŞILDI! {len(self.business_data)} işletme bulundu (Hedef: {max_results})")
-            self._show_completion_notification(len(self.business_data), max_results)
-            self._print_scan_report()
+            if self.notify:
+                self._show_completion_notification(len(self.business_data), max_results)
+                self._print_scan_report()
         else:
             self.logger.info(f"Toplam {len(self.business_data)} işletme bulundu (Hedef: {max_results})")
     
+    def _find_business_cards(self):
+        """İşletme kartlarını selector'ları öğrenilmiş sırayla deneyerek bul (DOM modu)"""
+        attempts = []
+        cards = []
+        for selector in self.selector_resolver.order('cards', CARD_LIST_SELECTORS):
+            started = time.perf_counter()
+            try:
+                cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
+            except Exception:
+                cards = []
+            attempts.append((selector, bool(cards), time.perf_counter() - started))
+            if cards:
+                self.logger.info(f"Selector '{selector}' ile {len(cards)} kart bulundu")
+                break
+        
+        self.selector_resolver.record('cards', attempts)
+        return cards
+    
+    def _fetch_raw_cards(self, start=0):
+        """
+        Feed'deki kartların ham alanlarını tek çağrıyla al
+        
+        Toplu modda alanlar sayfada script ile, html modunda feed HTML'i
+        alınıp lxml ile süreç içinde okunur.
+        """
+        try:
+            # Ölü selector'lar gönderilmez, kalanlar öğrenilmiş sırayla gider
+            field_selectors = {
+                field: self.selector_resolver.order(field, selectors)
+                for field, selectors in CARD_FIELD_SELECTORS.items()
+            }
+            if self.extraction_mode == 'stream':
+                return self._fetch_stream_cards(field_selectors, start)
+            if self.extraction_mode == 'html':
+                feed_html = self.driver.execute_script(FEED_HTML_SCRIPT) or ''
+                if feed_html and os.environ.get('MAPMINER_RECORD_HTML'):
+                    save_snapshot(os.environ['MAPMINER_RECORD_HTML'], feed_html)
+                return parse_feed_html(feed_html, field_selectors, start)
+            return self.driver.execute_script(BULK_CARDS_SCRIPT, field_selectors, start) or []
+        except Exception as e:
+            self.logger.warning(f"Toplu kart okuma hatası: {e}")
+            return []
+    
+    def _fetch_stream_cards(self, field_selectors, start):
+        """
+        Akış modu: gözlemcinin tamponundaki yeni kartlar
+        
+        Yeni aramada (start=0) veya feed yeniden çizildiyse gözlemci kurulur.
+        Kaydırma beklerken gelen kartlar varsa ek istek yapılmaz.
+        """
+        cards, self._stream_buffer = self._stream_buffer, []
+        if start == 0:
+            cards = self.driver.execute_script(STREAM_INSTALL_SCRIPT, field_selectors, 0) or []
+        elif not cards:
+            batch = self.driver.execute_script(STREAM_DRAIN_SCRIPT)
+            if batch is None:
+                self.logger.info("Feed yenilendi, kart gözlemcisi yeniden kuruluyor")
+                batch = {'cards': self.driver.execute_script(STREAM_INSTALL_SCRIPT, field_selectors, start) or []}
+            cards = batch['cards']
+        return [card for card in cards if card['index'] >= start]
+    
+    def _stream_next(self, timeout=None):
+        """
+        Akış modu: feed'i sayfa içinden kaydır, yeni kart gelene kadar sayfada bekle
+        
+        Returns:
+            'grew' (kartlar tampona alındı), 'end' (liste sonu) veya False (zaman aşımı)
+        """
+        limit = self.wait_timeout if timeout is None else min(timeout, self.wait_timeout)
+        try:
+            batch = self.driver.execute_async_script(STREAM_NEXT_SCRIPT, int(limit * 1000))
+        except Exception as e:
+            self.logger.warning(f"Akış bekleme hatası: {e}")
+            return False
+        if batch is None:
+            # Gözlemci kayboldu; sonraki okumada yeniden kurulur
+            return False
+        self._stream_buffer.extend(batch['cards'])
+        if batch['cards']:
+            return 'grew'
+        return 'end' if batch['ended'] else False
+    
+    def _card_identity(self, card):
+        """
+        Kartın kalıcı kimliğini ve işletme linkini döndür
+        
+        Returns:
+            tuple: (place_id, link) - bulunamayanlar boş string
+        """
+        if isinstance(card, dict):
+            return extract_place_id(card.get('href'), card.get('data')), card.get('href') or ''
+        try:
+            links = card.find_elements(By.CSS_SELECTOR, "a[href*='/maps/place/']")
+            href = links[0].get_attribute('href') if links else ''
+            return extract_place_id(href), href or ''
+        except Exception:
+            return '', ''
+    
     def _show_completion_notification(self, found_count, target_count):
         """Tamamlanma bildirimi göster"""
         try:
@@ -295,14 +982,37 @@ class GoogleMapsScraper:
             print(f"📈 Başarı Oranı: %100")
             print("-"*60)
             
-            # İstatistikler
-            with_phone = sum(1 for b in self.business_data if b.get('Telefon'))
-            with_address = sum(1 for b in self.business_data if b.get('Adres'))
-            with_rating = sum(1 for b in self.business_data if b.get('Puan/Yorum'))
-            
-            print(f"📞 Telefon: {with_phone}/{len(self.business_data)} (%{with_phone/len(self.business_data)*100:.1f})")
-            print(f"📍 Adres: {with_address}/{len(self.business_data)} (%{with_address/len(self.business_data)*100:.1f})")
-            print(f"⭐ Puan: {with_rating}/{len(self.business_data)} (%{with_rating/len(self.business_data)*100:.1f})")
+            # İstatistikler (kayıtlar yalnızca akışla verildiyse alan doluluğu bilinmez)
+            if isinstance(self.business_data, RecordCount):
+                print("ℹ️ Kayıtlar akışla verildi, scraper'da tutulmadı")
+            else:
+                with_phone = sum(1 for b in self.business_data if b.get('Telefon'))
+                with_address = sum(1 for b in self.business_data if b.get('Adres'))
+                with_rating = sum(1 for b in self.business_data if b.get('Puan/Yorum'))
+                
+                print(f"📞 Telefon: {with_phone}/{len(self.business_data)} (%{with_phone/len(self.business_data)*100:.1f})")
+                print(f"📍 Adres: {with_address}/{len(self.business_data)} (%{with_address/len(self.business_data)*100:.1f})")
+                print(f"⭐ Puan: {with_rating}/{len(self.business_data)} (%{with_rating/len(self.business_data)*100:.1f})")
+            print(f"🔁 Kayıt başına istek: {self.round_trips_per_record():.1f} (mod: {self.extraction_mode})")
+            if self.detail_timings:
+                print(f"⏱️ Ortalama detay süresi: {sum(self.detail_timings) / len(self.detail_timings):.2f} sn")
+            if self.metrics.get('bytes_transferred'):
+                print(f"📦 Aktarılan veri: {self.metrics['bytes_transferred'] / 1048576:.1f} MB "
+                      f"({self.metrics['requests']} istek, hafif mod: {'açık' if self.lean else 'kapalı'})")
+            if self.metrics.get('records_per_minute'):
+                print(f"🚀 Hız: {self.metrics['records_per_minute']:.1f} kayıt/dakika")
+            if self.metrics.get('duplicates_skipped') or self.metrics.get('details_reused'):
+                print(f"♻️ Tekrar: {self.metrics.get('duplicates_skipped', 0)} kayıt atlandı, "
+                      f"{self.metrics.get('details_reused', 0)} detay önceki taramalardan")
+            if self.metrics.get('exhausted_wait_seconds'):
+                print(f"⏳ Tükenen listede bekleme: {self.metrics['exhausted_wait_seconds']:.1f} sn "
+                      f"(bütçe: {self.stall_budget:.0f} sn)")
+            if self.metrics.get('tiles_searched'):
+                print(f"🧩 Bölgesel tarama: {self.metrics['tiles_searched']} karo "
+                      f"({self.metrics.get('tiles_split', 0)} doygun karo bölündü)")
+            if self.metrics.get('detail_records_per_minute'):
+                print(f"🧵 Paralel detay hızı: {self.metrics['detail_records_per_minute']:.1f} kayıt/dakika "
+                      f"({self.detail_workers} driver)")
             print("-"*60)
             
             # İlk 5 sonuç
@@ -321,96 +1031,53 @@ class GoogleMapsScraper:
             self.logger.error(f"Rapor yazdırılamadı: {e}")
 
     def _extract_business_info(self, card, index):
-        """İşletme kartından bilgileri çıkar"""
+        """
+        İşletme kartından bilgileri çıkar
+        
+        Args:
+            card: WebElement (DOM modu) veya toplu script'in döndürdüğü ham kart sözlüğü
+            index (int): Kartın feed içindeki sırası
+        """
         try:
-            business_info = {
+            # Ham kartta alanlar {alan: {selector: [eleman, ...]}} olarak gelir
+            source = (card.get('fields') or {}) if isinstance(card, dict) else card
+            
+            business_info = BusinessRecord({
                 'Sıra': index + 1,
                 'Ad': '',
                 'Adres': '',
                 'Telefon': '',
                 'Puan/Yorum': ''
-            }
+            })
             
-            # İşletme adını al - farklı selector'ları dene
-            name_selectors = [
-                "[data-value='Business name']",
-                "h3", "h2", "[role='heading']",
-                ".fontHeadlineSmall",
-                ".qBF1Pd",
-                ".fontDisplayLarge",
-                ".fontHeadlineMedium"
-            ]
+            # İşletme adını al - selector'lar öğrenilmiş sırayla denenir
+            business_info['Ad'] = self._resolve_field('name', source, NAME_SELECTORS, self._text_of)
             
-            for selector in name_selectors:
-                try:
-                    name_element = card.find_element(By.CSS_SELECTOR, selector)
-                    if name_element.text.strip():
-                        business_info['Ad'] = name_element.text.strip()
-                        break
-                except:
-                    continue
+            # Eğer isim bulunamadıysa diğer alanlar için istek yapmadan çık
+            if not business_info['Ad']:
+                return None
             
             # Ana sayfada telefon ve adres genellikle yok, sadece puan var
             # Bu bilgiler detaylı sayfada bulunur
             
-            # Website bilgisini al
-            try:
-                website_element = card.find_element(By.CSS_SELECTOR, "[data-item-id='authority']")
-                business_info['Website'] = website_element.text.strip()
-            except:
-                pass
-            
-            # Puan ve yorum sayısını al (yeni yöntem)
-            self._extract_rating_new_way(card, business_info)
-            
-            # Kategori bilgisini al
-            try:
-                category_element = card.find_element(By.CSS_SELECTOR, "[data-value='Category']")
-                business_info['Kategori'] = category_element.text.strip()
-            except:
-                pass
+            # Website, kategori, açılış saatleri, durum, fiyat seviyesi
+            for key, selector in OPTIONAL_FIELD_SELECTORS.items():
+                value = self._resolve_field(key, source, [selector], self._text_of)
+                if value:
+                    business_info[key] = value
             
-            # Açılış saatleri
-            try:
-                hours_element = card.find_element(By.CSS_SELECTOR, "[data-item-id='oh']")
-                business_info['Açılış Saatleri'] = hours_element.text.strip()
-            except:
-                pass
+            # Alternatif fiyat selector'ları
+            if 'Fiyat Seviyesi' not in business_info:
+                price = self._resolve_field('price_fallback', source, PRICE_FALLBACK_SELECTORS, self._price_of)
+                if price:
+                    business_info['Fiyat Seviyesi'] = price
             
-            # Durum (açık/kapalı)
-            try:
-                status_element = card.find_element(By.CSS_SELECTOR, "[data-value='Open hours status']")
-                business_info['Durum'] = status_element.text.strip()
-            except:
-                pass
-            
-            # Fiyat seviyesi
-            try:
-                price_element = card.find_element(By.CSS_SELECTOR, "[data-value='Price']")
-                business_info['Fiyat Seviyesi'] = price_element.text.strip()
-            except:
-                # Alternatif fiyat selector'ları
-                price_selectors = [".fontBodyMedium", ".fontBodySmall"]
-                for selector in price_selectors:
-                    try:
-                        elements = card.find_elements(By.CSS_SELECTOR, selector)
-                        for elem in elements:
-                            text = elem.text.strip()
-                            if '₺' in text or 'TL' in text or 'price' in text.lower():
-                                business_info['Fiyat Seviyesi'] = text
-                                break
-                        if business_info['Fiyat Seviyesi']:
-                            break
-                    except:
-                        continue
+            if isinstance(card, dict) and card.get('href'):
+                business_info['Harita Linki'] = card['href']
             
             # Detaylı bilgileri ayrı ayrı al
-            self._extract_detailed_info_from_card(card, business_info)
+            self._extract_detailed_info_from_card(source, business_info)
             
-            # Eğer isim bulunamadıysa None döndür
-            if not business_info['Ad']:
-                return None
-                
             return business_info
             
         except Exception as e:
@@ -428,276 +1095,167 @@ class GoogleMapsScraper:
         except Exception as e:
             self.logger.warning(f"Detaylı bilgi çıkarma hatası: {e}")
     
-    def _extract_phone_new_way(self, card, business_info):
-        """Yeni yöntemle telefon numarası çıkar - GOOGLE MAPS YAPISINA UYGUN"""
-        import re
+    def _resolve_field(self, field, card, selectors, picker):
+        """
+        Bir alanı selector'ları öğrenilmiş sırayla deneyerek çöz
         
-        if business_info['Telefon']:  # Zaten telefon var
-            return
+        Args:
+            field (str): Alan adı (istatistik anahtarı)
+            card: WebElement veya ham kartın {alan: {selector: [eleman]}} sözlüğü
+            selectors (list): Aday selector'lar
+            picker (function): Elemandan değer çıkaran fonksiyon; uygun değilse boş döner
         
-        # Google Maps'in gerçek yapısına uygun selector'lar
-        phone_selectors = [
-            # Yeni Google Maps yapısı
-            "[data-item-id^='phone']",
-            "button[aria-label*='Telefon:']",
-            "a[href^='tel:']",
-            # Text elementleri
-            ".Io6YTe.fontBodyMedium"
-        ]
-        
-        for selector in phone_selectors:
+        Returns:
+            str: Bulunan değer, bulunamazsa boş string
+        """
+        attempts = []
+        value = ''
+        for selector in self.selector_resolver.order(field, selectors):
+            started = time.perf_counter()
             try:
-                elements = card.find_elements(By.CSS_SELECTOR, selector)
+                if isinstance(card, dict):
+                    elements = card.get(field, {}).get(selector, [])
+                else:
+                    elements = card.find_elements(By.CSS_SELECTOR, selector)
                 for element in elements:
-                    # aria-label'den telefon çıkar
-                    aria_label = element.get_attribute('aria-label') or ''
-                    if 'Telefon:' in aria_label:
-                        phone_match = re.search(r'Telefon:\s*([0-9\s\(\)]+)', aria_label)
-                        if phone_match:
-                            phone = phone_match.group(1).strip()
-                            if self._is_valid_phone(phone):
-                                business_info['Telefon'] = phone
-                                return
-                    
-                    # href'den telefon çıkar
-                    href = element.get_attribute('href') or ''
-                    if 'tel:' in href:
-                        phone = href.replace('tel:', '').strip()
-                        if self._is_valid_phone(phone):
-                            business_info['Telefon'] = phone
-                            return
-                    
-                    # Text'ten telefon çıkar
-                    text = element.text.strip()
-                    if text and self._is_valid_phone(text):
-                        business_info['Telefon'] = text
-                        return
-                        
+                    value = picker(element)
+                    if value:
+                        break
             except Exception:
-                continue
+                value = ''
+            attempts.append((selector, bool(value), time.perf_counter() - started))
+            if value:
+                break
+        
+        self.selector_resolver.record(field, attempts)
+        return value
+    
+    def _element_value(self, element, name):
+        """Ham eleman sözlüğünden veya WebElement'ten aria-label / href / metin oku"""
+        if isinstance(element, dict):
+            return element[{'aria-label': 'a', 'href': 'h', 'text': 't'}[name]]
+        if name == 'text':
+            return element.text.strip()
+        return element.get_attribute(name) or ''
+    
+    def _text_of(self, element):
+        """Elemanın metni"""
+        return self._element_value(element, 'text')
+    
+    def _price_of(self, element):
+        """Fiyat göstergesi içeren metin"""
+        text = self._element_value(element, 'text')
+        if '₺' in text or 'TL' in text or 'price' in text.lower():
+            return text
+        return ''
+    
+    def _phone_of(self, element):
+        """Elemandan geçerli telefon numarası çıkar"""
+        # aria-label'den telefon çıkar
+        aria_label = self._element_value(element, 'aria-label')
+        if 'Telefon:' in aria_label:
+            phone = text_classifier.phone_from_label(aria_label)
+            if phone and text_classifier.is_valid_phone(phone):
+                return phone
+        
+        # href'den telefon çıkar
+        href = self._element_value(element, 'href')
+        if 'tel:' in href:
+            phone = href.replace('tel:', '').strip()
+            if text_classifier.is_valid_phone(phone):
+                return phone
+        
+        # Text'ten telefon çıkar
+        text = self._element_value(element, 'text')
+        if text and text_classifier.is_valid_phone(text):
+            return text
+        return ''
+    
+    def _address_of(self, element):
+        """Elemandan temiz adres çıkar"""
+        # aria-label'den adres çıkar
+        aria_label = self._element_value(element, 'aria-label')
+        if 'Adres:' in aria_label:
+            address = text_classifier.address_from_label(aria_label)
+            if address and text_classifier.is_clean_address(address):
+                return address
+        
+        # Text'ten adres çıkar
+        text = self._element_value(element, 'text')
+        if text and text_classifier.is_clean_address(text):
+            return text
+        return ''
+    
+    def _rating_of(self, element):
+        """Elemandan puan/yorum bilgisi çıkar"""
+        # aria-label'den puan çıkar
+        aria_label = self._element_value(element, 'aria-label')
+        if aria_label and ('star' in aria_label.lower() or 'yıldız' in aria_label.lower()):
+            return aria_label
+        
+        # Text'ten puan çıkar
+        text = self._element_value(element, 'text')
+        if text and text_classifier.find_rating(text):
+            return text
+        return ''
+    
+    def _extract_phone_new_way(self, card, business_info):
+        """Yeni yöntemle telefon numarası çıkar - GOOGLE MAPS YAPISINA UYGUN"""
+        if business_info['Telefon']:  # Zaten telefon var
+            return
+        business_info['Telefon'] = self._resolve_field('phone', card, PHONE_SELECTORS, self._phone_of)
     
     def _extract_address_new_way(self, card, business_info):
         """Yeni yöntemle adres çıkar - GOOGLE MAPS YAPISINA UYGUN"""
-        import re
-        
         if business_info['Adres']:  # Zaten adres var
             return
-        
-        # Google Maps'in gerçek yapısına uygun selector'lar
-        address_selectors = [
-            # Yeni Google Maps yapısı
-            "[data-item-id='address']",
-            "button[aria-label*='Adres:']",
-            # Text elementleri
-            ".Io6YTe.fontBodyMedium"
-        ]
-        
-        for selector in address_selectors:
-            try:
-                elements = card.find_elements(By.CSS_SELECTOR, selector)
-                for element in elements:
-                    # aria-label'den adres çıkar
-                    aria_label = element.get_attribute('aria-label') or ''
-                    if 'Adres:' in aria_label:
-                        address_match = re.search(r'Adres:\s*(.+)', aria_label)
-                        if address_match:
-                            address = address_match.group(1).strip()
-                            if self._is_clean_address(address):
-                                business_info['Adres'] = address
-                                return
-                    
-                    # Text'ten adres çıkar
-                    text = element.text.strip()
-                    if text and self._is_clean_address(text):
-                        business_info['Adres'] = text
-                        return
-                        
-            except Exception:
-                continue
+        business_info['Adres'] = self._resolve_field('address', card, ADDRESS_SELECTORS, self._address_of)
     
     def _extract_rating_new_way(self, card, business_info):
         """Yeni yöntemle puan çıkar"""
-        import re
-        
         if business_info['Puan/Yorum']:  # Zaten puan var
             return
-        
-        # Google Maps'in yeni yapısına uygun selector'lar
-        rating_selectors = [
-            # Yeni Google Maps yapısı
-            "[role='img']",
-            "[aria-label*='star']",
-            "[aria-label*='yıldız']",
-            # Text elementleri
-            ".fontDisplayMedium",
-            ".fontBodySmall",
-            # Spesifik puan göstergeleri
-            "[data-value*='rating']"
-        ]
-        
-        for selector in rating_selectors:
-            try:
-                elements = card.find_elements(By.CSS_SELECTOR, selector)
-                for element in elements:
-                    text = element.text.strip()
-                    aria_label = element.get_attribute('aria-label') or ''
-                    
-                    # aria-label'den puan çıkar
-                    if aria_label and ('star' in aria_label.lower() or 'yıldız' in aria_label.lower()):
-                        business_info['Puan/Yorum'] = aria_label
-                        return
-                    
-                    # Text'ten puan çıkar
-                    if text and re.search(r'\d+,\d+\(\d+\)', text):
-                        business_info['Puan/Yorum'] = text
-                        return
-                        
-            except Exception:
-                continue
+        business_info['Puan/Yorum'] = self._resolve_field('rating', card, RATING_SELECTORS, self._rating_of)
+    
+    # Metin kontrolleri - derlenmiş kalıplar text_classifier'da
     
     def _is_valid_phone(self, text):
         """Telefon numarası geçerliliğini kontrol et - ESNEK YAKLAŞIM"""
-        import re
-        
-        if not text:
-            return False
-        
-        # Temizle
-        clean_text = re.sub(r'[^\d]', '', text)
-        
-        # En az 7, en fazla 11 haneli olmalı (daha esnek)
-        if len(clean_text) < 7 or len(clean_text) > 11:
-            return False
-        
-        # Türkiye telefon numarası formatları (daha esnek)
-        phone_patterns = [
-            r'\(\d{3,4}\)\s*\d{3,4}\s*\d{2,4}',  # (0212) 123 45 67
-            r'0\d{3,4}\s*\d{3,4}\s*\d{2,4}',      # 0212 123 45 67
-            r'\d{3,4}\s*\d{3,4}\s*\d{2,4}',       # 212 123 45 67
-            r'05\d{2}\s*\d{3}\s*\d{2}\s*\d{2}',   # 0543 823 00 00
-            r'5\d{2}\s*\d{3}\s*\d{2}\s*\d{2}',    # 543 823 00 00
-            r'\+90\s*\d{3,4}\s*\d{3,4}\s*\d{2,4}', # +90 212 123 45 67
-            r'90\s*\d{3,4}\s*\d{3,4}\s*\d{2,4}',   # 90 212 123 45 67
-            r'\d{3,4}\s*\d{3,4}\s*\d{2,4}',       # 212 123 45 67
-            r'\d{3,4}\s*\d{3,4}',                  # 212 123 45
-            r'\d{3,4}\s*\d{3,4}\s*\d{2}',         # 212 123 45
-        ]
-        
-        for pattern in phone_patterns:
-            if re.search(pattern, text):
-                return True
-        
-        return False
+        return text_classifier.is_valid_phone(text)
     
     def _is_valid_address(self, text):
         """Adres geçerliliğini kontrol et - ESNEK YAKLAŞIM"""
-        import re
-        
-        if not text:
-            return False
-        
-        # Adres olmayan metinleri filtrele
-        invalid_patterns = [
-            r'^\d+,\d+\(\d+\)$',  # Puan bilgisi
-            r'^\d+,\d+\(\d+\)',   # Puan bilgisi ile başlayan
-            r'^\d+$',             # Sadece sayı
-            r'^[A-Za-z\s]{1,10}$', # Çok kısa sadece harf
-        ]
-        
-        for pattern in invalid_patterns:
-            if re.search(pattern, text):
-                return False
-        
-        # Geçerli adres göstergeleri
-        address_indicators = [
-            'sokak', 'sk', 'cadde', 'cd', 'bulvar', 'blv', 'mahalle', 'mah',
-            'no:', 'no ', 'apt', 'daire', 'kat', 'sok', 'cad', 'blv',
-            'taksi', 'durak', 'durağı', 'merkez', 'plaza', 'avm', 'center'
-        ]
-        
-        text_lower = text.lower()
-        for indicator in address_indicators:
-            if indicator in text_lower:
-                return True
-        
-        # Uzun metinler adres olabilir (daha esnek)
-        if len(text) > 10:
-            return True
-        
-        return False
+        return text_classifier.is_valid_address(text)
     
     def _is_clean_address(self, text):
         """Temiz adres kontrolü - sadece gerçek adres metinleri"""
-        import re
-        
-        if not text:
-            return False
-        
-        # Adres olmayan metinleri filtrele
-        invalid_patterns = [
-            r'^\d+,\d+\(\d+\)$',  # Puan bilgisi
-            r'^\d+,\d+\(\d+\)',   # Puan bilgisi ile başlayan
-            r'^\d+$',             # Sadece sayı
-            r'^[A-Za-z\s]{1,10}$', # Çok kısa sadece harf
-            r'\(0\d{3,4}\)',      # Telefon numarası
-            r'0\d{3,4}\s*\d{3,4}', # Telefon numarası
-            r'Web sitesi',        # Web sitesi
-            r'Yol tarifi',        # Yol tarifi
-            r'Şoförleri',         # Yorum metni
-            r'Deneyimli',         # Yorum metni
-            r'Günün',             # Yorum metni
-            r'Taksi durağı',      # Genel ifade
-        ]
-        
-        for pattern in invalid_patterns:
-            if re.search(pattern, text):
-                return False
-        
-        # Geçerli adres göstergeleri
-        address_indicators = [
-            'sokak', 'sk', 'cadde', 'cd', 'bulvar', 'blv', 'mahalle', 'mah',
-            'no:', 'no ', 'apt', 'daire', 'kat', 'sok', 'cad', 'blv',
-            'profesör', 'doktor', 'caddesi', 'mimoza', 'meşrutiyet',
-            'paşa', 'atif', 'yılmaz', 'yüzyıl', 'galericiler'
-        ]
-        
-        text_lower = text.lower()
-        for indicator in address_indicators:
-            if indicator in text_lower:
-                return True
-        
-        # Uzun metinler adres olabilir (daha esnek)
-        if len(text) > 20:
-            return True
-        
-        return False
+        return text_classifier.is_clean_address(text)
     
     def _parse_combined_text(self, text, business_info):
         """Birleşik metni sadece gerekli bilgilere böl"""
-        import re
-        
         lines = text.split('\n')
         
         # Gelişmiş telefon numarası çıkarma
         self._extract_phone_numbers(text, business_info)
         
         # Puan/Yorum bilgisini çıkar (tüm metinden)
-        rating_match = re.search(r'(\d+,\d+\(\d+\))', text)
-        if rating_match and not business_info['Puan/Yorum']:
-            business_info['Puan/Yorum'] = rating_match.group(1)
+        rating = text_classifier.find_rating(text)
+        if rating and not business_info['Puan/Yorum']:
+            business_info['Puan/Yorum'] = rating
         
-        # Her satırı analiz et
+        # Her satırı analiz et - satır başına tek tarama (classify tüm etiketleri birlikte bulur)
         for line in lines:
             line = line.strip()
             if not line:
                 continue
+            labels = text_classifier.classify(line)
             
             # Puan bilgisini atla (zaten var)
-            if re.match(r'^\d+,\d+\(\d+\)$', line):
+            if labels.get('rating') == line:
                 continue
             
             # Adres çıkar (uzun satırlar ve adres göstergeleri)
-            if self._is_address(line) and not business_info['Adres']:
+            if 'address' in labels and len(line) > 15 and not business_info['Adres']:
                 business_info['Adres'] = line
                 continue
         
@@ -705,199 +1263,231 @@ class GoogleMapsScraper:
         if not business_info['Adres']:
             longest_line = max(lines, key=len) if lines else ""
             if (len(longest_line) > 20 and 
-                not self._is_phone_number(longest_line) and 
-                not re.match(r'^\d+,\d+\(\d+\)$', longest_line) and
-                not re.search(r'\d+,\d+\(\d+\)', longest_line)):
+                'rating' not in text_classifier.classify(longest_line) and 
+                not text_classifier.is_phone_number(longest_line)):
                 business_info['Adres'] = longest_line
     
     def _extract_phone_numbers(self, text, business_info):
-        """Gelişmiş telefon numarası çıkarma"""
-        import re
-        
+        """Gelişmiş telefon numarası çıkarma - en uzun geçerli numara seçilir"""
         if business_info['Telefon']:  # Zaten telefon var
             return
         
-        # Türkiye telefon numarası formatları
-        phone_patterns = [
-            # (0212) 123 45 67
-            r'\(\d{3,4}\)\s*\d{3,4}\s*\d{2,4}',
-            # 0212 123 45 67
-            r'0\d{3,4}\s*\d{3,4}\s*\d{2,4}',
-            # 212 123 45 67
-            r'\d{3,4}\s*\d{3,4}\s*\d{2,4}',
-            # 0543 823 00 00
-            r'05\d{2}\s*\d{3}\s*\d{2}\s*\d{2}',
-            # 543 823 00 00
-            r'5\d{2}\s*\d{3}\s*\d{2}\s*\d{2}',
-            # +90 212 123 45 67
-            r'\+90\s*\d{3,4}\s*\d{3,4}\s*\d{2,4}',
-            # 90 212 123 45 67
-            r'90\s*\d{3,4}\s*\d{3,4}\s*\d{2,4}',
-            # 212-123-45-67
-            r'\d{3,4}-\d{3,4}-\d{2,4}',
-            # 212.123.45.67
-            r'\d{3,4}\.\d{3,4}\.\d{2,4}',
-            # 2121234567 (10 haneli)
-            r'\b\d{10}\b',
-            # 212123456 (9 haneli)
-            r'\b\d{9}\b'
-        ]
-        
-        found_phones = []
-        
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                # Temizle ve kontrol et
-                clean_phone = re.sub(r'[^\d]', '', match)
-                if len(clean_phone) >= 9:  # En az 9 haneli olmalı
-                    found_phones.append(match.strip())
-        
-        if found_phones:
-            # En uzun ve en geçerli telefon numarasını seç
-            best_phone = max(found_phones, key=len)
-            business_info['Telefon'] = best_phone
+        phone = text_classifier.find_phone(text)
+        if phone:
+            business_info['Telefon'] = phone
     
     def _is_phone_number(self, text):
         """Telefon numarası kontrolü"""
-        phone_patterns = [
-            r'\(\d{3,4}\)\s*\d{3,4}\s*\d{2,4}',  # (0212) 123 45 67
-            r'\d{3,4}\s*\d{3,4}\s*\d{2,4}',      # 0212 123 45 67
-            r'\+90\s*\d{3,4}\s*\d{3,4}\s*\d{2,4}', # +90 212 123 45 67
-        ]
-        import re
-        for pattern in phone_patterns:
-            if re.search(pattern, text):
-                return True
-        return False
+        return text_classifier.is_phone_number(text)
     
     def _is_address(self, text):
         """Adres kontrolü"""
-        address_indicators = ['Mah', 'Cad', 'Sok', 'No:', 'Blok', 'Kat', 'Daire', 'Mahallesi', 'Caddesi', 'Sokağı', 'Sk.', 'Cd.', 'Apt.', 'Sitesi']
-        return any(indicator in text for indicator in address_indicators) and len(text) > 15
+        return text_classifier.is_address(text)
     
     def _is_category(self, text):
         """Kategori kontrolü"""
-        category_indicators = [
-            'Taksi', 'Eczane', 'Restoran', 'Market', 'Cafe', 'Otel', 'Hastane', 
-            'Okul', 'Banka', 'Emlak', 'Berber', 'Kuaför', 'Spor', 'Fitness',
-            'Durağı', 'Merkezi', 'Şubesi', 'Mağazası', 'Dükkanı', 'Çilingir',
-            'Anahtarcı', 'Hizmetleri', 'Servisi', 'Elektronik', 'Oto'
-        ]
-        return any(indicator in text for indicator in category_indicators) and len(text) < 60
+        return text_classifier.is_category(text)
     
     def _is_website(self, text):
         """Website kontrolü"""
-        website_indicators = ['www.', 'http', '.com', '.tr', '.org', '.net']
-        return any(indicator in text.lower() for indicator in website_indicators)
+        return text_classifier.is_website(text)
     
     def _is_opening_hours(self, text):
         """Açılış saatleri kontrolü"""
-        time_patterns = [
-            r'\d{1,2}:\d{2}',  # 09:00
-            r'\d{1,2}\.\d{2}',  # 09.00
-            r'Pazartesi|Salı|Çarşamba|Perşembe|Cuma|Cumartesi|Pazar',
-            r'Kapalı|Açık|Hafta|Gün'
-        ]
-        import re
-        for pattern in time_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
+        return text_classifier.is_opening_hours(text)
     
     def _is_status(self, text):
         """Durum kontrolü"""
-        status_indicators = ['Açık', 'Kapalı', 'Open', 'Closed', 'Şu anda açık', 'Şu anda kapalı']
-        return any(indicator in text for indicator in status_indicators)
+        return text_classifier.is_status(text)
     
-    def _scroll_page(self):
-        """Sayfayı aşağı kaydır - GELİŞTİRİLMİŞ"""
+    def _wait_until(self, condition, timeout=None):
+        """
+        Koşul sağlanana kadar bekle - tüm beklemeler buradan geçer
+        
+        Args:
+            condition (callable): driver alan bekleme koşulu (wait_conditions)
+            timeout (float): Bekleme süresi; wait_timeout üst sınırını aşamaz
+        
+        Returns:
+            Koşulun döndürdüğü değer, zaman aşımında False
+        """
+        limit = self.wait_timeout if timeout is None else min(timeout, self.wait_timeout)
         try:
-            # Google Maps'in yeni yapısı için gelişmiş kaydırma
-            # Önce ana sonuçlar panelini bul
-            results_panel = self.driver.find_element(By.CSS_SELECTOR, "[role='main']")
-            
-            # Panel içinde kaydır
-            self.driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", results_panel)
-            time.sleep(1)
-            
-            # Alternatif: Sonuç listesini bul ve kaydır
-            try:
-                results_list = self.driver.find_element(By.CSS_SELECTOR, "[role='feed']")
-                self.driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", results_list)
-                time.sleep(1)
-            except:
-                pass
-            
-            # Son olarak genel sayfa kaydırma - daha agresif
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight + 500);")
-            time.sleep(2)  # Kaydırma sonrası bekle
-            
-            # Ekstra kaydırma - sayfa sonlarında daha derinlemesine
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight + 1000);")
-            time.sleep(1)
-            
-            # Daha fazla sonuç yüklemek için "Daha fazla göster" butonunu ara
-            # 'Daha fazla göster' butonu kaldırıldı - scroll otomatik yükler
-                
+            return WebDriverWait(self.driver, limit, poll_frequency=0.2).until(condition)
+        except TimeoutException:
+            return False
+    
+    def _scroll_page(self, timeout=None):
+        """
+        Sayfayı aşağı kaydır ve yeni kartların yüklenmesini bekle
+        
+        Returns:
+            'grew' (yeni kart geldi), 'end' (liste sonu) veya False (zaman aşımı)
+        """
+        if self.extraction_mode == 'stream':
+            return self._stream_next(timeout)
+        try:
+            # Feed, sonuç paneli ve sayfa tek script çağrısında kaydırılır; önceki durum da aynı çağrıda okunur
+            previous = scroll_feed(self.driver)
         except Exception as e:
             self.logger.warning(f"Kaydırma hatası: {e}")
-            # Son çare: genel sayfa kaydırma
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            previous = feed_state(self.driver)
+        
+        # Sabit uyku yerine feed (kart sayısı veya kendi yüksekliği) büyüyene ya da liste bitene kadar bekle
+        return self._wait_until(feed_grew_or_ended(previous.count, previous.height), timeout)
     
 
-    def get_detailed_info(self, business_index):
-        """Belirli bir işletmenin detaylı bilgilerini al"""
+    def get_detailed_info(self, business_index=None, card=None, expected_name=None):
+        """
+        Belirli bir işletmenin detaylı bilgilerini al
+        
+        Kart listesi yeniden taranmaz: toplayıcının bulduğu kart tutamacı (card)
+        doğrudan tıklanır; yoksa kart indeksle tek script çağrısında bulunur.
+        
+        Args:
+            business_index (int): Kartın feed içindeki sırası (card yoksa kullanılır)
+            card: WebElement veya toplu moddaki ham kart sözlüğü
+            expected_name (str): Detay panelinde beklenen işletme adı
+        """
         try:
-            # İşletme kartına tıkla
-            business_cards = self.driver.find_elements(By.CSS_SELECTOR, ".Nv2PK")
-            if not business_cards:
-                business_cards = self.driver.find_elements(By.CSS_SELECTOR, "[data-result-index]")
+            started = time.perf_counter()
             
-            if business_cards and business_index < len(business_cards):
-                business_cards[business_index].click()
-                time.sleep(1)  # Çok hızlı bekleme
-                
-                # Detaylı bilgileri topla
-                detailed_info = {}
-                
-                # TELEFON BİLGİSİNİ AL (Google Maps yapısına uygun)
-                try:
-                    phone_elements = self.driver.find_elements(By.CSS_SELECTOR, "[data-item-id^='phone']")
-                    for element in phone_elements:
-                        aria_label = element.get_attribute('aria-label') or ''
-                        if 'Telefon:' in aria_label:
-                            import re
-                            phone_match = re.search(r'Telefon:\s*([0-9\s\(\)]+)', aria_label)
-                            if phone_match:
-                                detailed_info['Telefon'] = phone_match.group(1).strip()
-                                break
-                except:
-                    pass
-                
-                # ADRES BİLGİSİNİ AL (Google Maps yapısına uygun)
-                try:
-                    address_elements = self.driver.find_elements(By.CSS_SELECTOR, "[data-item-id='address']")
-                    for element in address_elements:
-                        aria_label = element.get_attribute('aria-label') or ''
-                        if 'Adres:' in aria_label:
-                            import re
-                            address_match = re.search(r'Adres:\s*(.+)', aria_label)
-                            if address_match:
-                                detailed_info['Adres'] = address_match.group(1).strip()
-                                break
-                except:
-                    pass
-                
-                # Sadece telefon ve adres bilgilerini al, diğer bilgileri kaldır
-                
-                return detailed_info
+            element = card.get('element') if isinstance(card, dict) else card
+            if element is None and business_index is not None:
+                element = self.driver.execute_script(CARD_BY_INDEX_SCRIPT, business_index)
+            if element is None:
+                return {}
+            
+            # İşletme kartına tıkla ve panel bu işletmenin başlığını gösterene kadar bekle
+            previous_title = detail_title(self.driver)
+            element.click()
+            self._wait_until(detail_title_matches(expected_name, previous_title), timeout=5)
+            
+            # Telefon, adres ve ek alanlar tek script çağrısıyla okunur
+            raw_detail = self.driver.execute_script(DETAIL_SCRIPT, expected_name or '') or {}
+            detailed_info = self._parse_detail_fields(raw_detail)
+            
+            self.detail_timings.append(time.perf_counter() - started)
+            return detailed_info
                 
         except Exception as e:
             self.logger.error(f"Detaylı bilgi alınırken hata: {e}")
             return {}
     
+    def fetch_place_details(self, place_url, expected_name=None):
+        """
+        İşletme linkini doğrudan açıp detay panelini oku (paralel zenginleştirme işçileri kullanır)
+        
+        Args:
+            place_url (str): /maps/place/ linki
+            expected_name (str): Beklenen işletme adı
+        """
+        started = time.perf_counter()
+        self.driver.get(place_url)
+        self._wait_until(detail_title_matches(expected_name))
+        raw_detail = self.driver.execute_script(DETAIL_SCRIPT, expected_name or '') or {}
+        self.detail_timings.append(time.perf_counter() - started)
+        return self._parse_detail_fields(raw_detail)
+    
+    def _detail_worker_factory(self):
+        """Paralel detay havuzu için bu scraper'ın ayarlarıyla headless bir kopya oluştur"""
+        return GoogleMapsScraper(headless=True, wait_timeout=self.wait_timeout, selector_stats_path=False,
+                                 notify=False, driver_path=self.driver_path, lean=self.lean, result_store=False,
+                                 dedup_index=False)
+    
+    def _parse_detail_fields(self, raw_detail):
+        """DETAIL_SCRIPT çıktısını Telefon/Adres (ve varsa ek alanlar) sözlüğüne çevir"""
+        detailed_info = {}
+        
+        # TELEFON BİLGİSİNİ AL (Google Maps yapısına uygun)
+        for aria_label in raw_detail.get('phone_labels', []):
+            phone = text_classifier.phone_from_label(aria_label)
+            if phone:
+                detailed_info['Telefon'] = phone
+                break
+        
+        # ADRES BİLGİSİNİ AL (Google Maps yapısına uygun)
+        for aria_label in raw_detail.get('address_labels', []):
+            address = text_classifier.address_from_label(aria_label)
+            if address:
+                detailed_info['Adres'] = address
+                break
+        
+        # Ek alanlar - sadece panelde varsa
+        if raw_detail.get('website'):
+            detailed_info['Website'] = raw_detail['website']
+        if raw_detail.get('category'):
+            detailed_info['Kategori'] = raw_detail['category']
+        
+        return detailed_info
+    
+    @property
+    def result_store(self):
+        """Kalıcı sonuç deposu (devre dışıysa None)"""
+        if self._result_store is None:
+            try:
+                self._result_store = ResultStore()
+            except Exception as e:
+                self.logger.warning(f"Sonuç deposu açılamadı: {e}")
+                self._result_store = False
+        return self._result_store or None
+    
+    @property
+    def dedup_index(self):
+        """Taramalar arası tekrar indeksi (devre dışıysa None)"""
+        if self._dedup_index is None:
+            try:
+                self._dedup_index = DedupIndex()
+            except Exception as e:
+                self.logger.warning(f"Dedup indeksi açılamadı: {e}")
+                self._dedup_index = False
+        return self._dedup_index or None
+    
+    def _check_duplicate(self, record):
+        """
+        Kaydı dedup indeksinde ara (place id, telefon, ad + adres)
+        
+        Önceki bir taramada detayları okunmuş işletmenin eksik detay alanları
+        kayda kopyalanır, böylece detay paneli açılmaz.
+        
+        Returns:
+            str: DUPLICATE (bu taramada zaten var, atlanmalı), KNOWN (detaylar kopyalandı) veya None
+        """
+        if not self.dedup_index:
+            return None
+        status, stored = self.dedup_index.check(record)
+        if status == DUPLICATE:
+            self.metrics['duplicates_skipped'] = self.metrics.get('duplicates_skipped', 0) + 1
+            self.logger.info(f"Tekrar eden işletme atlandı: {record.get('Ad')}")
+        elif status == KNOWN:
+            for field in DETAIL_FIELDS:
+                if stored.get(field) and not record.get(field):
+                    record[field] = stored[field]
+            self.metrics['details_reused'] = self.metrics.get('details_reused', 0) + 1
+        return status
+    
+    def _remember(self, record):
+        """Kaydı dedup indeksine ekle (detaylar sonradan gelirse tekrar çağrılır)"""
+        if self.dedup_index:
+            self.dedup_index.remember(record)
+    
+    def normalized_data(self):
+        """
+        business_data'nın tipli (normalize edilmiş) DataFrame'i
+        
+        Telefon (E.164), Puan, Yorum Sayısı sütunları eklenir, Adres temizlenir.
+        Kayıtlar değişmedikçe sonuç önbellekten döner; dışa aktarıcılar bunu kullanır.
+        """
+        cached = self._normalized
+        if cached and cached[0] is self.business_data and cached[1] == len(self.business_data):
+            return cached[2]
+        
+        started = time.perf_counter()
+        df = normalize_records(self.business_data)
+        self._normalized = (self.business_data, len(self.business_data), df)
+        self.logger.info(f"{len(df)} kayıt normalize edildi ({time.perf_counter() - started:.3f} sn)")
+        return df
+    
     def generate_filename(self):
         """Otomatik dosya ismi oluştur: İşletme_Şehir_Raporu_Tarih"""
         try:
@@ -931,10 +1521,26 @@ class GoogleMapsScraper:
             current_date = datetime.now().strftime("%Y-%m-%d")
             return f"İşletme_Raporu_{current_date}.xlsx"
     
-    def save_to_excel(self, filename=None):
-        """Toplanan verileri Excel dosyasına kaydet - MODERN VE RENKLİ"""
+    def save_to_excel(self, filename=None, records=None, shard_rows=None, group_by=None, shard_mode='files',
+                      workers=None):
+        """
+        Toplanan verileri Excel dosyasına kaydet - MODERN VE RENKLİ
+        
+        shard_rows veya group_by verilirse (ya da kayıtlar tek sayfaya sığmazsa)
+        veri parçalara bölünür; filename parçalara bağlantı veren dizin olur.
+        
+        Args:
+            filename (str): Dosya adı (varsayılan: otomatik)
+            records (list): Kaydedilecek kayıtlar (örn. ResultStore.query sonucu); verilmezse business_data
+            shard_rows (int): Parça başına satır sayısı
+            group_by (str): Parçalama sütunu ('İlçe', 'Şehir', 'Kategori' ...)
+            shard_mode (str): 'files' (parça başına dosya, paralel) veya 'sheets' (tek dosya, çok sayfa)
+            workers (int): 'files' modunda paralel yazıcı süreç sayısı
+        """
         try:
-            if not self.business_data:
+            if records is None:
+                records = self.business_data
+            if not records:
                 self.logger.warning("Kaydedilecek veri bulunamadı")
                 return False
             
@@ -942,217 +1548,78 @@ class GoogleMapsScraper:
             if filename is None:
                 filename = self.generate_filename()
             
-            df = pd.DataFrame(self.business_data)
+            df = self.normalized_data() if records is self.business_data else normalize_records(records)
             
-            # Sadece belirli sütunları seç
-            required_columns = ['Sıra', 'Ad', 'Adres', 'Telefon', 'Puan/Yorum']
-            available_columns = [col for col in required_columns if col in df.columns]
-            df_filtered = df[available_columns]
+            started = time.perf_counter()
+            if shard_rows or group_by or len(df) > EXCEL_MAX_ROWS:
+                shards = export_sharded(df, filename, rows_per_shard=shard_rows, group_by=group_by,
+                                        mode=shard_mode, workers=workers, rating_column=RATING)
+                self.metrics['excel_seconds'] = time.perf_counter() - started
+                self.logger.info(f"🗂️ Excel {len(shards)} parçaya bölündü, dizin: {filename}")
+            else:
+                # Stiller bir kez tanımlanır, satırlar write-only modda diske akıtılır
+                write_styled_excel(excel_frame(df, rating_column=RATING), filename)
+                self.metrics['excel_seconds'] = time.perf_counter() - started
+                self.logger.info(f"🎨 Modern ve renkli Excel dosyası başarıyla oluşturuldu: {filename}")
+            self.logger.info(f"📊 Toplam {len(records)} işletme verisi kaydedildi")
+            return True
             
-            # Excel dosyasını oluştur
-            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                df_filtered.to_excel(writer, sheet_name='İşletme Verileri', index=False)
-                
-                # Worksheet'i al
-                worksheet = writer.sheets['İşletme Verileri']
-                
-                # Modern stil için gerekli import'lar
-                from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
-                from openpyxl.utils import get_column_letter
-                from openpyxl.formatting.rule import ColorScaleRule, CellIsRule
-                from openpyxl.styles.differential import DifferentialStyle
-                
-                # Sayfa başlığını EN BAŞTA ekle (stil uygulamalarından önce)
-                worksheet.insert_rows(1)
-                title_cell = worksheet.cell(row=1, column=1)
-                title_cell.value = f"🗺️ GOOGLE MAPS İŞLETME VERİLERİ - {len(df_filtered)} İşletme"
-                title_cell.font = Font(name='Calibri', size=16, bold=True, color='6F42C1')
-                title_cell.alignment = Alignment(horizontal='center', vertical='center')
-                
-                # Başlık satırını birleştir
-                worksheet.merge_cells(f'A1:{get_column_letter(len(df_filtered.columns))}1')
-                
-                # Renk paleti
-                colors = {
-                    'header_bg': '2E86AB',      # Mavi
-                    'header_text': 'FFFFFF',    # Beyaz
-                    'row_light': 'F8F9FA',      # Açık gri
-                    'row_dark': 'E9ECEF',       # Koyu gri
-                    'border': 'DEE2E6',         # Kenarlık
-                    'high_rating': '28A745',    # Yeşil (yüksek puan)
-                    'medium_rating': 'FFC107',  # Sarı (orta puan)
-                    'low_rating': 'DC3545',     # Kırmızı (düşük puan)
-                    'accent': '6F42C1'          # Mor (vurgu)
-                }
-                
-                # Kenarlık stili
-                thin_border = Border(
-                    left=Side(style='thin', color=colors['border']),
-                    right=Side(style='thin', color=colors['border']),
-                    top=Side(style='thin', color=colors['border']),
-                    bottom=Side(style='thin', color=colors['border'])
-                )
-                
-                # Başlık stili
-                header_font = Font(
-                    name='Calibri',
-                    size=12,
-                    bold=True,
-                    color=colors['header_text']
-                )
-                header_fill = PatternFill(
-                    start_color=colors['header_bg'],
-                    end_color=colors['header_bg'],
-                    fill_type='solid'
-                )
-                
-                # Veri stili
-                data_font = Font(name='Calibri', size=11)
-                center_alignment = Alignment(horizontal='center', vertical='center')
-                left_alignment = Alignment(horizontal='left', vertical='center')
-                
-                # Başlık satırını stilleyin (2. satır) - sadece gerekli sütunlar
-                for col_num in range(1, len(df_filtered.columns) + 1):
-                    cell = worksheet.cell(row=2, column=col_num)
-                    cell.font = header_font
-                    cell.fill = header_fill
-                    cell.border = thin_border
-                    cell.alignment = center_alignment
-                
-                # Veri satırlarını stilleyin - tüm satırlar dahil
-                total_rows = len(df_filtered) + 2  # +1 başlık satırı +1 title satırı için
-                for row_num in range(3, total_rows + 1):
-                    for col_num in range(1, len(df_filtered.columns) + 1):
-                        cell = worksheet.cell(row=row_num, column=col_num)
-                        cell.font = data_font
-                        cell.border = thin_border
-                        
-                        # Alternatif satır renkleri - tüm satırlar için
-                        if row_num % 2 == 0:
-                            cell.fill = PatternFill(
-                                start_color=colors['row_light'],
-                                end_color=colors['row_light'],
-                                fill_type='solid'
-                            )
-                        else:
-                            cell.fill = PatternFill(
-                                start_color=colors['row_dark'],
-                                end_color=colors['row_dark'],
-                                fill_type='solid'
-                            )
-                        
-                        # Sütun hizalaması
-                        if col_num == 1:  # Sıra sütunu
-                            cell.alignment = center_alignment
-                        elif col_num == 5:  # Puan/Yorum sütunu
-                            cell.alignment = center_alignment
-                        else:
-                            cell.alignment = left_alignment
-                
-                # Sütun genişliklerini optimize et - sadece gerekli sütunlar
-                column_widths = {
-                    'A': 8,   # Sıra
-                    'B': 45,  # Ad
-                    'C': 60,  # Adres
-                    'D': 25,  # Telefon
-                    'E': 18   # Puan/Yorum
-                }
-                
-                for col_letter, width in column_widths.items():
-                    if col_letter in [get_column_letter(i) for i in range(1, len(df_filtered.columns) + 1)]:
-                        worksheet.column_dimensions[col_letter].width = width
-                
-                # Puan sütunu için koşullu formatlama
-                if 'Puan/Yorum' in df_filtered.columns:
-                    puan_col = df_filtered.columns.get_loc('Puan/Yorum') + 1
-                    
-                    # Puan verilerini temizle ve sayısal değere çevir - tüm satırlar için
-                    for row_num in range(3, total_rows + 1):
-                        cell = worksheet.cell(row=row_num, column=puan_col)
-                        if cell.value:
-                            # Puan verisini temizle (örn: "4,8 yıldızlı 4.142 Yorum" -> 4.8)
-                            import re
-                            rating_match = re.search(r'(\d+,\d+)', str(cell.value))
-                            if rating_match:
-                                rating = float(rating_match.group(1).replace(',', '.'))
-                                cell.value = rating
-                    
-                    # Yüksek puan (4.5+) - Yeşil
-                    high_rating_rule = CellIsRule(
-                        operator='greaterThan',
-                        formula=['4.4'],
-                        fill=PatternFill(
-                            start_color=colors['high_rating'],
-                            end_color=colors['high_rating'],
-                            fill_type='solid'
-                        ),
-                        font=Font(color='FFFFFF', bold=True)
-                    )
-                    
-                    # Orta puan (3.5-4.4) - Sarı
-                    medium_rating_rule = CellIsRule(
-                        operator='between',
-                        formula=['3.4', '4.4'],
-                        fill=PatternFill(
-                            start_color=colors['medium_rating'],
-                            end_color=colors['medium_rating'],
-                            fill_type='solid'
-                        ),
-                        font=Font(color='000000', bold=True)
-                    )
-                    
-                    # Düşük puan (<3.5) - Kırmızı
-                    low_rating_rule = CellIsRule(
-                        operator='lessThan',
-                        formula=['3.5'],
-                        fill=PatternFill(
-                            start_color=colors['low_rating'],
-                            end_color=colors['low_rating'],
-                            fill_type='solid'
-                        ),
-                        font=Font(color='FFFFFF', bold=True)
-                    )
-                    
-                    # Koşullu formatlamayı uygula - tüm satırlar için
-                    worksheet.conditional_formatting.add(
-                        f'{get_column_letter(puan_col)}3:{get_column_letter(puan_col)}{total_rows}',
-                        high_rating_rule
-                    )
-                    worksheet.conditional_formatting.add(
-                        f'{get_column_letter(puan_col)}3:{get_column_letter(puan_col)}{total_rows}',
-                        medium_rating_rule
-                    )
-                    worksheet.conditional_formatting.add(
-                        f'{get_column_letter(puan_col)}3:{get_column_letter(puan_col)}{total_rows}',
-                        low_rating_rule
-                    )
-                
-                # Satır yüksekliğini ayarla - tüm satırlar için
-                for row_num in range(1, total_rows + 1):
-                    worksheet.row_dimensions[row_num].height = 25
-                
-                # Başlık satırı (1. satır) için stil
-                for col_num in range(1, len(df_filtered.columns) + 1):
-                    cell = worksheet.cell(row=1, column=col_num)
-                    cell.fill = PatternFill(
-                        start_color='F8F9FA',
-                        end_color='F8F9FA',
-                        fill_type='solid'
-                    )
-                    cell.border = thin_border
+        except Exception as e:
+            self.logger.error(f"Excel dosyası kaydedilirken hata: {e}")
+            return False
+    
+    def export(self, filename=None, fmt=None, compression=None, records=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Verileri seçilen biçimde kaydet: Excel, CSV, JSONL veya Parquet
+        
+        CSV/JSONL/Parquet kayıtları chunk_size'lık parçalar halinde normalize
+        edilip dosyaya eklenir; veri kümesi tek DataFrame'e dönüştürülmez.
+        
+        Args:
+            filename (str): Dosya adı (varsayılan: generate_filename(); uzantı biçime göre düzeltilir)
+            fmt (str): 'xlsx', 'csv', 'jsonl', 'parquet' (None: dosya uzantısından, o da yoksa xlsx)
+            compression (str): csv/jsonl için gzip/bz2/xz, parquet için snappy/zstd/gzip/none (None: biçimin varsayılanı)
+            records (list): Kaydedilecek kayıtlar; verilmezse business_data
+        """
+        try:
+            if records is None:
+                records = self.business_data
+            if not records:
+                self.logger.warning("Kaydedilecek veri bulunamadı")
+                return False
             
-            self.logger.info(f"🎨 Modern ve renkli Excel dosyası başarıyla oluşturuldu: {filename}")
-            self.logger.info(f"📊 Toplam {len(self.business_data)} işletme verisi kaydedildi")
+            if fmt is None:
+                fmt, detected_compression = format_of(filename) if filename else (None, None)
+                fmt = fmt or 'xlsx'
+                compression = compression or detected_compression
+            filename = export_filename(filename or self.generate_filename(), fmt, compression)
+            if fmt == 'xlsx':
+                return self.save_to_excel(filename, records=records)
+            
+            started = time.perf_counter()
+            rows = export_chunks(record_chunks(records, chunk_size), filename, fmt, compression)
+            self.metrics['export_seconds'] = time.perf_counter() - started
+            self.logger.info(f"💾 {rows} işletme {fmt.upper()} olarak kaydedildi: {filename} "
+                             f"({self.metrics['export_seconds']:.1f} sn)")
             return True
             
         except Exception as e:
-            self.logger.error(f"Excel dosyası kaydedilirken hata: {e}")
+            self.logger.error(f"Dışa aktarma sırasında hata: {e}")
             return False
     
     def close(self):
         """Driver'ı kapat"""
+        self.selector_resolver.save()
+        if self.journal:
+            self.journal.close()
+        if self._result_store:
+            self._result_store.flush()
+        if self._dedup_index:
+            self._dedup_index.flush()
         if self.driver:
             self.driver.quit()
+            self.driver = None
+            self.network_capture = None
             self.logger.info("Driver kapatıldı")
     
     def __enter__(self):
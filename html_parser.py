@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tarayıcısız (lxml) kart ayrıştırıcı
+
+Feed'in outerHTML'i kaydırma başına tek bir çağrıyla alınır (veya kayıtlı
+bir dosyadan okunur) ve kartlar süreç içinde lxml ile ayrıştırılır. Çıktı
+BULK_CARDS_SCRIPT ile aynı ham kart biçimindedir, bu yüzden scraper'ın
+alan çıkarıcıları değişmeden kullanılır. Kayıtlı detay paneli de aynı
+şekilde DETAIL_SCRIPT biçimine çevrilir (parse_detail_html). Tarayıcı
+gerekmediği için kayıtlı sayfalar üzerinde hız ve doğruluk ölçümü yapılabilir:
+    python html_parser.py kayitli_sayfa.html [...]
+"""
+
+import os
+import re
+import time
+from functools import lru_cache
+from urllib.parse import urljoin
+
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+
+MAPS_BASE_URL = 'https://www.google.com'
+
+# innerText'te satır sonu üreten elemanlar
+_BLOCK_TAGS = frozenset([
+    'address', 'article', 'br', 'div', 'footer', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'header', 'li', 'ol', 'p', 'section', 'table', 'tr', 'ul'
+])
+_SKIPPED_TAGS = frozenset(['script', 'style', 'noscript', 'template'])
+
+_card_selector = CSSSelector('.Nv2PK')
+_fallback_card_selector = CSSSelector("[data-result-index], [role='article']")
+_link_selector = CSSSelector("a[href*='/maps/place/']")
+_detail_heading_selectors = (CSSSelector('h1.DUwDvf'), CSSSelector('h1'))
+_phone_label_selector = CSSSelector("[data-item-id^='phone']")
+_address_label_selector = CSSSelector("[data-item-id='address']")
+_website_selector = CSSSelector("a[data-item-id='authority']")
+_category_selector = CSSSelector("button[jsaction*='category']")
+
+
+@lru_cache(maxsize=None)
+def _compiled(selector):
+    """CSS selector'ı bir kez XPath'e çevir; geçersizse None"""
+    try:
+        return CSSSelector(selector)
+    except Exception:
+        return None
+
+
+def inner_text(element):
+    """Tarayıcının innerText'ine yakın metin: blok elemanlar satır, boşluklar tek"""
+    parts = []
+
+    def walk(node):
+        if not isinstance(node.tag, str) or node.tag in _SKIPPED_TAGS:
+            return
+        block = node.tag in _BLOCK_TAGS
+        if block:
+            parts.append('\n')
+        if node.text:
+            parts.append(node.text)
+        for child in node:
+            walk(child)
+            if child.tail:
+                parts.append(child.tail)
+        if block:
+            parts.append('\n')
+
+    walk(element)
+    lines = (' '.join(line.split()) for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def _dataset(element):
+    """data-* özniteliklerini DOM dataset'i gibi camelCase anahtarlarla döndür"""
+    return {
+        re.sub(r'-([a-z])', lambda match: match.group(1).upper(), name[5:]): value
+        for name, value in element.attrib.items()
+        if name.startswith('data-')
+    }
+
+
+def _view(element):
+    href = element.get('href') or ''
+    return {
+        't': inner_text(element),
+        'a': element.get('aria-label') or '',
+        'h': urljoin(MAPS_BASE_URL, href) if href else ''
+    }
+
+
+def _feed_root(document):
+    if document.get('role') == 'feed':
+        return document
+    feeds = document.xpath("//*[@role='feed']")
+    return feeds[0] if feeds else document
+
+
+def parse_feed_html(page_html, field_selectors, start=0):
+    """
+    Feed (veya tüm sayfa) HTML'indeki kartları ham kart sözlüklerine çevir
+
+    Args:
+        page_html (str): Feed'in outerHTML'i ya da kayıtlı sayfa
+        field_selectors (dict): {alan_adı: [selector, ...]}
+        start (int): Bu indeksten önceki kartlar atlanır
+
+    Returns:
+        list: Her kart için {index, element, href, data, label, text, fields}
+            (element her zaman None; detay için kart indeksle bulunur)
+    """
+    if not page_html or not page_html.strip():
+        return []
+    root = _feed_root(lxml_html.fromstring(page_html))
+    cards = _card_selector(root) or _fallback_card_selector(root)
+    compiled = {
+        field: [(selector, _compiled(selector)) for selector in selectors]
+        for field, selectors in field_selectors.items()
+    }
+
+    out = []
+    for i in range(start, len(cards)):
+        card = cards[i]
+        links = _link_selector(card)
+        link = links[0] if links else None
+        fields = {
+            field: {
+                selector: [_view(element) for element in matcher(card)] if matcher is not None else []
+                for selector, matcher in selectors
+            }
+            for field, selectors in compiled.items()
+        }
+        data = _dataset(card)
+        if link is not None:
+            data.update(_dataset(link))
+        out.append({
+            'index': i,
+            'element': None,
+            'href': urljoin(MAPS_BASE_URL, link.get('href')) if link is not None and link.get('href') else '',
+            'data': data,
+            'label': (link.get('aria-label') or '') if link is not None else '',
+            'text': inner_text(card),
+            'fields': fields
+        })
+    return out
+
+
+def parse_detail_html(page_html, expected_name=''):
+    """
+    Kayıtlı detay paneli HTML'ini DETAIL_SCRIPT çıktısı biçimine çevir
+
+    Args:
+        page_html (str): Detay panelinin (veya tüm sayfanın) HTML'i
+        expected_name (str): Verilirse aria-label'i bu ad olan panel okunur;
+            önceki işletmenin paneli DOM'da kalmış olabilir
+
+    Returns:
+        dict: {title, phone_labels, address_labels, website, category, url}
+            (url kayıtlı sayfada bilinmez, her zaman boş)
+    """
+    if not page_html or not page_html.strip():
+        return {}
+    document = lxml_html.fromstring(page_html)
+    pane = document
+    if expected_name:
+        panes = [element for element in document.xpath("//*[@role='main']")
+                 if element.get('aria-label') == expected_name]
+        pane = panes[0] if panes else document
+
+    headings = [found[0] for found in (selector(pane) for selector in _detail_heading_selectors) if found]
+    websites = _website_selector(pane)
+    categories = _category_selector(pane)
+    website = websites[0].get('href') if websites else ''
+    return {
+        'title': inner_text(headings[0]) if headings else '',
+        'phone_labels': [element.get('aria-label') or '' for element in _phone_label_selector(pane)],
+        'address_labels': [element.get('aria-label') or '' for element in _address_label_selector(pane)],
+        'website': urljoin(MAPS_BASE_URL, website) if website else '',
+        'category': inner_text(categories[0]) if categories else '',
+        'url': ''
+    }
+
+
+def save_snapshot(record_dir, page_html):
+    """Feed HTML'ini tekrar ayrıştırılabilir dosya olarak kaydet"""
+    os.makedirs(record_dir, exist_ok=True)
+    path = os.path.join(record_dir, f"feed_{time.time_ns()}.html")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(page_html)
+    return path
+
+
+if __name__ == "__main__":
+    import sys
+    from google_maps_scraper import CARD_FIELD_SELECTORS, GoogleMapsScraper
+
+    if len(sys.argv) < 2:
+        print("Kullanım: python html_parser.py <kayıtlı sayfa.html> [...]")
+        sys.exit(1)
+
+    scraper = GoogleMapsScraper(notify=False, selector_stats_path=False, result_store=False)
+    for path in sys.argv[1:]:
+        with open(path, 'r', encoding='utf-8') as f:
+            page_html = f.read()
+
+        started = time.perf_counter()
+        cards = parse_feed_html(page_html, CARD_FIELD_SELECTORS)
+        parsed = time.perf_counter()
+        records = [record for record in (scraper._extract_business_info(card, card['index']) for card in cards)
+                   if record]
+        finished = time.perf_counter()
+
+        print(f"\n📄 {path}: {len(cards)} kart, {len(records)} işletme")
+        print(f"   Ayrıştırma: {(parsed - started) * 1000:.1f} ms, alan çıkarma: {(finished - parsed) * 1000:.1f} ms "
+              f"({(finished - started) * 1000 / max(1, len(cards)):.2f} ms/kart)")
+        for field in ('Ad', 'Adres', 'Telefon', 'Puan/Yorum'):
+            filled = sum(1 for record in records if record.get(field))
+            print(f"   {field}: {filled}/{len(records)}")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hafif (lean) tarayıcı modu ve sayfa ağırlığı ölçümü
+
+Yalnızca metin ve nitelik okuduğumuz için resim, font, medya ve harita
+karoları indirilmez: resimler Chrome tercihleriyle, geri kalanlar DevTools
+Network.setBlockedURLs ile engellenir. Aktarılan bayt miktarı tarayıcının
+Resource Timing kayıtlarından okunur; bu kayıtlar her sayfa açılışında
+sıfırlandığından ByteCounter sayfa değiştirmeden önce mevcut sayfanın
+toplamını biriktirir (bölgesel taramada her karo ayrı sayfadır).
+"""
+
+# Chrome tercihleri: 2 = engelle
+LEAN_PREFS = {
+    'profile.managed_default_content_settings.images': 2,
+    'profile.default_content_setting_values.media_stream': 2,
+}
+
+# DevTools ile engellenen istek kalıpları (* joker karakter)
+BLOCKED_URL_PATTERNS = [
+    # Resimler
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*googleusercontent.com/p/*',  # İşletme fotoğrafları
+    '*streetviewpixels*',
+    # Fontlar
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*fonts.gstatic.com*',
+    # Medya
+    '*.mp4', '*.webm', '*.mp3',
+    # Harita karoları
+    '*/maps/vt*', '*/kh/v*', '*khms*.google.com*', '*/maps/vt/pb*',
+]
+
+# Varsayılan 250 kayıtlık Resource Timing tamponu uzun taramada dolar; her sayfada büyüt
+RESOURCE_BUFFER_SCRIPT = "performance.setResourceTimingBufferSize(1000000);"
+
+# Sayfa açıldığından beri ağdan aktarılan toplam bayt (sayfa + kaynaklar);
+# önbellekten gelen kaynağın transferSize'ı 0'dır ve sayılmaz
+PAGE_BYTES_SCRIPT = """
+var entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+var total = 0;
+for (var i = 0; i < entries.length; i++) {
+    total += entries[i].transferSize || 0;
+}
+return {bytes: total, requests: entries.length};
+"""
+
+
+def apply_lean_options(chrome_options):
+    """Chrome seçeneklerine resim/medya engelleme tercihlerini ekle"""
+    chrome_options.add_experimental_option('prefs', LEAN_PREFS)
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+
+
+def enable_request_blocking(driver):
+    """Font, medya ve harita karosu isteklerini DevTools ile engelle"""
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+
+
+def enable_byte_tracking(driver):
+    """Her yeni sayfada Resource Timing tamponunu büyüt"""
+    driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': RESOURCE_BUFFER_SCRIPT})
+
+
+def page_bytes(driver):
+    """
+    Mevcut sayfanın aktardığı bayt ve istek sayısı
+
+    Timing-Allow-Origin göndermeyen çapraz kaynaklar 0 bayt raporlar;
+    değer alt sınırdır ama lean/normal mod karşılaştırması için yeterlidir.
+
+    Returns:
+        tuple: (bayt, istek_sayısı)
+    """
+    try:
+        result = driver.execute_script(PAGE_BYTES_SCRIPT) or {}
+        return int(result.get('bytes', 0)), int(result.get('requests', 0))
+    except Exception:
+        return 0, 0
+
+
+class ByteCounter:
+    """Sayfa değişimleri boyunca aktarılan bayt ve istek toplamı"""
+
+    def __init__(self):
+        self.bytes = 0
+        self.requests = 0
+
+    def start(self, driver):
+        """Yeni ölçüm: açık sayfanın önceki aramada sayılmış baytları toplamdan düşülür"""
+        current_bytes, current_requests = page_bytes(driver)
+        self.bytes, self.requests = -current_bytes, -current_requests
+
+    def checkpoint(self, driver):
+        """Sayfadan ayrılmadan hemen önce çağrılır: mevcut sayfanın baytlarını topla"""
+        current_bytes, current_requests = page_bytes(driver)
+        self.bytes += current_bytes
+        self.requests += current_requests
+
+    def total(self, driver):
+        """
+        Returns:
+            tuple: (bayt, istek_sayısı) - önceki sayfalar + açık sayfa
+        """
+        current_bytes, current_requests = page_bytes(driver)
+        return self.bytes + current_bytes, self.requests + current_requests
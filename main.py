@@ -5,6 +5,8 @@ Google Maps İşletme Veri Toplama Aracı - Modern GUI
 Bu script Google Maps'ten işletme bilgilerini toplar ve Excel dosyasına aktarır.
 """
 
+import asyncio
+import multiprocessing
 import os
 import sys
 from tkinter import messagebox
@@ -41,6 +43,8 @@ def main():
 def run_console_mode():
     """Konsol modu - basit arayüz"""
     from google_maps_scraper import GoogleMapsScraper
+    from record_journal import journal_path
+    from data_export import COMPRESSIONS, EXPORT_FORMATS, export_filename
     import logging
     
     print("🖥️  KONSOL MODU")
@@ -61,14 +65,52 @@ def run_console_mode():
     except ValueError:
         max_results = 20
     
+    try:
+        detail_workers = int(input("🧵 Paralel detay driver sayısı (0 = kapalı, varsayılan: 0): ") or "0")
+        detail_workers = max(0, detail_workers)
+    except ValueError:
+        detail_workers = 0
+    
+    mode_input = input("⚙️  Okuma modu (bulk/dom/network/html/stream) [varsayılan: bulk]: ").strip().lower()
+    extraction_mode = mode_input if mode_input in ['bulk', 'dom', 'network', 'html', 'stream'] else 'bulk'
+    
     headless_input = input("🖥️  Tarayıcıyı görünmez modda çalıştır? (e/h) [varsayılan: e]: ").strip().lower()
     headless = headless_input in ['e', 'evet', 'y', 'yes'] or headless_input == ''
     
-    filename = input("💾 Excel dosya adı (varsayılan: isletme_verileri.xlsx): ").strip()
-    if not filename:
-        filename = "isletme_verileri.xlsx"
-    if not filename.endswith('.xlsx'):
-        filename += '.xlsx'
+    # Bölgesel tarama: konum karolara bölünür, her karo ayrı aranır
+    tile_zoom = None
+    tile_workers = 0
+    if location:
+        tiled_input = input("🧩 Bölgesel tarama (120+ sonuç için konumu karolara böl)? (e/h) [varsayılan: h]: ").strip().lower()
+        if tiled_input in ['e', 'evet', 'y', 'yes']:
+            zoom_input = input("🔎 Karo yakınlaştırma düzeyi (12-17, boş: otomatik): ").strip()
+            tile_zoom = int(zoom_input) if zoom_input.isdigit() else 'auto'
+            try:
+                tile_workers = max(0, int(input("🧵 Paralel karo driver sayısı (0 = tek driver, varsayılan: 0): ") or "0"))
+            except ValueError:
+                tile_workers = 0
+    
+    lean_input = input("🪶 Hafif mod (resim, font ve harita karoları yüklenmez)? (e/h) [varsayılan: e]: ").strip().lower()
+    lean = lean_input in ['e', 'evet', 'y', 'yes'] or lean_input == ''
+    
+    # Aynı arama yarıda kaldıysa günlükten devam etme seçeneği (tamamlanan aramaların günlüğü silinir)
+    resume = False
+    if os.path.exists(journal_path(query, location)):
+        resume_input = input("♻️  Bu arama daha önce yarıda kalmış. Kaldığı yerden devam edilsin mi? (e/h) [varsayılan: e]: ").strip().lower()
+        resume = resume_input in ['e', 'evet', 'y', 'yes'] or resume_input == ''
+    
+    format_input = input("📄 Kayıt biçimi (xlsx/csv/jsonl/parquet) [varsayılan: xlsx]: ").strip().lower()
+    export_format = format_input if format_input in EXPORT_FORMATS else 'xlsx'
+    compression = None
+    if export_format in COMPRESSIONS:
+        options = COMPRESSIONS[export_format]
+        labels = '/'.join(option or 'yok' for option in options)
+        compression_input = input(f"🗜️  Sıkıştırma ({labels}) [varsayılan: {options[0] or 'yok'}]: ").strip().lower()
+        compression = compression_input if compression_input in options else options[0]
+    
+    filename = input("💾 Dosya adı (boş bırakılırsa otomatik): ").strip()
+    if filename:
+        filename = export_filename(filename, export_format, compression)
     
     print()
     print("🚀 Arama başlatılıyor...")
@@ -76,32 +118,53 @@ def run_console_mode():
     print(f"   Konum: {location if location else 'Belirtilmedi'}")
     print(f"   Maksimum sonuç: {max_results}")
     print(f"   Mod: DETAYLI (tüm bilgiler)")
-    print(f"   Dosya adı: {filename}")
+    if detail_workers:
+        print(f"   Paralel detay: {detail_workers} driver")
+    if tile_zoom:
+        print(f"   Bölgesel tarama: zoom {tile_zoom}" + (f", {tile_workers} paralel driver" if tile_workers else ""))
+    print(f"   Hafif mod: {'Açık' if lean else 'Kapalı'}")
+    print(f"   Okuma modu: {extraction_mode}")
+    print(f"   Dosya adı: {filename or 'otomatik'} ({export_format}{f', {compression}' if compression else ''})")
     print()
     
     # Scraper'ı başlat
     try:
-        with GoogleMapsScraper(headless=headless) as scraper:
-            # Arama yap - sadece detaylı mod
-            success = scraper.search_businesses(
-                query=query,
-                location=location,
-                max_results=max_results,
-                detailed_info=True
-            )
+        with GoogleMapsScraper(headless=headless, lean=lean) as scraper:
+            # Arama yap - sadece detaylı mod; kayıtlar geldikçe asyncio akışıyla yazılır
+            async def stream_search():
+                async for record in scraper.search_async(
+                    query,
+                    location,
+                    max_results,
+                    detailed_info=True,
+                    detail_workers=detail_workers,
+                    extraction_mode=extraction_mode,
+                    resume=resume,
+                    tile_zoom=tile_zoom,
+                    tile_workers=tile_workers
+                ):
+                    phone = f" - 📞 {record['Telefon']}" if record.get('Telefon') else ''
+                    print(f"   ✔ {record.get('Sıra')}. {record.get('Ad', 'Bilinmiyor')}{phone}")
+            
+            try:
+                asyncio.run(stream_search())
+                success = True
+            except RuntimeError as e:
+                logging.error(f"Arama hatası: {e}")
+                success = False
             
             if success and scraper.business_data:
                 print(f"✅ {len(scraper.business_data)} işletme verisi toplandı!")
                 print()
                 
-                # Excel'e kaydet
-                print("💾 Veriler Excel dosyasına kaydediliyor...")
+                # Seçilen biçimde kaydet
+                print(f"💾 Veriler {export_format.upper()} dosyasına kaydediliyor...")
                 # Eğer filename verilmemişse otomatik oluştur
-                if not filename or filename == "isletme_verileri.xlsx":
-                    filename = scraper.generate_filename()
+                if not filename:
+                    filename = export_filename(scraper.generate_filename(), export_format, compression)
                     print(f"📝 Otomatik dosya ismi: {filename}")
                 
-                if scraper.save_to_excel(filename):
+                if scraper.export(filename, fmt=export_format, compression=compression):
                     print(f"✅ Veriler başarıyla '{filename}' dosyasına kaydedildi!")
                     print()
                     
@@ -126,7 +189,7 @@ def run_console_mode():
                                 print(f"   ⭐ {business['Puan/Yorum']}")
                             print()
                 else:
-                    print("❌ Excel dosyası kaydedilemedi!")
+                    print("❌ Dosya kaydedilemedi!")
             else:
                 print("❌ Hiç işletme verisi toplanamadı!")
                 print("   Lütfen arama kriterlerinizi kontrol edin.")
@@ -137,6 +200,62 @@ def run_console_mode():
         print(f"\n❌ Beklenmeyen bir hata oluştu: {e}")
         logging.error(f"Ana program hatası: {e}")
 
+def run_batch_mode(jobs_file, workers=None, split=None, sheets=False, use_async=False):
+    """
+    Batch modu - dosyadaki her satır bir arama: 'işletme türü;konum;maksimum sonuç'
+    
+    split: Excel parçalama ölçütü - satır sayısı ('50000') veya sütun ('İlçe', 'Şehir', 'Kategori');
+    sheets: parçalar ayrı dosyalar yerine tek dosyada ayrı sayfalar olur
+    use_async: işler süreç havuzu yerine tek süreçte asyncio ile (thread başına bir driver) çalışır
+    """
+    from batch_engine import BatchEngine
+    
+    jobs = []
+    with open(jobs_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            parts = [part.strip() for part in line.split(';')]
+            if not parts[0] or parts[0].startswith('#'):
+                continue
+            location = parts[1] if len(parts) > 1 else ''
+            try:
+                max_results = int(parts[2]) if len(parts) > 2 and parts[2] else 20
+            except ValueError:
+                max_results = 20
+            jobs.append((parts[0], location, max_results))
+    
+    if not jobs:
+        print("❌ İş dosyasında arama bulunamadı!")
+        return
+    
+    print(f"🚀 Batch başlatılıyor: {len(jobs)} arama")
+    
+    def show_progress(finished, total, record_count):
+        print(f"📊 {finished}/{total} arama tamamlandı - {record_count} tekil işletme")
+    
+    engine = BatchEngine(jobs, workers=workers, progress_callback=show_progress)
+    if use_async:
+        asyncio.run(engine.run_async())
+    else:
+        engine.run()
+    
+    print()
+    print(engine.status_report())
+    print()
+    
+    shard_options = {}
+    if split:
+        if split.isdigit():
+            shard_options['shard_rows'] = int(split)
+        else:
+            shard_options['group_by'] = split
+    if sheets:
+        shard_options['shard_mode'] = 'sheets'
+        if not split:
+            shard_options['group_by'] = 'İlçe'
+    
+    if engine.results and engine.save_to_excel(**shard_options):
+        print(f"✅ {len(engine.results)} işletme Excel dosyasına kaydedildi!")
+
 def show_help():
     """Yardım menüsünü göster"""
     print("=" * 60)
@@ -148,10 +267,17 @@ def show_help():
     print("🔧 KURULUM:")
     print("   1. pip install -r requirements.txt")
     print("   2. python main.py")
+    print("   3. Toplu arama: python main.py --batch isler.txt [işçi sayısı]")
+    print("      (her satır: işletme türü;konum;maksimum sonuç)")
+    print("      Büyük sonuçları bölmek için: --split İlçe|Şehir|Kategori|<satır sayısı> [--sheets]")
+    print("      Tek süreçte asyncio ile çalıştırmak için: --async")
+    print("      (varsayılan: parça başına dosya + dizin dosyası; --sheets: tek dosyada sayfalar)")
     print()
     print("📝 KULLANIM:")
     print("   - Arama terimi: 'restoran', 'eczane', 'market' gibi")
     print("   - Konum: 'İstanbul', 'Ankara' gibi (opsiyonel)")
+    print("   - Bölgesel tarama: konum karolara bölünür, 120+ sonuç toplanabilir")
+    print("     (konum sınır kutusu da olabilir: güney,batı,kuzey,doğu)")
     print("   - Sonuç sayısı: Toplanacak maksimum işletme sayısı")
     print()
     print("📊 TOPLANAN VERİLER:")
@@ -172,7 +298,20 @@ def show_help():
     print()
 
 if __name__ == "__main__":
+    # PyInstaller exe'sinde işçi süreçler (batch, parçalı Excel) uygulamayı yeniden başlatmasın
+    multiprocessing.freeze_support()
     if len(sys.argv) > 1 and sys.argv[1] in ['-h', '--help', 'help']:
         show_help()
+    elif len(sys.argv) > 2 and sys.argv[1] == '--batch':
+        args = sys.argv[3:]
+        split = None
+        if '--split' in args:
+            position = args.index('--split')
+            split = args[position + 1] if position + 1 < len(args) else None
+            del args[position:position + 2]
+        sheets = '--sheets' in args
+        use_async = '--async' in args
+        args = [arg for arg in args if arg not in ('--sheets', '--async')]
+        run_batch_mode(sys.argv[2], int(args[0]) if args else None, split=split, sheets=sheets, use_async=use_async)
     else:
         main()
@@ -7,8 +7,10 @@ Modern GUI for Google Maps Business Scraper
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
 import threading
+import asyncio
 import os
 from google_maps_scraper import GoogleMapsScraper
+from data_export import export_filename, format_of
 import webbrowser
 import time
 import pandas as pd
@@ -184,6 +186,39 @@ class ModernScraperGUI:
         
         # Görünmez mod seçeneği kaldırıldı - her zaman görünür mod
         
+        # Hafif mod - resim, font ve harita karoları yüklenmez
+        self.lean_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            form_frame,
+            text="Hafif mod (resim, font ve harita yüklenmez)",
+            variable=self.lean_var,
+            font=('Segoe UI', 10),
+            bg=self.colors['light'],
+            activebackground=self.colors['light']
+        ).grid(row=3, column=1, sticky='w', padx=(10, 0), pady=5)
+        
+        # Yarıda kalan taramayı günlükten sürdür
+        self.resume_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            form_frame,
+            text="Yarıda kalan taramaya kaldığı yerden devam et",
+            variable=self.resume_var,
+            font=('Segoe UI', 10),
+            bg=self.colors['light'],
+            activebackground=self.colors['light']
+        ).grid(row=4, column=1, sticky='w', padx=(10, 0), pady=5)
+        
+        # Bölgesel tarama - konum karolara bölünür, tek aramanın ~120 sonuç sınırı aşılır
+        self.tiled_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            form_frame,
+            text="Bölgesel tarama (büyük şehirlerde 120+ sonuç için konumu karolara böl)",
+            variable=self.tiled_var,
+            font=('Segoe UI', 10),
+            bg=self.colors['light'],
+            activebackground=self.colors['light']
+        ).grid(row=5, column=1, sticky='w', padx=(10, 0), pady=5)
+        
         # Sütun ağırlıklarını ayarla
         form_frame.columnconfigure(1, weight=1)
         
@@ -430,19 +465,22 @@ class ModernScraperGUI:
             self.update_count(0)
             
             # Scraper'ı oluştur - her zaman görünür mod
-            self.scraper = GoogleMapsScraper(headless=False)
-            
-            # Arama yap - progress callback ile
-            success = self.scraper.search_businesses(
-                query=query,
-                location=location,
-                max_results=max_results,
-                detailed_info=True,
-                progress_callback=self.update_progress
-            )
+            self.scraper = GoogleMapsScraper(headless=False, lean=self.lean_var.get())
+            
+            # Arama yap - progress callback ile; kayıtlar bu thread'in asyncio döngüsünde geldikçe alınır
+            try:
+                asyncio.run(self._stream_search(query, location, max_results))
+                success = True
+            except RuntimeError as e:
+                self.log_message(f"❌ {e}", 'error')
+                success = False
             
             if success and self.scraper.business_data:
                 self.log_message(f"✅ {len(self.scraper.business_data)} işletme bulundu!", 'success')
+                if self.scraper.metrics.get('tiles_searched'):
+                    self.log_message(f"🧩 {self.scraper.metrics['tiles_searched']} karo tarandı", 'info')
+                if self.scraper.metrics.get('bytes_transferred'):
+                    self.log_message(f"📦 Aktarılan veri: {self.scraper.metrics['bytes_transferred'] / 1048576:.1f} MB", 'info')
                 self.update_status("Arama tamamlandı!")
                 self.update_count(len(self.scraper.business_data))
                 self.progress_var.set(100)
@@ -471,6 +509,13 @@ class ModernScraperGUI:
             self.update_status("Hata oluştu!")
             
         finally:
+            # Tarayıcıyı kapat - toplanan kayıtlar scraper'da kalır, kaydedilebilir
+            if self.scraper:
+                try:
+                    self.scraper.close()
+                except Exception as e:
+                    self.log_message(f"⚠️ Tarayıcı kapatılamadı: {e}", 'warning')
+            
             # UI'yi güncelle
             self.is_running = False
             self.start_button.config(state='normal')
@@ -478,11 +523,25 @@ class ModernScraperGUI:
             if self.scraper and self.scraper.business_data:
                 self.save_button.config(state='normal')
                 
+    async def _stream_search(self, query, location, max_results):
+        """Aramayı asyncio akışıyla yürüt; telefonu bulunan kayıtlar geldikçe log'a yazılır"""
+        async for record in self.scraper.search_async(
+            query,
+            location,
+            max_results,
+            detailed_info=True,
+            progress_callback=self.update_progress,
+            resume=self.resume_var.get(),
+            tile_zoom='auto' if self.tiled_var.get() and location else None
+        ):
+            if record.get('Telefon'):
+                self.root.after(0, self.log_message, f"   📞 {record.get('Ad', '')}: {record['Telefon']}", 'success')
+    
     def stop_search(self):
-        """Aramayı durdur"""
+        """Aramayı durdur - toplanan kayıtlar korunur; tarayıcıyı arama thread'i kapatır"""
         self.is_running = False
         if self.scraper:
-            self.scraper.close()
+            self.scraper.request_stop()
         self.update_status("Durduruldu")
         self.log_message("Arama durduruldu", 'warning')
         
@@ -495,22 +554,35 @@ class ModernScraperGUI:
         # Otomatik dosya ismi oluştur
         auto_filename = self.scraper.generate_filename()
         
-        # Kullanıcıya dosya konumu seçtir
+        # Kullanıcıya dosya konumu ve biçimi seçtir (biçim uzantıdan anlaşılır)
         filename = filedialog.asksaveasfilename(
             defaultextension=".xlsx",
-            filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")],
-            title="Excel dosyasını kaydet",
+            filetypes=[
+                ("Excel files", "*.xlsx"),
+                ("CSV files", "*.csv"),
+                ("CSV (gzip)", "*.csv.gz"),
+                ("JSON Lines", "*.jsonl"),
+                ("JSON Lines (gzip)", "*.jsonl.gz"),
+                ("Parquet", "*.parquet"),
+                ("All files", "*.*")
+            ],
+            title="Verileri kaydet",
             initialfile=auto_filename
         )
         
         if filename:
             try:
-                if self.scraper.save_to_excel(filename):
+                export_format, compression = format_of(filename)
+                export_format = export_format or 'xlsx'
+                if export_format == 'parquet':
+                    compression = 'snappy'
+                filename = export_filename(filename, export_format, compression)
+                if self.scraper.export(filename, fmt=export_format, compression=compression):
                     self.log_message(f"✅ Veriler '{os.path.basename(filename)}' dosyasına kaydedildi!", 'success')
                     messagebox.showinfo("Başarılı", f"Veriler başarıyla kaydedildi!\n\nDosya: {filename}")
                 else:
-                    self.log_message("❌ Excel dosyası kaydedilemedi!", 'error')
-                    messagebox.showerror("Hata", "Excel dosyası kaydedilemedi!")
+                    self.log_message("❌ Dosya kaydedilemedi!", 'error')
+                    messagebox.showerror("Hata", "Dosya kaydedilemedi!")
             except Exception as e:
                 self.log_message(f"❌ Kaydetme hatası: {str(e)}", 'error')
                 messagebox.showerror("Hata", f"Kaydetme hatası: {str(e)}")
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ağ yanıtlarından işletme okuma (DevTools performans logu)
+
+Google Maps arama sonuçlarını ve yer detaylarını yapılandırılmış XHR
+yanıtlarıyla yükler. Bu yanıtlar Chrome'un performans logundan yakalanır
+ve DOM modlarıyla aynı kayıt şemasına çevrilir; kaydırma yalnızca yeni
+sayfanın isteğini tetiklemek için yapılır.
+
+Yanıt dizilerindeki alan konumları belgelenmemiştir; her erişim
+`_dig` ile korunur, beklenmeyen yapı boş alan olarak sonuçlanır.
+
+Kaydedilmiş yanıtlar (fixture) tarayıcısız çözümlenebilir:
+    python network_extract.py kayitlar/
+"""
+
+import base64
+import json
+import logging
+import os
+import re
+import time
+
+# Yakalanan isteklerin URL kalıpları
+SEARCH_RESPONSE_RE = re.compile(r'/search\?.*tbm=map')
+PLACE_RESPONSE_RE = re.compile(r'/maps/preview/place')
+
+# JSON yanıtlarının başındaki XSSI koruması ve sonundaki yorum
+XSSI_PREFIX = ")]}'"
+TRAILING_COMMENT = '/*""*/'
+
+# Doğrudan açılan arama sayfasında ilk sonuçlar HTML'e gömülüdür
+INITIAL_STATE_SCRIPT = """
+try {
+    var state = window.APP_INITIALIZATION_STATE;
+    return (state && state[3] && typeof state[3][2] === 'string') ? state[3][2] : '';
+} catch (e) {
+    return '';
+}
+"""
+
+logger = logging.getLogger(__name__)
+
+
+def _dig(data, *path):
+    """İç içe listelerde güvenli erişim; yol yoksa None"""
+    for key in path:
+        try:
+            data = data[key]
+        except (IndexError, KeyError, TypeError):
+            return None
+    return data
+
+
+def decode_body(body):
+    """XSSI önekini ve sarmalayıcıyı temizleyip yanıtı JSON olarak çöz"""
+    text = (body or '').strip()
+    if text.endswith(TRAILING_COMMENT):
+        text = text[:-len(TRAILING_COMMENT)].rstrip()
+    if text.startswith(XSSI_PREFIX):
+        text = text[len(XSSI_PREFIX):]
+    data = json.loads(text)
+    # Arama yanıtı {"c":..., "d": ")]}'\n[...]"} biçiminde iki katlı gelebilir
+    if isinstance(data, dict) and isinstance(data.get('d'), str):
+        return decode_body(data['d'])
+    return data
+
+
+def places_from_response(url, body):
+    """Bir yanıttaki yer dizilerini döndür (arama: çok sayıda, detay: tek)"""
+    try:
+        data = decode_body(body)
+    except ValueError:
+        return []
+
+    if PLACE_RESPONSE_RE.search(url or ''):
+        place = _dig(data, 6)
+        return [place] if isinstance(place, list) else []
+
+    places = []
+    # Eski yapı: data[0][1][n][14], yeni yapı: data[64][n][1]
+    for entry in (_dig(data, 0, 1) or [])[1:]:
+        place = _dig(entry, 14)
+        if isinstance(place, list):
+            places.append(place)
+    for entry in _dig(data, 64) or []:
+        place = _dig(entry, 1)
+        if isinstance(place, list):
+            places.append(place)
+    return places
+
+
+def place_to_record(place):
+    """
+    Yanıttaki yer dizisini DOM modlarının kayıt şemasına çevir
+
+    Returns:
+        dict: Ad, Adres, Telefon, Puan/Yorum (+ Website, Kategori, Enlem, Boylam,
+            Yer ID, Harita Linki); ad yoksa None
+    """
+    name = _dig(place, 11)
+    if not isinstance(name, str) or not name.strip():
+        return None
+
+    address = _dig(place, 39)
+    if not isinstance(address, str):
+        address = ', '.join(part for part in (_dig(place, 2) or []) if isinstance(part, str))
+
+    phone = _dig(place, 178, 0, 0)
+    rating = _dig(place, 4, 7)
+    reviews = _dig(place, 4, 8)
+    rating_text = ''
+    if isinstance(rating, (int, float)):
+        # Kart metniyle aynı biçim: 4,5(120)
+        rating_text = f"{rating:.1f}".replace('.', ',')
+        if isinstance(reviews, int):
+            rating_text += f"({reviews})"
+
+    record = {
+        'Ad': name.strip(),
+        'Adres': address.strip(),
+        'Telefon': phone.strip() if isinstance(phone, str) else '',
+        'Puan/Yorum': rating_text
+    }
+
+    website = _dig(place, 7, 0)
+    if isinstance(website, str) and website:
+        record['Website'] = website
+    categories = _dig(place, 13)
+    if isinstance(categories, list) and categories and isinstance(categories[0], str):
+        record['Kategori'] = categories[0]
+    latitude, longitude = _dig(place, 9, 2), _dig(place, 9, 3)
+    if isinstance(latitude, (int, float)) and isinstance(longitude, (int, float)):
+        record['Enlem'], record['Boylam'] = latitude, longitude
+
+    places_id = _dig(place, 78)
+    feature_id = _dig(place, 10)
+    if isinstance(places_id, str) and places_id.startswith('ChIJ'):
+        record['Yer ID'] = places_id
+        record['Harita Linki'] = f"https://www.google.com/maps/place/?q=place_id:{places_id}"
+    elif isinstance(feature_id, str) and ':' in feature_id:
+        record['Yer ID'] = feature_id.lower()
+        try:
+            record['Harita Linki'] = f"https://www.google.com/maps?cid={int(feature_id.split(':')[1], 16)}"
+        except ValueError:
+            pass
+    return record
+
+
+def records_from_response(url, body):
+    """Bir yanıttaki tüm işletmeleri kayıt olarak döndür"""
+    return [record for record in map(place_to_record, places_from_response(url, body)) if record]
+
+
+class NetworkCapture:
+    """Performans logundan arama/detay yanıtlarını toplar"""
+
+    def __init__(self, driver, record_dir=None):
+        """
+        Args:
+            driver: 'goog:loggingPrefs' performans logu açık Chrome driver
+            record_dir (str): Verilirse yakalanan yanıtlar fixture olarak bu klasöre yazılır
+        """
+        self.driver = driver
+        self.record_dir = record_dir
+        self._pending = {}  # requestId -> url (yanıt geldi, yükleme bitmedi)
+        self.responses = 0
+
+    def reset(self):
+        """Önceki sayfadan kalan log kayıtlarını at"""
+        self.driver.get_log('performance')
+        self._pending = {}
+
+    def drain(self):
+        """
+        Logdaki yeni olayları işle, yüklemesi biten yanıtları döndür
+
+        Returns:
+            list: (url, body) demetleri
+        """
+        finished = []
+        for entry in self.driver.get_log('performance'):
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            method = message.get('method')
+            params = message.get('params', {})
+
+            if method == 'Network.responseReceived':
+                url = params.get('response', {}).get('url', '')
+                if SEARCH_RESPONSE_RE.search(url) or PLACE_RESPONSE_RE.search(url):
+                    self._pending[params.get('requestId')] = url
+            elif method == 'Network.loadingFinished' and params.get('requestId') in self._pending:
+                url = self._pending.pop(params['requestId'])
+                body = self._response_body(params['requestId'])
+                if body:
+                    finished.append((url, body))
+        self.responses += len(finished)
+        if self.record_dir:
+            for url, body in finished:
+                save_fixture(self.record_dir, url, body)
+        return finished
+
+    def _response_body(self, request_id):
+        try:
+            result = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+        except Exception as e:
+            logger.debug(f"Yanıt gövdesi alınamadı ({request_id}): {e}")
+            return ''
+        body = result.get('body', '')
+        if result.get('base64Encoded'):
+            body = base64.b64decode(body).decode('utf-8', errors='replace')
+        return body
+
+    def initial_state(self):
+        """Sayfaya gömülü ilk arama sonuçlarını (url, body) olarak döndür"""
+        try:
+            body = self.driver.execute_script(INITIAL_STATE_SCRIPT)
+        except Exception:
+            return []
+        return [('/search?tbm=map', body)] if body else []
+
+
+def save_fixture(record_dir, url, body):
+    """Yanıtı tekrar oynatılabilir JSON fixture olarak kaydet"""
+    os.makedirs(record_dir, exist_ok=True)
+    path = os.path.join(record_dir, f"response_{time.time_ns()}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'url': url, 'body': body}, f, ensure_ascii=False)
+    return path
+
+
+def load_fixtures(path):
+    """Dosya veya klasördeki fixture'ları (url, body) olarak yükle"""
+    paths = [path]
+    if os.path.isdir(path):
+        paths = sorted(os.path.join(path, name) for name in os.listdir(path) if name.endswith('.json'))
+    fixtures = []
+    for fixture_path in paths:
+        with open(fixture_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        fixtures.append((data.get('url', ''), data.get('body', '')))
+    return fixtures
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Kullanım: python network_extract.py <fixture dosyası veya klasörü>")
+        sys.exit(1)
+
+    fixtures = load_fixtures(sys.argv[1])
+    started = time.perf_counter()
+    records = [record for url, body in fixtures for record in records_from_response(url, body)]
+    elapsed = time.perf_counter() - started
+
+    print(f"{len(fixtures)} yanıt, {len(records)} işletme, {elapsed * 1000:.1f} ms")
+    for record in records:
+        print(f"- {record['Ad']} | {record['Telefon'] or '-'} | {record['Adres'] or '-'} | "
+              f"{record['Puan/Yorum'] or '-'} | {record.get('Yer ID', '-')}")
+    # Fixture'lardan hiç işletme çözülemediyse çıkış kodu ile bildir (regresyon kontrolü)
+    sys.exit(0 if records or not fixtures else 2)
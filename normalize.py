@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Toplanan kayıtlar için toplu (vektörel) normalizasyon
+
+Kayıtlar tek bir DataFrame'e alınır ve pandas string işlemleriyle
+tipli sütunlar üretilir:
+    Telefon (E.164)  '+902125554433' (çözülemeyenler boş)
+    Puan             float (4.5)
+    Yorum Sayısı     Int64 (1204)
+    Adres            boşlukları ve önekleri temizlenmiş adres
+Kayıt başına Python döngüsü yoktur; akış modunda her parça ayrı ayrı
+normalize edilebilir. Kayıtlar tek tek geldiğinde (iter_businesses)
+normalize_record aynı kuralları tek kayda uygular. Hız ölçümü:
+    python normalize.py
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from business_record import is_record_list, records_to_frame
+
+PHONE_E164 = 'Telefon (E.164)'
+RATING = 'Puan'
+REVIEW_COUNT = 'Yorum Sayısı'
+
+# "4,5(120)", "4,5 yıldız 120 Yorum", "4.8 stars 1,204 Reviews"
+_RATING_PATTERN = r'(\d+[,.]\d+)'
+_REVIEWS_PATTERN = r'(?:\(\s*|\s)([\d.,]+)\s*(?:\)|[Yy]orum|[Rr]eview)'
+# Adres olarak kabul edilmeyen değerler: puan metni veya sadece sayı
+_NOT_ADDRESS_PATTERN = r'^(?:\d+,\d+\(\d+\).*|\d+)$'
+
+# Tek kayıt sürümleri için derlenmiş karşılıkları
+_RATING_RE = re.compile(_RATING_PATTERN)
+_REVIEWS_RE = re.compile(_REVIEWS_PATTERN)
+_NOT_ADDRESS_RE = re.compile(_NOT_ADDRESS_PATTERN)
+_ADDRESS_PREFIX_RE = re.compile(r'^\s*Adres:\s*')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _text_column(df, column):
+    if column not in df.columns:
+        return pd.Series('', index=df.index, dtype=object)
+    return df[column].fillna('').astype(str)
+
+
+def _on_unique(series, transform):
+    """Dönüşümü yalnızca tekil değerlerde çalıştırıp sonucu tüm satırlara yay"""
+    codes, uniques = pd.factorize(series)
+    result = transform(pd.Series(uniques))
+    if isinstance(result, tuple):
+        return tuple(pd.Series(part.to_numpy()[codes], index=series.index) for part in result)
+    return pd.Series(result.to_numpy()[codes], index=series.index)
+
+
+def normalize_phones(phones):
+    """Telefonları E.164 biçimine çevir (Türkiye numaraları varsayılır)"""
+    digits = phones.str.replace(r'\D', '', regex=True)
+    length = digits.str.len()
+    e164 = np.select(
+        [
+            digits.str.startswith('90') & (length == 12),   # 90 212 555 44 33
+            digits.str.startswith('0') & (length == 11),    # 0212 555 44 33
+            ~digits.str.startswith('0') & (length == 10),   # 212 555 44 33
+        ],
+        [
+            '+' + digits,
+            '+90' + digits.str[1:],
+            '+90' + digits,
+        ],
+        default=''
+    )
+    return pd.Series(e164, index=phones.index, dtype=object)
+
+
+def phone_to_e164(phone):
+    """normalize_phones'un tek değer sürümü (kayıt başına kontroller için); çözülemezse ''"""
+    digits = ''.join(ch for ch in phone or '' if ch.isdecimal())
+    if digits.startswith('90') and len(digits) == 12:
+        return '+' + digits
+    if digits.startswith('0') and len(digits) == 11:
+        return '+90' + digits[1:]
+    if not digits.startswith('0') and len(digits) == 10:
+        return '+90' + digits
+    return ''
+
+
+def parse_ratings(ratings):
+    """Puan/Yorum metninden (puan, yorum sayısı) sütunlarını çıkar"""
+    rating = pd.to_numeric(
+        ratings.str.extract(_RATING_PATTERN, expand=False).str.replace(',', '.', regex=False),
+        errors='coerce'
+    )
+    review_count = pd.to_numeric(
+        ratings.str.extract(_REVIEWS_PATTERN, expand=False).str.replace(r'[.,]', '', regex=True),
+        errors='coerce'
+    )
+    return rating, review_count
+
+
+def clean_addresses(addresses):
+    """Adresleri tek satıra indir, 'Adres:' önekini ve baştaki ayraçları at"""
+    cleaned = (
+        addresses
+        .str.replace(r'^\s*Adres:\s*', '', regex=True)
+        .str.replace(r'\s+', ' ', regex=True)
+        .str.strip(' ·,;-')
+    )
+    return cleaned.mask(cleaned.str.match(_NOT_ADDRESS_PATTERN), '')
+
+
+def parse_rating(text):
+    """parse_ratings'in tek değer sürümü: (puan, yorum sayısı), bulunamayan None"""
+    text = text or ''
+    match = _RATING_RE.search(text)
+    rating = float(match.group(1).replace(',', '.')) if match else None
+    match = _REVIEWS_RE.search(text)
+    digits = re.sub(r'[.,]', '', match.group(1)) if match else ''
+    return rating, int(digits) if digits.isdigit() else None
+
+
+def clean_address(address):
+    """clean_addresses'in tek değer sürümü"""
+    cleaned = _WHITESPACE_RE.sub(' ', _ADDRESS_PREFIX_RE.sub('', address or '')).strip(' ·,;-')
+    return '' if _NOT_ADDRESS_RE.match(cleaned) else cleaned
+
+
+def normalize_record(record):
+    """
+    Tek kaydı normalize_records ile aynı kurallarla düz sözlüğe çevir
+
+    Returns:
+        dict: Orijinal alanlar + Telefon (E.164), Puan, Yorum Sayısı; Adres temizlenmiş
+            (çözülemeyen puan / yorum sayısı None)
+    """
+    normalized = dict(record)
+    normalized[PHONE_E164] = phone_to_e164(str(record.get('Telefon') or ''))
+    normalized[RATING], normalized[REVIEW_COUNT] = parse_rating(str(record.get('Puan/Yorum') or ''))
+    normalized['Adres'] = clean_address(str(record.get('Adres') or ''))
+    return normalized
+
+
+def normalize_records(records):
+    """
+    Kayıtları tipli sütunlarla DataFrame olarak döndür
+
+    Args:
+        records (list | DataFrame): İşletme kayıtları (BusinessRecord / sözlük) veya DataFrame
+
+    Returns:
+        DataFrame: Orijinal sütunlar + Telefon (E.164), Puan, Yorum Sayısı; Adres temizlenmiş
+    """
+    if isinstance(records, pd.DataFrame):
+        df = records.copy()
+    elif is_record_list(records):
+        df = records_to_frame(records)
+    else:
+        df = pd.DataFrame(records)
+    if df.empty:
+        return df
+
+    # Aynı puan metni / adres çok tekrarlar - her tekil değer bir kez işlenir
+    df[PHONE_E164] = _on_unique(_text_column(df, 'Telefon'), normalize_phones)
+    df[RATING], review_count = _on_unique(_text_column(df, 'Puan/Yorum'), parse_ratings)
+    df[REVIEW_COUNT] = review_count.astype('Int64')
+    df['Adres'] = _on_unique(_text_column(df, 'Adres'), clean_addresses)
+    return df
+
+
+def normalize_in_chunks(records, chunk_size=10000):
+    """Akış modu: kayıtları parça parça normalize ederek DataFrame'ler üret"""
+    for start in range(0, len(records), chunk_size):
+        yield normalize_records(records[start:start + chunk_size])
+
+
+if __name__ == "__main__":
+    import time
+
+    samples = [
+        {'Ad': 'Kafe A', 'Adres': 'Adres: Caferağa Mah.  Moda Cd. No:12 ', 'Telefon': '0216 345 67 89',
+         'Puan/Yorum': '4,5(120)'},
+        {'Ad': 'Berber B', 'Adres': '· Bağdat Cd. No:245', 'Telefon': '(0212) 555 44 33',
+         'Puan/Yorum': '4,8 yıldız 1.204 Yorum'},
+        {'Ad': 'Eczane C', 'Adres': '4,1(33)', 'Telefon': '+90 532 111 22 33', 'Puan/Yorum': ''},
+        {'Ad': 'Market D', 'Adres': '', 'Telefon': '', 'Puan/Yorum': '3.9 stars 1,020 Reviews'},
+    ]
+    print(normalize_records(samples)[['Ad', 'Adres', PHONE_E164, RATING, REVIEW_COUNT]].to_string())
+
+    # Tekrarsız telefon/adres ile en kötü duruma yakın veri
+    records = [
+        {**sample, 'Telefon': f"0212 {i % 1000:03d} {i // 1000 % 100:02d} {i % 97:02d}",
+         'Adres': f"{sample['Adres']} D:{i}"}
+        for i, sample in enumerate(samples * 25000)
+    ]
+    started = time.perf_counter()
+    df = normalize_records(records)
+    elapsed = time.perf_counter() - started
+    print(f"\n{len(df)} kayıt: {elapsed:.3f} sn ({len(df) / elapsed:,.0f} kayıt/sn)")
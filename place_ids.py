@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Google Maps işletmeleri için kalıcı kimlik (place id) çözümleme
+"""
+
+import re
+from urllib.parse import unquote
+
+# ChIJ... biçimindeki Places API kimliği (URL'de !19s ile gelir)
+_PLACE_ID_RE = re.compile(r'!19s(ChIJ[\w-]+)')
+# 0x...:0x... biçimindeki özellik (feature) kimliği (URL'de !1s ile gelir)
+_FEATURE_ID_RE = re.compile(r'!1s(0x[0-9a-fA-F]+:0x[0-9a-fA-F]+)')
+# Koordinatlar (!3d enlem !4d boylam)
+_COORDS_RE = re.compile(r'!3d(-?\d+\.\d+)!4d(-?\d+\.\d+)')
+# /maps/place/<isim>/ kısmı
+_PLACE_NAME_RE = re.compile(r'/maps/place/([^/?]+)')
+
+# Kart üzerindeki data-* özniteliklerinden kimlik olabilecek anahtarlar
+_DATA_ID_KEYS = ('placeId', 'placeid', 'cid', 'featureId', 'fid')
+
+
+def extract_place_id(href, data_attributes=None):
+    """
+    Kart linkinden veya data-* özniteliklerinden kalıcı bir kimlik çıkar
+
+    Öncelik: Places kimliği (ChIJ...), özellik kimliği (0x..:0x..),
+    data-* öznitelikleri, son çare olarak isim + koordinat.
+
+    Returns:
+        str: Kimlik, bulunamazsa boş string
+    """
+    href = href or ''
+
+    match = _PLACE_ID_RE.search(href)
+    if match:
+        return match.group(1)
+
+    match = _FEATURE_ID_RE.search(href)
+    if match:
+        return match.group(1).lower()
+
+    for key in _DATA_ID_KEYS:
+        value = (data_attributes or {}).get(key)
+        if value:
+            return str(value)
+
+    name_match = _PLACE_NAME_RE.search(href)
+    coords_match = _COORDS_RE.search(href)
+    if name_match and coords_match:
+        name = unquote(name_match.group(1).replace('+', ' ')).strip().lower()
+        return f"{name}@{coords_match.group(1)},{coords_match.group(2)}"
+
+    return ''
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Toplanan kayıtların diskteki yalnızca-ekleme (append-only) günlüğü
+
+Her kayıt kabul edildiği anda JSONL satırı olarak tampona alınır; tampon
+belirli sayıda kayıtta veya sürede bir diske yazılıp fsync edilir. Chrome
+çöker ya da tarama durdurulursa günlük yeniden okunarak tarama kaldığı
+yerden sürdürülebilir. Aynı kayıt (örn. detayları sonradan eklenince)
+tekrar yazılabilir; okurken place id başına son satır geçerlidir.
+Sonuna kadar biten aramanın günlüğü silinir; diskte kalan günlük yarıda
+kalmış bir aramayı gösterir.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+
+from app_paths import app_data_path
+
+
+def journal_path(query, location='', key=None):
+    """
+    Arama başına günlük dosyası yolu (~/.mapminer/journals/<arama>.jsonl)
+
+    key (batch iş numarası) verilirse aynı arama + konumlu işler ayrı günlük tutar.
+    """
+    text = f"{query} {location}".strip()
+    if key is not None:
+        text += f" job {key}"
+    text = text.replace('İ', 'i').lower()
+    slug = re.sub(r'[^\w]+', '_', text).strip('_') or 'arama'
+    return app_data_path('journals', f"{slug}.jsonl")
+
+
+class RecordJournal:
+    def __init__(self, path, flush_every=25, flush_interval=2.0):
+        """
+        Args:
+            path (str): JSONL günlük dosyası
+            flush_every (int): Bu kadar kayıt birikince diske yaz
+            flush_interval (float): Son yazmadan bu kadar saniye geçtiyse diske yaz
+        """
+        self.path = path
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        self._file = None
+        self._lock = threading.Lock()  # Arayüz durdururken toplayıcı thread'i yazıyor olabilir
+        self.logger = logging.getLogger(__name__)
+
+    def load(self):
+        """
+        Günlükteki kayıtları yaz sırasıyla döndür
+
+        Aynı 'Yer ID' birden çok kez yazıldıysa son hali ilk yazıldığı sırada
+        döner. Yarım yazılmış son satır (çökme anı) atlanır.
+        """
+        if not os.path.exists(self.path):
+            return []
+        records = {}
+        anonymous = 0
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                key = record.get('Yer ID')
+                if not key:
+                    anonymous += 1
+                    key = ('', anonymous)
+                if key in records:
+                    records[key].update(record)
+                else:
+                    records[key] = record
+        return list(records.values())
+
+    def reset(self):
+        """Günlüğü boşalt (yeni tarama)"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def complete(self):
+        """Tarama sonuna kadar bitti: günlüğü sil (yalnızca yarıda kalan aramaların günlüğü kalır)"""
+        self.reset()
+
+    def append(self, record):
+        """Kaydı tampona ekle; tampon dolduysa veya süre geçtiyse diske yaz"""
+        line = json.dumps(dict(record), ensure_ascii=False, default=str)
+        with self._lock:
+            self._buffer.append(line)
+            due = len(self._buffer) >= self.flush_every or time.monotonic() - self._last_flush >= self.flush_interval
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Tampondaki kayıtları tek yazma + fsync ile diske aktar"""
+        with self._lock:
+            if not self._buffer:
+                return
+            try:
+                prefix = ''
+                if self._file is None:
+                    prefix = self._missing_newline()
+                    self._file = open(self.path, 'a', encoding='utf-8')
+                self._file.write(prefix + '\n'.join(self._buffer) + '\n')
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._buffer = []
+                self._last_flush = time.monotonic()
+            except OSError as e:
+                self.logger.warning(f"Kayıt günlüğü yazılamadı: {e}")
+
+    def _missing_newline(self):
+        """Çökmede yarım kalan son satır sonraki kayıtla birleşmesin diye gereken ayraç"""
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                return '' if f.read(1) == b'\n' else '\n'
+        except OSError:
+            return ''
+
+    def close(self):
+        """Kalan kayıtları yaz ve dosyayı kapat"""
+        self.flush()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kalıcı, indeksli SQLite sonuç deposu
+
+Tüm aramaların işletmeleri place id anahtarlı tek bir tabloda birikir;
+kategori, şehir/ilçe, telefon ve puan üzerinde indeks vardır. Yazmalar
+toplu yapılır, WAL modu sayesinde birden çok scraper süreci aynı anda
+yazabilir. Örnek sorgu:
+
+    store = ResultStore()
+    store.query(category='Berber', district='Kadıköy', min_rating=4.5, has_phone=True)
+
+Hız ölçümü (varsayılan 1 milyon satır, geçici veritabanında):
+    python result_store.py [satır sayısı]
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+from app_paths import app_data_path
+from normalize import PHONE_E164, RATING, REVIEW_COUNT, _on_unique, normalize_records
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS places (
+    place_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    address TEXT,
+    phone TEXT,
+    phone_e164 TEXT,
+    rating_text TEXT,
+    rating REAL,
+    review_count INTEGER,
+    category TEXT COLLATE NOCASE,
+    city TEXT COLLATE NOCASE,
+    district TEXT COLLATE NOCASE,
+    website TEXT,
+    map_url TEXT,
+    latitude REAL,
+    longitude REAL,
+    query TEXT,
+    location TEXT,
+    extra TEXT,
+    first_seen TEXT,
+    last_seen TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_places_category ON places (category, district, rating);
+CREATE INDEX IF NOT EXISTS idx_places_city_district ON places (city, district, rating);
+CREATE INDEX IF NOT EXISTS idx_places_district ON places (district, rating);
+CREATE INDEX IF NOT EXISTS idx_places_city ON places (city, rating);
+CREATE INDEX IF NOT EXISTS idx_places_phone ON places (phone_e164);
+CREATE INDEX IF NOT EXISTS idx_places_rating ON places (rating);
+"""
+
+COLUMNS = (
+    'place_id', 'name', 'address', 'phone', 'phone_e164', 'rating_text', 'rating', 'review_count',
+    'category', 'city', 'district', 'website', 'map_url', 'latitude', 'longitude',
+    'query', 'location', 'extra', 'first_seen', 'last_seen'
+)
+
+# Yeni değer boşsa eski değer korunur; first_seen hiç değişmez
+UPSERT_SQL = f"""
+INSERT INTO places ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})
+ON CONFLICT(place_id) DO UPDATE SET
+{', '.join(
+    f"{column} = COALESCE(NULLIF(excluded.{column}, ''), places.{column})"
+    for column in COLUMNS if column not in ('place_id', 'first_seen')
+)}
+"""
+
+# Kayıt anahtarı -> sütun
+RECORD_COLUMNS = {
+    'Ad': 'name', 'Adres': 'address', 'Telefon': 'phone', PHONE_E164: 'phone_e164',
+    'Puan/Yorum': 'rating_text', RATING: 'rating', REVIEW_COUNT: 'review_count',
+    'Kategori': 'category', 'Şehir': 'city', 'İlçe': 'district', 'Website': 'website',
+    'Harita Linki': 'map_url', 'Enlem': 'latitude', 'Boylam': 'longitude',
+    'Arama': 'query', 'Konum': 'location'
+}
+_SKIPPED_KEYS = set(RECORD_COLUMNS) | {'Yer ID', 'Sıra'}
+
+# "... 34710 Kadıköy/İstanbul" -> (İstanbul, Kadıköy)
+_DISTRICT_CITY_RE = re.compile(r'(?:^|,)\s*(?:\d{5}\s+)?([^,/]+?)\s*/\s*([^,/]+?)\s*$')
+
+
+def split_city_district(address):
+    """Adresin sonundaki 'İlçe/Şehir' kısmını (şehir, ilçe) olarak döndür"""
+    match = _DISTRICT_CITY_RE.search(address or '')
+    if not match:
+        return '', ''
+    return match.group(2).strip(), match.group(1).strip()
+
+
+def split_city_district_column(addresses):
+    """split_city_district'in Series sürümü: (ilçe, şehir) sütunları"""
+    parts = addresses.str.extract(_DISTRICT_CITY_RE).fillna('')
+    return parts[0].str.strip(), parts[1].str.strip()
+
+
+def fallback_place_id(name, address):
+    """Place id'si olmayan kayıt için ad + adresten kararlı anahtar"""
+    key = f"{(name or '').strip().lower()}|{(address or '').strip().lower()}"
+    return 'h:' + hashlib.sha1(key.encode('utf-8')).hexdigest()[:20]
+
+
+class ResultStore:
+    def __init__(self, path=None, batch_size=500):
+        """
+        Args:
+            path (str): Veritabanı dosyası (varsayılan: ~/.mapminer/results.db)
+            batch_size (int): Bu kadar satır birikince tek işlemde yazılır
+        """
+        self.path = path or app_data_path('results.db')
+        self.batch_size = batch_size
+        self._pending = []
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+        self.connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        # WAL: okuyucular yazanı beklemez, birden çok süreç sırayla yazabilir
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA busy_timeout=30000")
+        self.connection.executescript(SCHEMA)
+
+    def add(self, records, query='', location=''):
+        """
+        Kayıtları (liste veya normalize edilmiş DataFrame) depoya ekle/güncelle
+
+        Returns:
+            int: Yazılmak üzere alınan satır sayısı
+        """
+        df = normalize_records(records)
+        if df.empty or 'Ad' not in df.columns:
+            return 0
+        df = df[df['Ad'].fillna('').astype(str) != '']
+        if df.empty:
+            return 0
+        now = datetime.now().isoformat(timespec='seconds')
+
+        # Sütunlar vektörel hazırlanır; satır başına sadece tuple kurulur
+        columns = {
+            column: df[key].astype(object).where(df[key].notna(), None) if key in df.columns else None
+            for key, column in RECORD_COLUMNS.items()
+        }
+        addresses = df['Adres'].fillna('').astype(str) if 'Adres' in df.columns else pd.Series('', index=df.index)
+        district, city = _on_unique(addresses, split_city_district_column)
+        for column, parsed, default in (('city', city, ''), ('district', district, ''),
+                                        ('query', None, query), ('location', None, location)):
+            current = columns[column]
+            fallback = parsed if parsed is not None else pd.Series(default, index=df.index)
+            columns[column] = fallback if current is None else current.where(current.fillna('') != '', fallback)
+
+        ids = df['Yer ID'].fillna('').astype(str) if 'Yer ID' in df.columns else pd.Series('', index=df.index)
+        missing = ids == ''
+        if missing.any():
+            ids = ids.astype(object)
+            ids[missing] = [fallback_place_id(name, address)
+                            for name, address in zip(df.loc[missing, 'Ad'], addresses[missing])]
+        columns['place_id'] = ids
+
+        extra_keys = [key for key in df.columns if key not in _SKIPPED_KEYS]
+        if extra_keys:
+            columns['extra'] = [
+                json.dumps(extra, ensure_ascii=False, default=str) if extra else None
+                for extra in (
+                    {key: value for key, value in zip(extra_keys, values) if value is not None and value == value
+                     and value != ''}
+                    for values in df[extra_keys].itertuples(index=False, name=None)
+                )
+            ]
+        columns['first_seen'] = columns['last_seen'] = [now] * len(df)
+
+        size = len(df)
+        rows = list(zip(*(
+            [None] * size if columns.get(column) is None else list(columns[column])
+            for column in COLUMNS
+        )))
+
+        with self._lock:
+            self._pending.extend(rows)
+            due = len(self._pending) >= self.batch_size
+        if due:
+            self.flush()
+        return len(rows)
+
+    def flush(self):
+        """Bekleyen satırları tek işlemde yaz"""
+        with self._lock:
+            rows, self._pending = self._pending, []
+            if not rows:
+                return
+            try:
+                with self.connection:
+                    self.connection.executemany(UPSERT_SQL, rows)
+            except sqlite3.Error as e:
+                self.logger.error(f"Sonuç deposuna yazılamadı: {e}")
+                self._pending = rows + self._pending
+
+    def query(self, category=None, city=None, district=None, min_rating=None, has_phone=None,
+              name_like=None, search=None, limit=None, order_by='rating DESC'):
+        """
+        Depodaki işletmeleri filtrele
+
+        Args:
+            category (str): Kategori (büyük/küçük harf duyarsız, tam eşleşme)
+            city (str): Şehir
+            district (str): İlçe
+            min_rating (float): En düşük puan
+            has_phone (bool): True ise sadece telefonu olanlar, False ise olmayanlar
+            name_like (str): Ad içinde geçen metin
+            search (str): Kaydın geldiği arama terimi
+            limit (int): En fazla satır
+            order_by (str): 'rating DESC', 'review_count DESC', 'name', 'last_seen DESC'
+
+        Returns:
+            list: Scraper kayıt şemasında sözlükler
+        """
+        return [record for chunk in self.iter_records(category=category, city=city, district=district,
+                                                      min_rating=min_rating, has_phone=has_phone,
+                                                      name_like=name_like, search=search, limit=limit,
+                                                      order_by=order_by)
+                for record in chunk]
+
+    def iter_records(self, chunk_size=50_000, category=None, city=None, district=None, min_rating=None,
+                     has_phone=None, name_like=None, search=None, limit=None, order_by='rating DESC'):
+        """query() ile aynı filtreler; sonuçları chunk_size'lık kayıt listeleri halinde akıt"""
+        if order_by not in ('rating DESC', 'review_count DESC', 'name', 'last_seen DESC'):
+            raise ValueError(f"Geçersiz sıralama: {order_by}")
+
+        conditions, params = [], []
+        for column, value in (('category', category), ('city', city), ('district', district), ('query', search)):
+            if value:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if min_rating is not None:
+            conditions.append("rating >= ?")
+            params.append(min_rating)
+        if has_phone is True:
+            conditions.append("phone_e164 IS NOT NULL AND phone_e164 != ''")
+        elif has_phone is False:
+            conditions.append("(phone_e164 IS NULL OR phone_e164 = '')")
+        if name_like:
+            conditions.append("name LIKE ?")
+            params.append(f"%{name_like}%")
+
+        sql = "SELECT * FROM places"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += f" ORDER BY {order_by}"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+
+        self.flush()
+        cursor = self.connection.execute(sql, params)
+        index = 0
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield [self._row_to_record(row, index + i) for i, row in enumerate(rows, 1)]
+            index += len(rows)
+
+    def count(self):
+        self.flush()
+        return self.connection.execute("SELECT COUNT(*) FROM places").fetchone()[0]
+
+    def _row_to_record(self, row, index):
+        record = {'Sıra': index, 'Yer ID': row['place_id']}
+        for key, column in RECORD_COLUMNS.items():
+            value = row[column]
+            if value not in (None, ''):
+                record[key] = value
+        if row['extra']:
+            record.update(json.loads(row['extra']))
+        record.setdefault('Adres', '')
+        record.setdefault('Telefon', '')
+        record.setdefault('Puan/Yorum', '')
+        return record
+
+    def save_to_excel(self, filename=None, **filters):
+        """Bir sorgunun sonucunu scraper'ın Excel biçimiyle kaydet (filtreler: query() ile aynı)"""
+        from google_maps_scraper import GoogleMapsScraper
+
+        records = self.query(**filters)
+        scraper = GoogleMapsScraper(notify=False, selector_stats_path=False, result_store=False)
+        scraper.current_query = filters.get('category') or filters.get('search') or 'Depo'
+        scraper.current_location = filters.get('district') or filters.get('city') or ''
+        return scraper.save_to_excel(filename, records=records)
+
+    def export(self, filename, fmt='csv', compression=None, chunk_size=50_000, **filters):
+        """
+        Sorgu sonucunu CSV / JSONL / Parquet olarak parça parça yaz (filtreler: query() ile aynı)
+
+        EXPORT_COLUMNS dışındaki alanlar (ek alanlar, şehir/ilçe) da yazılır. Sütunlar
+        tüm parçalarda aynı olmalı (CSV başlığı, Parquet şeması); bu yüzden sorgu
+        önce bir kez sütunları toplamak için taranır, bellekte biriktirilmez.
+
+        Returns:
+            int: Yazılan satır sayısı
+        """
+        from data_export import export_chunks, export_columns, typed_chunk
+
+        columns = export_columns(record for records in self.iter_records(chunk_size, **filters) for record in records)
+        chunks = (typed_chunk(normalize_records(records), columns)
+                  for records in self.iter_records(chunk_size, **filters))
+        return export_chunks(chunks, filename, fmt, compression)
+
+    def close(self):
+        self.flush()
+        self.connection.close()
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import tempfile
+    import time
+
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    categories = ['Berber', 'Kuaför', 'Restoran', 'Kafe', 'Eczane', 'Market', 'Oto Servisi', 'Otel']
+    districts = ['Kadıköy', 'Beşiktaş', 'Üsküdar', 'Şişli', 'Bakırköy', 'Maltepe', 'Ataşehir', 'Fatih']
+
+    path = os.path.join(tempfile.mkdtemp(), 'benchmark.db')
+    store = ResultStore(path, batch_size=50_000)
+    random.seed(1)
+
+    started = time.perf_counter()
+    chunk = 100_000
+    for offset in range(0, total, chunk):
+        store.add([
+            {
+                'Yer ID': f"ChIJbench{i}",
+                'Ad': f"{categories[i % 8]} {i}",
+                'Adres': f"Moda Cd. No:{i % 300}, 34710 {districts[(i // 8) % 8]}/İstanbul",
+                'Telefon': f"0216 {i % 1000:03d} {i // 1000 % 100:02d} {i % 97:02d}" if i % 3 else '',
+                'Puan/Yorum': f"{random.randint(10, 50) / 10:.1f}({i % 500})".replace('.', ','),
+                'Kategori': categories[i % 8],
+            }
+            for i in range(offset, min(offset + chunk, total))
+        ])
+    store.flush()
+    print(f"{store.count():,} satır yazıldı: {time.perf_counter() - started:.1f} sn")
+
+    for label, filters in [
+        ("Kadıköy'de ≥4.5 puanlı, telefonlu berberler", dict(category='Berber', district='Kadıköy',
+                                                            min_rating=4.5, has_phone=True)),
+        ("Beşiktaş'taki ilk 50 kafe", dict(category='Kafe', district='Beşiktaş', limit=50)),
+        ("İstanbul'da ≥4.9 puanlı ilk 100 işletme", dict(city='İstanbul', min_rating=4.9, limit=100)),
+    ]:
+        started = time.perf_counter()
+        rows = store.query(**filters)
+        print(f"{label}: {len(rows):,} kayıt, {(time.perf_counter() - started) * 1000:.1f} ms")
+    store.close()
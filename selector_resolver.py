@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Öğrenen selector sıralayıcı
+
+Her alan (kart listesi, isim, telefon, ...) için selector başına isabet oranı
+ve gecikme tutulur; en başarılı selector önce denenir, sürekli ıskalayanlar
+devre dışı bırakılır. İstatistikler diske yazılır, sonraki oturum kazanan
+sırayla başlar.
+"""
+
+import json
+import logging
+import os
+
+STATS_VERSION = 1
+
+
+class SelectorResolver:
+    def __init__(self, stats_path=None, dead_after=25):
+        """
+        Args:
+            stats_path (str): İstatistik JSON dosyası (None ise diske yazılmaz)
+            dead_after (int): Art arda bu kadar ıskalayan selector devre dışı kalır
+        """
+        self.stats_path = stats_path
+        self.dead_after = dead_after
+        self.selectors = {}  # alan -> selector -> istatistik
+        self.fields = {}  # alan -> alan düzeyinde istatistik
+        self.logger = logging.getLogger(__name__)
+        self.load()
+
+    def _selector_stats(self, field, selector):
+        return self.selectors.setdefault(field, {}).setdefault(
+            selector, {'hits': 0, 'misses': 0, 'consecutive_misses': 0, 'total_ms': 0.0, 'tries': 0}
+        )
+
+    def _is_dead(self, stats):
+        return stats['consecutive_misses'] >= self.dead_after
+
+    def order(self, field, selectors):
+        """
+        Selector'ları tekrarsız, ölüleri ayıklanmış ve en iyiden başlayarak sırala
+
+        Hiç istatistiği olmayan selector'lar verilen sırayı korur. Hepsi
+        ölüyse (sayfa yapısı değişmiş olabilir) tam liste geri döner.
+        """
+        unique = list(dict.fromkeys(selectors))
+        field_stats = self.selectors.get(field, {})
+        alive = [s for s in unique if not (s in field_stats and self._is_dead(field_stats[s]))]
+        if not alive:
+            return unique
+
+        def score(item):
+            position, selector = item
+            stats = field_stats.get(selector)
+            if not stats or not stats['tries']:
+                return (0, 0.0, 0.0, position)
+            judged = stats['hits'] + stats['misses']
+            hit_rate = stats['hits'] / judged if judged else 0.0
+            avg_ms = stats['total_ms'] / stats['tries']
+            # Kazananlar önce, aynı oranda hızlı olan önce
+            return (-1 if stats['hits'] else 1, -hit_rate, avg_ms, position)
+
+        return [selector for _, selector in sorted(enumerate(alive), key=score)]
+
+    def record(self, field, attempts):
+        """
+        Bir alanın çözümleme denemelerini kaydet
+
+        Args:
+            attempts (list): Denenme sırasıyla (selector, isabet, süre_saniye) demetleri
+
+        Alan hiçbir selector ile bulunamadıysa (veri kartta yok) ıskalar
+        selector'lara yazılmaz, yalnızca gecikme kaydedilir.
+        """
+        found = any(hit for _, hit, _ in attempts)
+        field_stats = self.fields.setdefault(field, {'attempts': 0, 'found': 0, 'total_ms': 0.0})
+        field_stats['attempts'] += 1
+        field_stats['found'] += int(found)
+
+        for selector, hit, elapsed in attempts:
+            stats = self._selector_stats(field, selector)
+            elapsed_ms = elapsed * 1000
+            stats['tries'] += 1
+            stats['total_ms'] += elapsed_ms
+            field_stats['total_ms'] += elapsed_ms
+            if hit:
+                stats['hits'] += 1
+                stats['consecutive_misses'] = 0
+            elif found:
+                stats['misses'] += 1
+                stats['consecutive_misses'] += 1
+                if stats['consecutive_misses'] == self.dead_after:
+                    self.logger.info(f"Selector devre dışı bırakıldı ({field}): {selector}")
+
+    def summary(self):
+        """Alan ve selector bazında isabet oranı / ortalama gecikme özeti"""
+        result = {}
+        for field, selectors in self.selectors.items():
+            field_stats = self.fields.get(field, {'attempts': 0, 'found': 0, 'total_ms': 0.0})
+            attempts = field_stats['attempts']
+            result[field] = {
+                'found_rate': field_stats['found'] / attempts if attempts else 0.0,
+                'avg_ms': field_stats['total_ms'] / attempts if attempts else 0.0,
+                'selectors': {
+                    selector: {
+                        'hit_rate': stats['hits'] / (stats['hits'] + stats['misses'])
+                        if stats['hits'] + stats['misses'] else 0.0,
+                        'avg_ms': stats['total_ms'] / stats['tries'] if stats['tries'] else 0.0,
+                        'dead': self._is_dead(stats)
+                    }
+                    for selector, stats in selectors.items()
+                }
+            }
+        return result
+
+    def load(self):
+        """Önceki oturumun istatistiklerini yükle"""
+        if not self.stats_path or not os.path.exists(self.stats_path):
+            return
+        try:
+            with open(self.stats_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == STATS_VERSION:
+                self.selectors = data.get('selectors', {})
+                self.fields = data.get('fields', {})
+        except Exception as e:
+            self.logger.warning(f"Selector istatistikleri okunamadı: {e}")
+
+    def save(self):
+        """İstatistikleri diske yaz"""
+        if not self.stats_path:
+            return
+        try:
+            # Birden çok süreç aynı dosyaya yazabilir - geçici dosya süreç başına ayrı
+            temp_path = f"{self.stats_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': STATS_VERSION, 'selectors': self.selectors, 'fields': self.fields},
+                          f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.stats_path)
+        except Exception as e:
+            self.logger.warning(f"Selector istatistikleri kaydedilemedi: {e}")
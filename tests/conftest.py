@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""Testler depo kökündeki modülleri doğrudan içe aktarır; tarayıcısız scraper fixture'ları"""
+
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app_paths  # noqa: E402
+from business_record import BusinessRecord  # noqa: E402
+
+
+class FakeSearch:
+    """search_businesses kayıtları record_callback ile veren tarayıcısız scraper"""
+
+    def __init__(self, succeed=True, delay=0.001):
+        self.succeed = succeed
+        self.delay = delay
+        self.stop_requested = False
+        self.emitted = 0
+        self.closed = False
+        self.options = {}
+
+    def search_businesses(self, query, location="", max_results=50, record_callback=None, **options):
+        self.options = options
+        self.stop_requested = False
+        for i in range(max_results):
+            if self.stop_requested:
+                break
+            time.sleep(self.delay)
+            self.emitted += 1
+            record_callback(BusinessRecord({'Sıra': i + 1, 'Ad': f"{query} {i}", 'Telefon': '0216 345 67 89',
+                                            'Puan/Yorum': '4,5(1.204)', 'Adres': 'Adres:  Moda Cd. No:12 ,'}))
+        return self.succeed
+
+    def request_stop(self):
+        self.stop_requested = True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_scraper():
+    """
+    FakeSearch üreticisi: fake_scraper(succeed=False, delay=0.01, base=GoogleMapsScraper)
+
+    base verilirse sahte arama o sınıfın metotlarıyla (örn. iter_businesses) birleşir.
+    """
+    def make(base=None, **kwargs):
+        cls = FakeSearch if base is None else type('FakeScraper', (FakeSearch, base), {})
+        return cls(**kwargs)
+
+    return make
+
+
+@pytest.fixture
+def app_home(tmp_path, monkeypatch):
+    """Uygulama veri dizini (günlükler, önbellekler) geçici klasörde"""
+    monkeypatch.setattr(app_paths, 'APP_DATA_DIR', str(tmp_path / 'home'))
+    return tmp_path / 'home'
+
+
+@pytest.fixture
+def offline_scraper(app_home):
+    """
+    Tarayıcısız GoogleMapsScraper sınıfı: offline_scraper(işletmeler, stop_after=None, **seçenekler)
+
+    search_businesses gerçek akışıyla çalışır (günlük, tekrar indeksi, sayaçlar,
+    record_callback); yalnızca driver ve feed okuma, verilen işletme listesiyle
+    değiştirilir. stop_after kayıttan sonra request_stop() çağrılır. Seçenekler
+    GoogleMapsScraper'a geçer (varsayılan: depo ve tekrar indeksi kapalı).
+    """
+    pytest.importorskip('selenium')
+    from dedup_index import DUPLICATE
+    from google_maps_scraper import GoogleMapsScraper
+
+    class OfflineScraper(GoogleMapsScraper):
+        def __init__(self, businesses, stop_after=None, **options):
+            options = {'notify': False, 'selector_stats_path': False, 'result_store': False, 'dedup_index': False,
+                       **options}
+            super().__init__(**options)
+            self.businesses = businesses
+            self.stop_after = stop_after
+            self.collected_places = []
+
+        def setup_driver(self):
+            self.driver = object()
+            return True
+
+        def _open_search(self, maps_url):
+            pass
+
+        def _collect(self, max_results, detailed_info=True, patient=True):
+            for business in self.businesses:
+                if len(self.collected_places) >= max_results or self.stop_requested:
+                    break
+                place_id = business.get('Yer ID')
+                if place_id and place_id in self.seen_place_ids:
+                    continue
+                record = BusinessRecord(business)
+                if self._check_duplicate(record) == DUPLICATE:
+                    continue
+                record['Sıra'] = len(self.business_data) + 1
+                if place_id:
+                    self.seen_place_ids.add(place_id)
+                self.business_data.append(record)
+                self.journal.append(record)
+                self._remember(record)
+                self._emit(record)
+                self.collected_places.append(place_id or record['Ad'])
+                if self.stop_after and len(self.collected_places) >= self.stop_after:
+                    self.request_stop()
+            return len(self.collected_places)
+
+        def close(self):
+            self.driver = None
+            super().close()
+
+    return OfflineScraper
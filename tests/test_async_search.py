@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""asyncio arama API'si: geri basınç, erken çıkış, hata ve eşzamanlı aramalar"""
+
+import asyncio
+import threading
+
+import pytest
+
+from async_search import search_async, search_many_async, stream_search
+
+
+async def collect(generator, limit=None):
+    records = []
+    async for record in generator:
+        records.append(record)
+        if limit and len(records) >= limit:
+            break
+    await generator.aclose()
+    return records
+
+
+def test_stream_search_yields_records_in_order(fake_scraper):
+    records = stream_search(fake_scraper(), 'kafe', 'Moda', 25, queue_size=3)
+    assert [record['Sıra'] for record in records] == list(range(1, 26))
+
+
+def test_yields_every_record_in_order(fake_scraper):
+    records = asyncio.run(collect(search_async(fake_scraper(), 'kafe', 'Moda', 25, queue_size=3)))
+    assert [record['Sıra'] for record in records] == list(range(1, 26))
+
+
+def test_full_queue_blocks_the_search(fake_scraper):
+    scraper = fake_scraper(delay=0)
+
+    async def slow_consumer():
+        generator = search_async(scraper, 'kafe', max_results=100, queue_size=5)
+        await generator.__anext__()
+        await asyncio.sleep(0.2)
+        # Tüketici beklerken tarama kuyruk kapasitesi kadar ilerleyebilir
+        emitted = scraper.emitted
+        await generator.aclose()
+        return emitted
+
+    assert asyncio.run(slow_consumer()) <= 1 + 5 + 1
+
+
+def test_early_exit_stops_the_search_thread(fake_scraper):
+    scraper = fake_scraper()
+    threads = threading.active_count()
+
+    records = asyncio.run(collect(search_async(scraper, 'kafe', max_results=1000, queue_size=2), limit=3))
+
+    assert len(records) == 3
+    assert scraper.stop_requested
+    assert scraper.emitted < 20
+    assert threading.active_count() == threads
+
+
+def test_failed_search_raises_after_stream(fake_scraper):
+    with pytest.raises(RuntimeError, match='Arama başarısız'):
+        asyncio.run(collect(search_async(fake_scraper(succeed=False), 'kafe', 'Moda', 2)))
+
+
+def test_search_many_merges_jobs_with_bounded_concurrency(fake_scraper):
+    scrapers = []
+    done = {}
+
+    def factory():
+        scrapers.append(fake_scraper())
+        return scrapers[-1]
+
+    async def run():
+        jobs = [('kafe', 'Moda', 4), ('börek', 'Bahariye', 3), ('fırın', 'Yeldeğirmeni', 2)]
+        return await collect(search_many_async(jobs, concurrency=2, scraper_factory=factory, queue_size=2,
+                                               on_job_done=lambda index, error, seconds: done.update({index: error})))
+
+    results = asyncio.run(run())
+
+    assert sorted((index, record['Ad']) for index, record in results) == sorted(
+        [(0, f"kafe {i}") for i in range(4)] + [(1, f"börek {i}") for i in range(3)]
+        + [(2, f"fırın {i}") for i in range(2)]
+    )
+    assert done == {0: None, 1: None, 2: None}
+    assert len(scrapers) == 3 and all(scraper.closed for scraper in scrapers)
+    assert sorted(scraper.options['journal_key'] for scraper in scrapers) == [0, 1, 2]
+
+
+def test_cancelled_search_many_stops_every_search(fake_scraper):
+    scrapers = []
+
+    def factory():
+        scrapers.append(fake_scraper(delay=0.01))
+        return scrapers[-1]
+
+    async def run():
+        task = asyncio.ensure_future(collect(search_many_async([('kafe', 'Moda', 1000)] * 2, concurrency=2,
+                                                               scraper_factory=factory, queue_size=2)))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert all(scraper.stop_requested and scraper.closed for scraper in scrapers)
+    assert all(scraper.emitted < 100 for scraper in scrapers)
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""Batch motoru: birleştirme, çalışırken eklenen işler ve paralel bölgesel taramada doygun karo bölme"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import batch_engine
+from batch_engine import DONE, FAILED, BatchEngine, record_key
+from geo_tiles import SATURATION, Viewport, parse_viewport, viewport_location
+
+
+@pytest.fixture
+def run_jobs(monkeypatch):
+    """İşler Chrome süreçleri yerine thread'lerde, verilen fonksiyonla çalışır"""
+    calls = []
+
+    def install(search):
+        def run_job(query, location, max_results, extraction_mode, resume=False, job_id=None):
+            calls.append((query, location, job_id, resume))
+            return search(query, location, max_results)
+
+        monkeypatch.setattr(batch_engine, 'ProcessPoolExecutor', ThreadPoolExecutor)
+        monkeypatch.setattr(batch_engine, '_init_worker', lambda *args: None)
+        monkeypatch.setattr(batch_engine, '_run_job', run_job)
+        return calls
+
+    return install
+
+
+def test_merges_jobs_without_duplicates(run_jobs):
+    run_jobs(lambda query, location, max_results: [
+        {'Yer ID': 'ChIJ1', 'Ad': 'Moda Kahvecisi'},
+        {'Yer ID': f"ChIJ-{location}", 'Ad': f"{location} Börek"},
+    ])
+
+    results = BatchEngine([('kafe', 'Moda', 10), ('kafe', 'Bahariye', 10)], workers=2).run()
+
+    assert sorted(record['Ad'] for record in results) == ['Bahariye Börek', 'Moda Börek', 'Moda Kahvecisi']
+    assert [record['Sıra'] for record in results] == [1, 2, 3]
+
+
+def test_record_key_without_place_id():
+    assert record_key({'Ad': ' Moda Kahvecisi ', 'Adres': 'Moda Cd.'}) == ('moda kahvecisi', 'moda cd.')
+
+
+def test_failed_job_is_retried_with_its_own_journal(run_jobs):
+    attempts = []
+
+    def flaky(query, location, max_results):
+        attempts.append(location)
+        if len(attempts) == 1:
+            raise RuntimeError('driver çöktü')
+        return [{'Yer ID': 'ChIJ1', 'Ad': 'Moda Kahvecisi'}]
+
+    calls = run_jobs(flaky)
+    engine = BatchEngine([('kafe', 'Moda', 10)], workers=1, retries=1)
+    engine.run()
+
+    assert engine.jobs[0]['status'] == DONE and engine.jobs[0]['attempts'] == 2
+    assert calls == [('kafe', 'Moda', 0, False), ('kafe', 'Moda', 0, True)]
+
+
+def test_job_callback_adds_jobs_while_running(run_jobs):
+    calls = run_jobs(lambda query, location, max_results: [{'Yer ID': location, 'Ad': location}])
+
+    def follow_up(job, records):
+        if job['location'] == 'Moda':
+            engine.add_job(query='kafe', location='Moda Sahil', max_results=10)
+
+    engine = BatchEngine([('kafe', 'Moda', 10)], workers=2, job_callback=follow_up)
+    results = engine.run()
+
+    assert [record['Ad'] for record in results] == ['Moda', 'Moda Sahil']
+    assert [job['id'] for job in engine.jobs] == [0, 1]
+    assert calls[1] == ('kafe', 'Moda Sahil', 1, False)
+
+
+def test_job_callback_error_does_not_fail_the_job(run_jobs):
+    run_jobs(lambda query, location, max_results: [])
+
+    def broken(job, records):
+        raise ValueError('callback hatası')
+
+    engine = BatchEngine([('kafe', 'Moda', 10)], workers=1, job_callback=broken)
+    with pytest.raises(ValueError):
+        engine.run()
+    assert engine.jobs[0]['status'] != FAILED
+
+
+selenium = pytest.importorskip('selenium')
+
+from google_maps_scraper import GoogleMapsScraper  # noqa: E402
+from record_journal import RecordJournal  # noqa: E402
+
+ROOT = Viewport(41.0, 29.0, 13)
+
+
+class TileScraper(GoogleMapsScraper):
+    """Konum çözümlemesi tarayıcısız: tek kök karo"""
+
+    def __init__(self, journal_path):
+        super().__init__(notify=False, selector_stats_path=False, result_store=False, dedup_index=False)
+        self.journal = RecordJournal(journal_path)
+
+    def _plan_tiles(self, location, tile_zoom):
+        return [ROOT], 1280, 800
+
+
+def tile_search(query, location, max_results):
+    """Kök karo doygun (kapasite kadar kart), alt karolarda 10 işletme; ilk 5'i kökte de var"""
+    tile = parse_viewport(location)
+    if tile == ROOT:
+        return [{'Yer ID': f"root-{i}", 'Ad': f"Kök {i}"} for i in range(SATURATION)]
+    return [{'Yer ID': f"root-{i}" if i < 5 else f"{location}-{i}", 'Ad': f"{location} {i}"} for i in range(10)]
+
+
+def test_parallel_tiles_split_saturated_tiles(run_jobs, tmp_path):
+    calls = run_jobs(tile_search)
+    scraper = TileScraper(str(tmp_path / 'karo.jsonl'))
+
+    scraper._collect_tiles_parallel('kafe', viewport_location(ROOT), 1000, 13, workers=2)
+    scraper.journal.close()
+
+    assert scraper.metrics['tiles_split'] == 1
+    assert scraper.metrics['tiles_searched'] == 5
+    assert {parse_viewport(location).zoom for _, location, _, _ in calls[1:]} == {14}
+    # Alt karolarda kökte görülen işletmeler atlanır
+    assert len(scraper.business_data) == SATURATION + 4 * 5
+    assert len(scraper.journal.load()) == len(scraper.business_data)
+
+
+def test_parallel_tiles_stop_splitting_at_max_results(run_jobs, tmp_path):
+    calls = run_jobs(tile_search)
+    scraper = TileScraper(str(tmp_path / 'karo.jsonl'))
+
+    scraper._collect_tiles_parallel('kafe', viewport_location(ROOT), 50, 13, workers=2)
+    scraper.journal.close()
+
+    assert scraper.metrics['tiles_split'] == 0
+    assert len(calls) == 1
+    assert len(scraper.business_data) == 50
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""Parçalı CSV / JSONL / Parquet dışa aktarımı"""
+
+import csv
+import gzip
+import json
+
+import pytest
+
+from business_record import BusinessRecord
+from data_export import (EXPORT_COLUMNS, export_chunks, export_filename, format_of, pa, record_chunks,
+                         stream_chunks)
+from normalize import normalize_record
+
+RECORDS = [
+    BusinessRecord({'Sıra': i + 1, 'Yer ID': f"ChIJ{i}", 'Ad': f"İşletme {i}", 'Adres': 'Moda Cd. No:12',
+                    'Telefon': '0216 345 67 89', 'Puan/Yorum': '4,5(120)'})
+    for i in range(5)
+]
+RECORDS[1]['Açılış Saatleri'] = '09:00-18:00'
+RECORDS[3]['Özel Alan'] = 'x'
+
+
+@pytest.mark.parametrize('filename, fmt, compression, expected', [
+    ('kayitlar.xlsx', 'csv', 'gzip', 'kayitlar.csv.gz'),
+    ('kayitlar.csv.gz', 'jsonl', None, 'kayitlar.jsonl'),
+    ('kayitlar', 'parquet', 'zstd', 'kayitlar.parquet'),
+])
+def test_export_filename(filename, fmt, compression, expected):
+    assert export_filename(filename, fmt, compression) == expected
+
+
+def test_format_of():
+    assert format_of('a.csv.gz') == ('csv', 'gzip')
+    assert format_of('a.parquet') == ('parquet', None)
+    assert format_of('a.txt') == (None, None)
+
+
+def test_csv_keeps_optional_and_extra_fields(tmp_path):
+    path = str(tmp_path / 'kayitlar.csv.gz')
+    assert export_chunks(record_chunks(RECORDS, chunk_size=2), path, 'csv', 'gzip') == 5
+
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0])[:len(EXPORT_COLUMNS)] == EXPORT_COLUMNS
+    assert list(rows[0])[-1] == 'Özel Alan'
+    assert rows[1]['Açılış Saatleri'] == '09:00-18:00'
+    assert rows[3]['Özel Alan'] == 'x'
+    assert rows[0]['Telefon (E.164)'] == '+902163456789'
+
+
+def test_jsonl_streamed_records(tmp_path):
+    path = str(tmp_path / 'kayitlar.jsonl')
+    streamed = (normalize_record(record) for record in RECORDS)
+    assert export_chunks(stream_chunks(streamed, chunk_size=2), path, 'jsonl') == 5
+
+    with open(path, encoding='utf-8') as f:
+        rows = [json.loads(line) for line in f]
+    assert [row['Sıra'] for row in rows] == [1, 2, 3, 4, 5]
+    assert rows[0]['Puan'] == 4.5 and rows[0]['Yorum Sayısı'] == 120
+    # Akışta sütunlar baştan bilinir: EXPORT_COLUMNS dışındaki alanlar yazılmaz
+    assert list(rows[0]) == EXPORT_COLUMNS
+
+
+@pytest.mark.skipif(pa is None, reason="pyarrow kurulu değil")
+def test_parquet_defaults_to_snappy(tmp_path):
+    import pyarrow.parquet as pq
+
+    path = str(tmp_path / 'kayitlar.parquet')
+    assert export_chunks(record_chunks(RECORDS), path, 'parquet') == 5
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.row_group(0).column(0).compression == 'SNAPPY'
+    assert parquet.schema_arrow.field('Yorum Sayısı').type == pa.int64()
+
+    export_chunks(record_chunks(RECORDS), path, 'parquet', 'none')
+    assert pq.ParquetFile(path).metadata.row_group(0).column(0).compression == 'UNCOMPRESSED'
+
+
+def test_invalid_compression_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        export_chunks(record_chunks(RECORDS), str(tmp_path / 'a.csv'), 'csv', 'snappy')
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Taramalar arası tekrar indeksi: anahtarlar, aynı tarama tekrarları, bilinen kayıtlar"""
+
+import pytest
+
+from dedup_index import DUPLICATE, KNOWN, DedupIndex, has_details, record_keys
+
+
+@pytest.fixture
+def index(tmp_path):
+    dedup = DedupIndex(str(tmp_path / 'dedup.db'), batch_size=2)
+    yield dedup
+    dedup.close()
+
+
+def test_record_keys_strongest_first():
+    keys = record_keys({'Yer ID': 'ChIJ1', 'Telefon': '0216 345 67 89', 'Ad': 'Moda Kahvecisi',
+                        'Adres': 'Adres: Moda Cd. No:12'})
+
+    assert keys[:2] == ['id:ChIJ1', 'tel:+902163456789']
+    assert keys[2].startswith('na:')
+    # Büyük/küçük harf, noktalama ve 'Adres:' öneki ad + adres anahtarını değiştirmez
+    assert record_keys({'Ad': 'MODA kahvecisi', 'Adres': 'Moda Cd, No 12'}) == keys[2:]
+
+
+def test_same_run_duplicate_by_phone(index):
+    index.remember({'Yer ID': 'ChIJ1', 'Ad': 'Moda Kahvecisi', 'Telefon': '0216 345 67 89'})
+
+    assert index.check({'Ad': 'Moda Kahvecisi Şube', 'Telefon': '+90 216 345 67 89'}) == (DUPLICATE, None)
+    # Ortak numaralı ama place id'si farklı işletme aynı sayılmaz
+    assert index.check({'Yer ID': 'ChIJ2', 'Ad': 'Başka', 'Telefon': '0216 345 67 89'}) == (None, None)
+
+
+def test_known_from_previous_run_requires_phone(index):
+    index.remember({'Yer ID': 'ChIJ1', 'Ad': 'Moda Kahvecisi', 'Adres': 'Moda Cd. No:12',
+                    'Telefon': '0216 345 67 89', 'Website': 'moda.example.com'})
+    index.remember({'Yer ID': 'ChIJ2', 'Ad': 'Bahariye Börek', 'Adres': 'Bahariye Cd. No:40', 'Telefon': ''})
+    index.flush()
+    index.new_session()
+
+    status, stored = index.check({'Yer ID': 'ChIJ1', 'Ad': 'Moda Kahvecisi'})
+    assert status == KNOWN
+    assert stored['Website'] == 'moda.example.com'
+    # Yalnızca kart adresi olan kayıt yeniden zenginleştirilmeli
+    assert index.check({'Yer ID': 'ChIJ2', 'Ad': 'Bahariye Börek'}) == (None, None)
+
+
+def test_has_details():
+    assert has_details({'Telefon': '0216 345 67 89'})
+    assert not has_details({'Adres': 'Moda Cd. No:12'})
+
+
+def test_each_search_starts_a_new_session(offline_scraper, tmp_path):
+    # Place id'siz kartlar (örn. ağ yanıtı) telefonla eşleşir
+    businesses = [{'Ad': 'Moda Kahvecisi', 'Telefon': '0216 345 67 89', 'Website': 'moda.example.com'},
+                  {'Ad': 'Bahariye Börek', 'Telefon': '0216 111 22 33'}]
+    dedup = DedupIndex(str(tmp_path / 'dedup.db'))
+    scraper = offline_scraper(businesses, dedup_index=dedup)
+
+    assert scraper.search_businesses('kafe', 'Moda', 5)
+    scraper.collected_places = []
+    assert scraper.search_businesses('kafe', 'Moda', 5)
+
+    # İkinci aramada ilk aramanın işletmeleri tekrar (DUPLICATE) değil, bilinen (KNOWN) sayılır
+    assert [record['Ad'] for record in scraper.business_data] == ['Moda Kahvecisi', 'Bahariye Börek'] * 2
+    assert scraper.metrics['details_reused'] == 2
+    assert scraper.metrics['duplicates_skipped'] == 0
+    dedup.close()
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""ChromeDriver yolu önbelleği: isabet, ıskalama (sürüm değişimi), internetsiz açılış ve elle verilen yol"""
+
+import json
+
+import pytest
+
+import driver_cache
+from driver_cache import CACHE_VERSION, DRIVER_PATH_ENV, resolve_driver_path
+
+webdriver_manager_chrome = pytest.importorskip('webdriver_manager.chrome')
+
+
+@pytest.fixture
+def chrome(monkeypatch, tmp_path, app_home):
+    """Yerel Chrome sürümü ve ChromeDriverManager indirmesi ağsız; indirme sayısı tutulur"""
+    monkeypatch.delenv(DRIVER_PATH_ENV, raising=False)
+    state = {'version': '120.0.6099.109', 'downloads': 0, 'offline': False}
+
+    class FakeDriverManager:
+        def install(self):
+            if state['offline']:
+                raise ConnectionError('ağ yok')
+            state['downloads'] += 1
+            path = tmp_path / f"chromedriver-{state['downloads']}"
+            path.write_text('')
+            return str(path)
+
+    monkeypatch.setattr(driver_cache, 'local_chrome_version', lambda: state['version'])
+    monkeypatch.setattr(webdriver_manager_chrome, 'ChromeDriverManager', FakeDriverManager)
+    return state
+
+
+def test_download_then_cache_hit(chrome, app_home):
+    path, source = resolve_driver_path()
+    assert source == 'download' and chrome['downloads'] == 1
+
+    with open(app_home / 'driver_cache.json', encoding='utf-8') as f:
+        assert json.load(f) == {'version': CACHE_VERSION, 'driver_path': path, 'chrome_version': '120.0.6099.109'}
+
+    chrome['version'] = '120.0.6099.200'  # aynı ana sürüm
+    assert resolve_driver_path() == (path, 'cache')
+    assert chrome['downloads'] == 1
+
+
+def test_chrome_upgrade_is_a_cache_miss(chrome):
+    first, _ = resolve_driver_path()
+    chrome['version'] = '121.0.6167.85'
+
+    path, source = resolve_driver_path()
+
+    assert source == 'download' and path != first and chrome['downloads'] == 2
+    assert resolve_driver_path() == (path, 'cache')
+
+
+def test_missing_driver_file_is_a_cache_miss(chrome, tmp_path):
+    resolve_driver_path()
+    (tmp_path / 'chromedriver-1').unlink()
+
+    assert resolve_driver_path()[1] == 'download'
+    assert chrome['downloads'] == 2
+
+
+def test_offline_start_uses_stale_cache(chrome):
+    path, _ = resolve_driver_path()
+    chrome['version'], chrome['offline'] = None, True  # sürüm okunamadı, ağ yok
+
+    assert resolve_driver_path() == (path, 'stale-cache')
+
+
+def test_offline_without_cache_raises(chrome):
+    chrome['offline'] = True
+    with pytest.raises(ConnectionError):
+        resolve_driver_path()
+
+
+def test_explicit_path_skips_cache(chrome, monkeypatch, tmp_path):
+    driver = tmp_path / 'chromedriver'
+    driver.write_text('')
+
+    assert resolve_driver_path(str(driver)) == (str(driver), 'explicit')
+    monkeypatch.setenv(DRIVER_PATH_ENV, str(driver))
+    assert resolve_driver_path() == (str(driver), 'explicit')
+    assert chrome['downloads'] == 0
+    with pytest.raises(FileNotFoundError):
+        resolve_driver_path(str(tmp_path / 'yok'))
+
+
+def test_unknown_cache_version_is_ignored(chrome, app_home):
+    stale = app_home / 'driver_cache.json'
+    stale.parent.mkdir(parents=True, exist_ok=True)
+    stale.write_text(json.dumps({'version': CACHE_VERSION + 1, 'driver_path': __file__,
+                                 'chrome_version': '120.0.6099.109'}), encoding='utf-8')
+
+    assert resolve_driver_path()[1] == 'download'
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Akışlı Excel yazıcı: adlandırılmış stiller, koşullu biçimler ve sayısal puan"""
+
+import pandas as pd
+from openpyxl import load_workbook
+
+from excel_export import COLORS, COLUMN_WIDTHS, EXCEL_COLUMNS, SHEET_NAME, excel_frame, write_styled_excel
+from normalize import RATING, normalize_records
+
+RECORDS = [
+    {'Sıra': 1, 'Ad': 'Moda Kahvecisi', 'Adres': 'Moda Cd. No:12', 'Telefon': '0216 345 67 89',
+     'Puan/Yorum': '4,5(1.204)', 'Website': 'moda.example.com'},
+    {'Sıra': 2, 'Ad': 'Bahariye Börek', 'Adres': 'Bahariye Cd. No:40', 'Telefon': '0216 330 11 22',
+     'Puan/Yorum': '3,9(35)'},
+    {'Sıra': 3, 'Ad': 'Yeldeğirmeni Fırın', 'Adres': 'Karakolhane Cd. No:5', 'Telefon': '', 'Puan/Yorum': 'Yeni'},
+]
+
+
+def test_excel_frame_uses_numeric_rating():
+    frame = excel_frame(normalize_records(RECORDS), RATING)
+
+    assert list(frame.columns) == EXCEL_COLUMNS
+    assert list(frame['Puan/Yorum']) == [4.5, 3.9, 'Yeni']  # çözülemeyen metin kalır
+
+
+def test_styled_workbook(tmp_path):
+    path = str(tmp_path / 'isletmeler.xlsx')
+
+    assert write_styled_excel(excel_frame(normalize_records(RECORDS), RATING), path) == 3
+
+    workbook = load_workbook(path)
+    assert workbook.sheetnames == [SHEET_NAME]
+    assert {'mm_title', 'mm_header', 'mm_cell_left', 'mm_cell_center'} <= set(workbook.named_styles)
+    sheet = workbook[SHEET_NAME]
+
+    assert sheet['A1'].value.endswith('3 İşletme') and sheet['A1'].style == 'mm_title'
+    assert [str(cells) for cells in sheet.merged_cells.ranges] == ['A1:E1']
+    assert [cell.value for cell in sheet[2]] == EXCEL_COLUMNS
+    assert {cell.style for cell in sheet[2]} == {'mm_header'}
+    assert sheet['A2'].fill.fgColor.rgb.endswith(COLORS['header_bg'])
+    assert [cell.value for cell in sheet[3]] == [1, 'Moda Kahvecisi', 'Moda Cd. No:12', '0216 345 67 89', 4.5]
+    assert [cell.style for cell in sheet[3]] == ['mm_cell_center', 'mm_cell_left', 'mm_cell_left',
+                                                 'mm_cell_left', 'mm_cell_center']
+    assert sheet['D5'].value is None  # boş telefon boş hücre
+    assert sheet.column_dimensions['B'].width == COLUMN_WIDTHS['Ad']
+    assert sheet.max_row == 5
+
+
+def test_conditional_formats_cover_data_rows(tmp_path):
+    path = str(tmp_path / 'isletmeler.xlsx')
+    write_styled_excel(excel_frame(normalize_records(RECORDS), RATING), path)
+
+    sheet = load_workbook(path)[SHEET_NAME]
+    rules = {str(formatting.sqref): formatting.rules for formatting in sheet.conditional_formatting}
+
+    assert set(rules) == {'E3:E5', 'A3:E5'}
+    assert [(rule.operator, rule.formula) for rule in rules['E3:E5']] == [
+        ('greaterThan', ['4.4']), ('between', ['3.4', '4.4']), ('lessThan', ['3.5'])]
+    assert [rule.formula for rule in rules['A3:E5']] == [['MOD(ROW(),2)=0'], ['MOD(ROW(),2)=1']]
+    # Puan kuralları zebra satırlardan önce değerlendirilir
+    assert max(rule.priority for rule in rules['E3:E5']) < min(rule.priority for rule in rules['A3:E5'])
+
+
+def test_empty_frame_has_no_conditional_formats(tmp_path):
+    path = str(tmp_path / 'bos.xlsx')
+
+    assert write_styled_excel(pd.DataFrame(columns=EXCEL_COLUMNS), path, title='Boş') == 0
+
+    sheet = load_workbook(path)[SHEET_NAME]
+    assert sheet['A1'].value == 'Boş'
+    assert sheet.max_row == 2
+    assert not list(sheet.conditional_formatting)
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Parçalı Excel: parça planı, sayfa adları, dizin sayfası ve sayfa / dosya sayısı"""
+
+import os
+
+import pytest
+from openpyxl import load_workbook
+
+from excel_shards import INDEX_SHEET, _sheet_names, export_sharded, plan_shards
+from normalize import normalize_records
+
+DISTRICTS = ['Kadıköy', 'Beşiktaş', 'Üsküdar']
+
+FRAME = normalize_records([
+    {'Sıra': i + 1, 'Ad': f"İşletme {i}", 'Adres': f"Moda Cd. No:{i}, 34710 {DISTRICTS[i % 3]}/İstanbul",
+     'Telefon': '0216 345 67 89' if i % 2 else '', 'Puan/Yorum': f"4,{i % 10}({i})"}
+    for i in range(10)
+])
+
+
+def test_plan_by_row_budget():
+    shards = plan_shards(FRAME, rows_per_shard=4)
+    assert [(label, len(part)) for label, part in shards] == [('1-4', 4), ('5-8', 4), ('9-10', 2)]
+
+
+def test_plan_by_group_splits_large_groups():
+    shards = plan_shards(FRAME, rows_per_shard=3, group_by='İlçe')
+    # Kadıköy 4 kayıt (0, 3, 6, 9): bütçeyi aşınca numaralı parçalara bölünür
+    assert [(label, len(part)) for label, part in shards] == [
+        ('Beşiktaş', 3), ('Kadıköy (1)', 3), ('Kadıköy (2)', 1), ('Üsküdar', 3)]
+    with pytest.raises(ValueError):
+        plan_shards(FRAME, group_by='Olmayan')
+
+
+def test_sheet_names_are_valid_and_unique():
+    names = _sheet_names(['Kadıköy/Moda', 'kadıköy-moda', 'Dizin', 'A' * 40, ''])
+    assert names == ['Kadıköy-Moda', 'kadıköy-moda ~2', 'Dizin ~2', 'A' * 31, 'Parça']
+
+
+def test_sheets_mode_writes_index_and_one_sheet_per_shard(tmp_path):
+    path = str(tmp_path / 'ilceler.xlsx')
+
+    summaries = export_sharded(FRAME, path, group_by='İlçe', mode='sheets')
+
+    workbook = load_workbook(path)
+    assert workbook.sheetnames == [INDEX_SHEET, 'Beşiktaş', 'Kadıköy', 'Üsküdar']
+    assert [summary['İşletme'] for summary in summaries] == [3, 4, 3]
+    kadikoy = summaries[1]
+    assert kadikoy['Telefonlu'] == 2 and kadikoy['En Düşük'] == 4.0 and kadikoy['En Yüksek'] == 4.9
+    assert kadikoy['4.5+ Puanlı'] == 2
+
+    index = workbook[INDEX_SHEET]
+    assert index['A1'].value == '📑 DİZİN - 3 parça, 10 İşletme'
+    assert [row[0] for row in index.iter_rows(min_row=3, values_only=True)] == ['Beşiktaş', 'Kadıköy', 'Üsküdar']
+    assert index['B4'].value == '=HYPERLINK("#\'Kadıköy\'!A1","Sayfaya git")'
+    assert workbook['Kadıköy'].max_row == 2 + 4
+
+
+def test_files_mode_writes_one_file_per_shard(tmp_path):
+    path = str(tmp_path / 'isletmeler.xlsx')
+
+    summaries = export_sharded(FRAME, path, rows_per_shard=4, workers=1)
+
+    assert sorted(os.listdir(tmp_path)) == ['isletmeler.xlsx', 'isletmeler_001_1_4.xlsx',
+                                            'isletmeler_002_5_8.xlsx', 'isletmeler_003_9_10.xlsx']
+    assert [os.path.basename(summary['Dosya']) for summary in summaries] == sorted(os.listdir(tmp_path))[1:]
+    assert load_workbook(path).sheetnames == [INDEX_SHEET]
+    assert load_workbook(summaries[2]['Dosya']).active.max_row == 2 + 2
+    with pytest.raises(ValueError):
+        export_sharded(FRAME, path, mode='zip')
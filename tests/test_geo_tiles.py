@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Bölgesel arama ızgarası: görünüm / sınır kutusu çözümleme, karolama, bölme"""
+
+import pytest
+
+from geo_tiles import (MAX_TILE_ZOOM, Bounds, Viewport, is_saturated, parse_bounds, parse_viewport, split_tile,
+                       tile_grid, tile_url, viewport_bounds, viewport_location)
+
+
+def test_parse_viewport_from_url_and_location():
+    url = 'https://www.google.com/maps/place/Kad%C4%B1k%C3%B6y/@40.9906,29.0290,14.5z/data=!3m1'
+    assert parse_viewport(url) == Viewport(40.9906, 29.029, 14)
+    assert parse_viewport('@-33.8688,151.2093,12z') == Viewport(-33.8688, 151.2093, 12)
+    assert parse_viewport('Kadıköy') is None
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('40.80,28.60,41.25,29.40', Bounds(40.8, 28.6, 41.25, 29.4)),
+    (' 40.8 , 28.6 , 41.25 , 29.4 ', Bounds(40.8, 28.6, 41.25, 29.4)),
+    ('41.25,28.60,40.80,29.40', None),  # güney kuzeyden büyük
+    ('40.80,28.60,41.25', None),
+    ('İstanbul', None),
+])
+def test_parse_bounds(text, expected):
+    assert parse_bounds(text) == expected
+
+
+def test_viewport_location_round_trip():
+    viewport = Viewport(41.012345, 28.976543, 14)
+    assert viewport_location(viewport) == '@41.012345,28.976543,14z'
+    assert parse_viewport(tile_url('kafe moda', viewport)) == viewport
+    assert '/search/kafe+moda/' in tile_url('kafe moda', viewport)
+
+
+def test_tile_grid_covers_bounds():
+    bounds = viewport_bounds(Viewport(41.0, 29.0, 12))
+    tiles = tile_grid(bounds, 13)
+
+    # Bir düzey yakında her eksen iki kat büyür: örtüşmeyle birlikte en az 2x2 karo
+    assert len(tiles) >= 4
+    assert all(tile.zoom == 13 for tile in tiles)
+    assert all(bounds.south <= tile.lat <= bounds.north and bounds.west <= tile.lng <= bounds.east
+               for tile in tiles)
+    # Karoların kendi alanları bölgenin köşelerini örter (merkezler 6 basamağa yuvarlanır)
+    covered = [viewport_bounds(tile) for tile in tiles]
+    tolerance = 1e-5
+    assert min(area.south for area in covered) <= bounds.south + tolerance
+    assert max(area.north for area in covered) >= bounds.north - tolerance
+    assert min(area.west for area in covered) <= bounds.west + tolerance
+    assert max(area.east for area in covered) >= bounds.east - tolerance
+
+
+def test_small_bounds_single_tile():
+    bounds = viewport_bounds(Viewport(41.0, 29.0, 16))
+    assert tile_grid(bounds, 14) == [Viewport(41.0, 29.0, 14)]
+
+
+def test_split_tile_quadrants():
+    parent = Viewport(41.0, 29.0, 13)
+    children = split_tile(parent)
+
+    assert len(children) == 4
+    assert all(child.zoom == 14 for child in children)
+    area = viewport_bounds(parent)
+    assert all(area.south < child.lat < area.north and area.west < child.lng < area.east for child in children)
+    # Kuzeybatı, kuzeydoğu, güneybatı, güneydoğu
+    assert children[0].lat > children[2].lat and children[0].lng < children[1].lng
+    assert split_tile(Viewport(41.0, 29.0, MAX_TILE_ZOOM)) == []
+
+
+def test_is_saturated():
+    assert is_saturated(100)
+    assert not is_saturated(99)
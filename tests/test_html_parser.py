@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+lxml kart ve detay ayrıştırıcısının kayıtlı sayfalarla (fixture) tarayıcısız sınaması
+
+fixtures/html altındaki dosyalar feed ve detay panelinin yapısını (sınıflar,
+data-* ve aria-label öznitelikleri) korur; işletme bilgileri kurgusaldır.
+Yeni feed sayfası kaydetmek için:
+    MAPMINER_RECORD_HTML=kayitlar/ ile html modunda arama yapın
+"""
+
+import os
+
+import pytest
+from lxml import html as lxml_html
+
+from html_parser import inner_text, parse_detail_html, parse_feed_html
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'html')
+
+FIELD_SELECTORS = {
+    'name': ['.qBF1Pd'],
+    'rating': ["[role='img']"],
+    'phone': ['.Io6YTe.fontBodyMedium'],
+}
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def test_feed_cards_raw_fields():
+    cards = parse_feed_html(read_fixture('feed.html'), FIELD_SELECTORS)
+
+    assert [card['index'] for card in cards] == [0, 1, 2]
+    assert [card['label'] for card in cards] == ['Moda Kahvecisi', 'Bahariye Börek', 'Yeldeğirmeni Fırın']
+    moda = cards[0]
+    assert moda['element'] is None
+    # Göreli bağlantılar tarayıcıdaki gibi mutlak olur
+    assert moda['href'].startswith('https://www.google.com/maps/place/Moda+Kahvecisi/')
+    assert moda['data'] == {'value': 'Moda Kahvecisi'}
+    assert moda['text'] == 'Moda Kahvecisi\n4,5(1.204)\nKafe · Moda Cd. No:12\nAçık · Kapanış: 23:00 · 0216 345 67 89'
+    assert moda['fields']['name'] == {'.qBF1Pd': [{'t': 'Moda Kahvecisi', 'a': '', 'h': ''}]}
+    assert moda['fields']['rating']["[role='img']"][0]['a'] == '4,5 yıldız 1.204 Yorum'
+    assert [view['t'] for view in moda['fields']['phone']['.Io6YTe.fontBodyMedium']] == [
+        'Moda Cd. No:12', '0216 345 67 89']
+    assert cards[2]['fields']['rating'] == {"[role='img']": []}
+
+
+def test_start_skips_already_read_cards():
+    cards = parse_feed_html(read_fixture('feed.html'), FIELD_SELECTORS, start=2)
+    assert [(card['index'], card['label']) for card in cards] == [(2, 'Yeldeğirmeni Fırın')]
+
+
+def test_empty_and_invalid_input():
+    assert parse_feed_html('', FIELD_SELECTORS) == []
+    assert parse_feed_html('  \n', FIELD_SELECTORS) == []
+    cards = parse_feed_html(read_fixture('feed.html'), {'name': ['.qBF1Pd', '[[geçersiz']})
+    assert cards[0]['fields']['name']['[[geçersiz'] == []
+
+
+def test_fallback_card_selector():
+    page_html = """
+    <div role="feed">
+      <div role="article" data-result-index="4">
+        <a href="/maps/place/Moda+Kahvecisi" aria-label="Moda Kahvecisi">Moda Kahvecisi</a>
+      </div>
+    </div>
+    """
+    card, = parse_feed_html(page_html, {})
+    assert card['label'] == 'Moda Kahvecisi'
+    assert card['data'] == {'resultIndex': '4'}
+    assert card['href'] == 'https://www.google.com/maps/place/Moda+Kahvecisi'
+
+
+def test_inner_text_skips_scripts_and_joins_blocks():
+    card = parse_feed_html(read_fixture('feed.html'), {})[0]
+    assert 'cardInit' not in card['text']
+    assert inner_text(lxml_html.fromstring('<div>a  <b>b</b><p>c</p>d<script>x()</script></div>')) == 'a b\nc\nd'
+
+
+def test_detail_pane_selected_by_name():
+    detail = parse_detail_html(read_fixture('detail.html'), 'Bahariye Börek')
+
+    assert detail == {
+        'title': 'Bahariye Börek',
+        'phone_labels': ['Telefon: 0216 330 11 22 '],
+        'address_labels': ['Adres: Bahariye Cd. No:40, 34714 Kadıköy/İstanbul '],
+        'website': 'https://bahariyeborek.example.com/',
+        'category': 'Börekçi',
+        'url': ''
+    }
+
+
+def test_detail_without_name_reads_whole_page():
+    detail = parse_detail_html(read_fixture('detail.html'))
+
+    assert detail['title'] == 'Moda Kahvecisi'
+    assert len(detail['phone_labels']) == 2
+    assert parse_detail_html('') == {}
+    assert parse_detail_html(read_fixture('detail.html'), 'Olmayan İşletme')['title'] == 'Moda Kahvecisi'
+
+
+pytest.importorskip('selenium')
+
+from google_maps_scraper import CARD_FIELD_SELECTORS, GoogleMapsScraper  # noqa: E402
+
+
+@pytest.fixture
+def scraper():
+    return GoogleMapsScraper(notify=False, selector_stats_path=False, result_store=False, dedup_index=False)
+
+
+def test_feed_records_match_saved_page(scraper):
+    cards = parse_feed_html(read_fixture('feed.html'), CARD_FIELD_SELECTORS)
+    records = [scraper._extract_business_info(card, card['index']) for card in cards]
+
+    assert [(record['Sıra'], record['Ad'], record['Adres'], record['Telefon'], record['Puan/Yorum'])
+            for record in records] == [
+        (1, 'Moda Kahvecisi', 'Moda Cd. No:12', '0216 345 67 89', '4,5 yıldız 1.204 Yorum'),
+        (2, 'Bahariye Börek', 'Bahariye Cd. No:40', '0216 330 11 22', '4,2 yıldız 35 Yorum'),
+        (3, 'Yeldeğirmeni Fırın', 'Karakolhane Cd. No:5', '', ''),
+    ]
+    assert records[1]['Fiyat Seviyesi'] == '₺'
+    assert 'Fiyat Seviyesi' not in records[0]
+    assert records[2]['Harita Linki'] == cards[2]['href']
+
+
+def test_detail_fields_match_saved_page(scraper):
+    detail = parse_detail_html(read_fixture('detail.html'), 'Bahariye Börek')
+
+    assert scraper._parse_detail_fields(detail) == {
+        'Telefon': '0216 330 11 22',
+        'Adres': 'Bahariye Cd. No:40, 34714 Kadıköy/İstanbul',
+        'Website': 'https://bahariyeborek.example.com/',
+        'Kategori': 'Börekçi'
+    }
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""iter_businesses: normalize kayıtların geldikçe verilmesi, erken kapatma, hata, kayıt tutmama"""
+
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+pytest.importorskip('selenium')
+
+from google_maps_scraper import GoogleMapsScraper  # noqa: E402
+from normalize import PHONE_E164, RATING, REVIEW_COUNT, normalize_record, normalize_records  # noqa: E402
+
+
+@pytest.fixture
+def scraper(fake_scraper):
+    return lambda **kwargs: fake_scraper(base=GoogleMapsScraper, **kwargs)
+
+
+def test_yields_normalized_records_as_they_arrive(scraper):
+    started = time.perf_counter()
+    records = scraper(delay=0.01).iter_businesses('kafe', 'Moda', 20, queue_size=4)
+
+    first = next(records)
+    assert time.perf_counter() - started < 0.15  # taramanın bitmesi beklenmez (~0.2 sn)
+    assert isinstance(first, dict)
+    assert first[PHONE_E164] == '+902163456789'
+    assert first[RATING] == 4.5 and first[REVIEW_COUNT] == 1204
+    assert first['Adres'] == 'Moda Cd. No:12'
+    assert [record['Sıra'] for record in records] == list(range(2, 21))
+
+
+def test_closing_early_stops_the_search(scraper):
+    fake = scraper()
+    threads = threading.active_count()
+
+    for count, _ in enumerate(fake.iter_businesses('kafe', 'Moda', 1000, queue_size=2), 1):
+        if count == 3:
+            break
+
+    assert fake.stop_requested
+    assert fake.emitted < 20
+    assert threading.active_count() == threads
+
+
+def test_failed_search_raises_after_stream(scraper):
+    with pytest.raises(RuntimeError, match='Arama başarısız'):
+        list(scraper(succeed=False).iter_businesses('kafe', 'Moda', 2))
+
+
+BUSINESSES = [{'Yer ID': f"ChIJ{i}", 'Ad': f"İşletme {i}", 'Telefon': '0216 345 67 89'} for i in range(8)]
+
+
+def test_keep_records_false_only_counts(offline_scraper):
+    search = offline_scraper(BUSINESSES)
+    search.business_data = [{'Ad': 'önceki arama'}]
+
+    names = [record['Ad'] for record in search.iter_businesses('kafe', 'Moda', 5, keep_records=False)]
+
+    assert names == [f"İşletme {i}" for i in range(5)]
+    assert len(search.business_data) == 1 + 5  # sıra numaraları ve hedef kontrolü için sayılır
+    assert list(search.business_data) == [] and not search.business_data
+    assert not search.save_to_excel()  # kaydedilecek kayıt yok
+
+    # Varsayılan akış kayıtları yine business_data'da biriktirir
+    search.seen_place_ids, search.collected_places = set(), []
+    list(search.iter_businesses('kafe', 'Moda', 3))
+    assert [record['Ad'] for record in search.business_data] == [f"İşletme {i}" for i in range(3)]
+
+
+@pytest.mark.parametrize('record', [
+    {'Telefon': '+90 (532) 111 22 33', 'Puan/Yorum': '4.8 stars 87 Reviews', 'Adres': '4,5(120) Kafe'},
+    {'Telefon': '444 0 123', 'Puan/Yorum': 'Yeni', 'Adres': ' · Kadıköy/İstanbul ;'},
+    {'Ad': 'Alanları eksik kayıt'},
+])
+def test_normalize_record_matches_vectorized(record):
+    single = normalize_record(record)
+    row = normalize_records([record]).iloc[0]
+
+    for column in (PHONE_E164, RATING, REVIEW_COUNT, 'Adres'):
+        if single[column] is None:
+            assert pd.isna(row[column])
+        else:
+            assert single[column] == row[column]
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""Sayfa geçişleri boyunca bayt sayımı; sayım kurulamazsa driver yine açılır"""
+
+import pytest
+
+from lean_mode import ByteCounter, page_bytes
+
+
+class FakeDriver:
+    """PAGE_BYTES_SCRIPT yerine açık sayfanın bayt / istek sayısını döndürür"""
+
+    def __init__(self, transferred=0, requests=0):
+        self.transferred = transferred
+        self.requests = requests
+
+    def load(self, transferred, requests):
+        self.transferred, self.requests = transferred, requests
+
+    def execute_script(self, script):
+        return {'bytes': self.transferred, 'requests': self.requests}
+
+
+class BrokenDriver:
+    def execute_script(self, script):
+        raise RuntimeError('driver kapalı')
+
+
+def test_counts_every_page_once():
+    driver = FakeDriver(5000, 10)  # önceki aramadan kalan sayfa
+    counter = ByteCounter()
+    counter.start(driver)
+    assert counter.total(driver) == (0, 0)
+
+    driver.load(7000, 14)  # aynı sayfada yeni istekler
+    counter.checkpoint(driver)
+    driver.load(3000, 4)  # yeni sayfa
+    counter.checkpoint(driver)
+    driver.load(1000, 2)
+
+    assert counter.total(driver) == (2000 + 3000 + 1000, 4 + 4 + 2)
+
+
+def test_page_bytes_without_driver_response():
+    assert page_bytes(BrokenDriver()) == (0, 0)
+    assert page_bytes(FakeDriver()) == (0, 0)
+
+
+class NoCdpDriver(FakeDriver):
+    """DevTools komutlarını desteklemeyen driver (örn. uzak WebDriver)"""
+
+    def __init__(self, service=None, options=None):
+        super().__init__()
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def execute(self, driver_command, params=None):
+        return {}
+
+    def execute_cdp_cmd(self, cmd, params):
+        raise RuntimeError('CDP desteklenmiyor')
+
+    def execute_script(self, script, *args):
+        return super().execute_script(script)
+
+
+def test_setup_driver_survives_missing_byte_tracking(monkeypatch, app_home):
+    pytest.importorskip('selenium')
+    import google_maps_scraper
+    from google_maps_scraper import GoogleMapsScraper
+
+    monkeypatch.setattr(google_maps_scraper, 'resolve_driver_path', lambda path: ('chromedriver', 'test'))
+    monkeypatch.setattr(google_maps_scraper, 'Service', lambda path: None)
+    monkeypatch.setattr(google_maps_scraper.webdriver, 'Chrome', NoCdpDriver)
+    scraper = GoogleMapsScraper(notify=False, selector_stats_path=False, result_store=False, dedup_index=False)
+
+    assert scraper.setup_driver()
+    assert isinstance(scraper.driver, NoCdpDriver)
+    assert scraper.byte_counter.total(scraper.driver) == (0, 0)
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Ağ yanıtı çözümleyicisinin kaydedilmiş yanıtlarla (fixture) tarayıcısız sınaması
+
+fixtures/network altındaki dosyalar NetworkCapture'ın kayıt biçimindedir
+({'url', 'body'}); gerçek yanıtların yapısı korunup işletme bilgileri
+kurgusal değerlerle değiştirilmiştir. Yeni yanıt kaydetmek için:
+    MAPMINER_RECORD_RESPONSES=kayitlar/ ile network modunda arama yapın
+"""
+
+import os
+
+import pytest
+
+from network_extract import decode_body, load_fixtures, places_from_response, records_from_response
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'network')
+
+
+def fixture_records(name):
+    (url, body), = load_fixtures(os.path.join(FIXTURE_DIR, name))
+    return records_from_response(url, body)
+
+
+def test_envelope_search_response_all_fields():
+    records = fixture_records('search_envelope.json')
+
+    # data[0][1][n][14]; ilk eleman arama başlığı, adsız yer atlanır
+    assert [record['Ad'] for record in records] == ['Moda Kahvecisi', 'Bahariye Börek']
+    assert records[0] == {
+        'Ad': 'Moda Kahvecisi',
+        'Adres': 'Caferağa Mah. Moda Cd. No:12, 34710 Kadıköy/İstanbul',  # [39]
+        'Telefon': '0216 345 67 89',                                      # [178][0][0]
+        'Puan/Yorum': '4,5(1204)',                                        # [4][7], [4][8]
+        'Website': 'https://modakahvecisi.example.com',                   # [7][0]
+        'Kategori': 'Kafe',                                               # [13][0]
+        'Enlem': 40.9862,                                                 # [9][2]
+        'Boylam': 29.0253,                                                # [9][3]
+        'Yer ID': 'ChIJAAAAAAAAAAAAAAAAAAAAAA1',                          # [78]
+        'Harita Linki': 'https://www.google.com/maps/place/?q=place_id:ChIJAAAAAAAAAAAAAAAAAAAAAA1',
+    }
+
+
+def test_sparse_place_falls_back_to_address_parts_and_feature_id():
+    record = fixture_records('search_envelope.json')[1]
+
+    assert record['Ad'] == 'Bahariye Börek'
+    assert record['Adres'] == 'Bahariye Cd. No:40, Kadıköy'  # [39] yok: [2] parçaları
+    assert record['Telefon'] == ''
+    assert record['Puan/Yorum'] == '4,0'  # yorum sayısı yoksa yalnızca puan
+    assert record['Kategori'] == 'Börekçi'
+    assert 'Website' not in record and 'Enlem' not in record
+    # [78] yoksa [10] özellik kimliği; cid onaltılık ikinci parçadır
+    assert record['Yer ID'] == '0x14cab86b0c0d0e0f:0x00000000000003e8'
+    assert record['Harita Linki'] == 'https://www.google.com/maps?cid=1000'
+
+
+def test_paged_search_response():
+    records = fixture_records('search_paged.json')
+
+    # data[64][n][1]; liste olmayan giriş atlanır
+    assert [record['Ad'] for record in records] == ['Yeldeğirmeni Fırın', 'Bahariye Börek']
+    assert records[0]['Telefon'] == '0216 000 11 22'
+    assert records[0]['Puan/Yorum'] == '4,8(87)'
+    assert records[0]['Yer ID'] == 'ChIJAAAAAAAAAAAAAAAAAAAAAA2'
+    # Sayı olmayan koordinatlar yazılmaz
+    assert 'Enlem' not in records[0]
+
+
+def test_place_preview_response_matches_search_record():
+    preview = fixture_records('place_preview.json')
+    search = fixture_records('search_envelope.json')
+
+    # Detay yanıtı tek yer döndürür: data[6]
+    assert preview == search[:1]
+
+
+def test_malformed_response_yields_nothing():
+    assert fixture_records('malformed.json') == []
+
+
+@pytest.mark.parametrize('body', [
+    ")]}'\n[1, 2]",
+    '{"c": 0, "d": ")]}\'\\n[1, 2]"}/*""*/',
+    ' [1, 2] ',
+])
+def test_decode_body_strips_xssi_prefix_and_envelope(body):
+    assert decode_body(body) == [1, 2]
+
+
+def test_unexpected_structure_is_empty_not_error():
+    assert places_from_response('/search?tbm=map', ")]}'\n{\"beklenmeyen\": true}") == []
+    assert places_from_response('/maps/preview/place?pb=x', ")]}'\n[null, null]") == []
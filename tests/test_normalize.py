@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""Vektörel normalizasyon: telefon (E.164), puan / yorum sayısı, adres temizliği"""
+
+import pandas as pd
+import pytest
+
+from business_record import BusinessRecord
+from normalize import PHONE_E164, RATING, REVIEW_COUNT, normalize_in_chunks, normalize_records, phone_to_e164
+
+RECORDS = [
+    {'Ad': 'Moda Kahvecisi', 'Telefon': '0216 345 67 89', 'Puan/Yorum': '4,5(1.204)',
+     'Adres': 'Adres:  Caferağa Mah.  Moda Cd. No:12 , '},
+    {'Ad': 'Bahariye Börek', 'Telefon': '+90 (532) 111 22 33', 'Puan/Yorum': '4.8 stars 87 Reviews',
+     'Adres': '4,5(120) Kafe'},
+    {'Ad': 'Yeldeğirmeni Fırın', 'Telefon': '212 555 44 33', 'Puan/Yorum': '4,2 yıldız 1,204 Yorum', 'Adres': '34710'},
+    {'Ad': 'Kısa Numara', 'Telefon': '444 0 123', 'Puan/Yorum': 'Yeni', 'Adres': ' · Kadıköy/İstanbul ;'},
+]
+
+
+@pytest.mark.parametrize('phone, expected', [
+    ('0216 345 67 89', '+902163456789'),
+    ('+90 (532) 111 22 33', '+905321112233'),
+    ('212 555 44 33', '+902125554433'),
+    ('444 0 123', ''),
+    ('', ''),
+    (None, ''),
+])
+def test_phone_to_e164(phone, expected):
+    assert phone_to_e164(phone) == expected
+
+
+def test_normalize_records_adds_typed_columns():
+    df = normalize_records(RECORDS)
+
+    assert list(df[PHONE_E164]) == ['+902163456789', '+905321112233', '+902125554433', '']
+    assert list(df[RATING][:3]) == [4.5, 4.8, 4.2]
+    assert pd.isna(df[RATING][3])
+    assert list(df[REVIEW_COUNT][:3]) == [1204, 87, 1204]
+    assert pd.isna(df[REVIEW_COUNT][3])
+    assert str(df[REVIEW_COUNT].dtype) == 'Int64'
+    # 'Adres:' öneki, fazla boşluk ve baş/son ayraçlar atılır; puan metni ve sadece sayı adres değildir
+    assert list(df['Adres']) == ['Caferağa Mah. Moda Cd. No:12', '', '', 'Kadıköy/İstanbul']
+
+
+def test_business_records_and_dicts_normalize_alike():
+    from_dicts = normalize_records(RECORDS)
+    from_records = normalize_records([BusinessRecord(record) for record in RECORDS])
+
+    columns = ['Ad', 'Adres', PHONE_E164, RATING, REVIEW_COUNT]
+    pd.testing.assert_frame_equal(from_records[columns], from_dicts[columns])
+
+
+def test_empty_and_chunked_input():
+    assert normalize_records([]).empty
+
+    chunks = list(normalize_in_chunks(RECORDS, chunk_size=3))
+    assert [len(chunk) for chunk in chunks] == [3, 1]
+    assert list(pd.concat(chunks)[PHONE_E164]) == list(normalize_records(RECORDS)[PHONE_E164])
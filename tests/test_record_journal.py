@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Kayıt günlüğü: ekleme / okuma / sıfırlama, yarım satır, tamamlanan ve yarıda kalan aramalar"""
+
+import os
+
+import pytest
+
+from record_journal import RecordJournal, journal_path
+
+pytestmark = pytest.mark.usefixtures('app_home')
+
+
+def test_journal_path_per_search():
+    assert journal_path('Kafe', 'İstanbul Kadıköy').endswith(os.path.join('journals', 'kafe_istanbul_kadıköy.jsonl'))
+    assert journal_path('kafe', 'Moda') != journal_path('kafe', 'Bahariye')
+
+
+def test_batch_jobs_with_same_search_use_separate_journals():
+    paths = {journal_path('kafe', 'Moda'), journal_path('kafe', 'Moda', 0), journal_path('kafe', 'Moda', 1)}
+    assert len(paths) == 3
+    assert journal_path('kafe', '', 0).endswith('kafe_job_0.jsonl')
+
+
+def test_append_load_reset(tmp_path):
+    journal = RecordJournal(str(tmp_path / 'arama.jsonl'), flush_every=2)
+    journal.append({'Yer ID': 'ChIJ1', 'Ad': 'Moda Kahvecisi', 'Telefon': ''})
+    journal.append({'Ad': 'Kimliksiz İşletme'})
+    journal.append({'Yer ID': 'ChIJ1', 'Telefon': '0216 345 67 89'})  # detaylar sonradan geldi
+    journal.close()
+
+    records = RecordJournal(journal.path).load()
+    assert [record['Ad'] for record in records] == ['Moda Kahvecisi', 'Kimliksiz İşletme']
+    assert records[0]['Telefon'] == '0216 345 67 89'
+
+    journal.reset()
+    assert not os.path.exists(journal.path)
+    assert journal.load() == []
+
+
+def test_truncated_last_line_is_skipped(tmp_path):
+    path = str(tmp_path / 'arama.jsonl')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"Yer ID": "ChIJ1", "Ad": "Moda Kahvecisi"}\n{"Yer ID": "ChIJ2", "Ad": "Bah')
+
+    journal = RecordJournal(path, flush_every=1)
+    assert [record['Ad'] for record in journal.load()] == ['Moda Kahvecisi']
+    # Çökmeden sonra eklenen kayıt yarım satırla birleşmez
+    journal.append({'Yer ID': 'ChIJ3', 'Ad': 'Yeldeğirmeni Fırın'})
+    journal.close()
+    assert [record['Ad'] for record in journal.load()] == ['Moda Kahvecisi', 'Yeldeğirmeni Fırın']
+
+
+BUSINESSES = [{'Yer ID': f"ChIJ{i}", 'Ad': f"İşletme {i}", 'Telefon': f"0216 345 67 {i:02d}"} for i in range(6)]
+
+
+def test_completed_search_removes_journal(offline_scraper):
+    scraper = offline_scraper(BUSINESSES)
+    assert scraper.search_businesses('kafe', 'Moda', 4)
+
+    assert len(scraper.business_data) == 4
+    assert not os.path.exists(journal_path('kafe', 'Moda'))
+
+
+def test_stopped_search_resumes_from_partial_journal(offline_scraper):
+    stopped = offline_scraper(BUSINESSES, stop_after=2)
+    assert stopped.search_businesses('kafe', 'Moda', 5)
+    assert [record['Ad'] for record in RecordJournal(journal_path('kafe', 'Moda')).load()] == ['İşletme 0',
+                                                                                            'İşletme 1']
+
+    resumed = offline_scraper(BUSINESSES)
+    assert resumed.search_businesses('kafe', 'Moda', 5, resume=True)
+
+    # Günlükteki iki işletme yeniden taranmaz; kalan üçü toplanır ve günlük silinir
+    assert [record['Ad'] for record in resumed.business_data] == [f"İşletme {i}" for i in range(5)]
+    assert resumed.collected_places == ['ChIJ2', 'ChIJ3', 'ChIJ4']
+    assert [record['Sıra'] for record in resumed.business_data] == [1, 2, 3, 4, 5]
+    assert not os.path.exists(journal_path('kafe', 'Moda'))
+
+
+def test_new_search_without_resume_discards_partial_journal(offline_scraper):
+    offline_scraper(BUSINESSES, stop_after=2).search_businesses('kafe', 'Moda', 5)
+
+    fresh = offline_scraper(BUSINESSES)
+    assert fresh.search_businesses('kafe', 'Moda', 3)
+    assert fresh.collected_places == ['ChIJ0', 'ChIJ1', 'ChIJ2']
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""SQLite sonuç deposu: upsert, sorgu filtreleri, place id'siz kayıtlar, dışa aktarım"""
+
+import csv
+
+import pytest
+
+from data_export import EXPORT_COLUMNS
+from result_store import ResultStore, fallback_place_id, split_city_district
+
+RECORDS = [
+    {'Yer ID': 'ChIJ1', 'Ad': 'Moda Berber', 'Adres': 'Moda Cd. No:12, 34710 Kadıköy/İstanbul',
+     'Telefon': '0216 345 67 89', 'Puan/Yorum': '4,8(120)', 'Kategori': 'Berber'},
+    {'Yer ID': 'ChIJ2', 'Ad': 'Bahariye Kuaför', 'Adres': 'Bahariye Cd. No:40, 34714 Kadıköy/İstanbul',
+     'Telefon': '', 'Puan/Yorum': '4,2(35)', 'Kategori': 'Kuaför'},
+    {'Yer ID': 'ChIJ3', 'Ad': 'Beşiktaş Berber', 'Adres': 'Çarşı Sk. No:3, 34353 Beşiktaş/İstanbul',
+     'Telefon': '0212 555 12 34', 'Puan/Yorum': '4,6(80)', 'Kategori': 'Berber'},
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    result_store = ResultStore(str(tmp_path / 'results.db'), batch_size=2)
+    result_store.add(RECORDS, query='berber', location='İstanbul')
+    yield result_store
+    result_store.close()
+
+
+def names(records):
+    return [record['Ad'] for record in records]
+
+
+def test_split_city_district():
+    assert split_city_district('Moda Cd. No:12, 34710 Kadıköy/İstanbul') == ('İstanbul', 'Kadıköy')
+    assert split_city_district('Moda Cd. No:12') == ('', '')
+
+
+def test_query_filters(store):
+    assert store.count() == 3
+    assert names(store.query(category='berber')) == ['Moda Berber', 'Beşiktaş Berber']  # puana göre
+    assert names(store.query(district='Kadıköy', min_rating=4.5)) == ['Moda Berber']
+    assert names(store.query(city='İstanbul', has_phone=False)) == ['Bahariye Kuaför']
+    assert names(store.query(has_phone=True, order_by='name')) == ['Beşiktaş Berber', 'Moda Berber']
+    assert names(store.query(name_like='Kuaf')) == ['Bahariye Kuaför']
+    assert names(store.query(search='berber', limit=1)) == ['Moda Berber']
+    assert store.query(search='kafe') == []
+    with pytest.raises(ValueError):
+        store.query(order_by='name; DROP TABLE places')
+
+
+def test_query_returns_scraper_records(store):
+    record = store.query(name_like='Moda')[0]
+    assert record['Yer ID'] == 'ChIJ1' and record['Sıra'] == 1
+    assert record['Telefon (E.164)'] == '+902163456789'
+    assert record['Puan'] == 4.8 and record['Yorum Sayısı'] == 120
+    assert record['İlçe'] == 'Kadıköy' and record['Konum'] == 'İstanbul'
+
+
+def test_upsert_keeps_known_values(store):
+    first_seen = store.connection.execute("SELECT first_seen FROM places WHERE place_id = 'ChIJ2'").fetchone()[0]
+
+    store.add([{'Yer ID': 'ChIJ2', 'Ad': 'Bahariye Kuaför', 'Telefon': '0216 111 22 33', 'Puan/Yorum': ''}])
+    store.add([{'Yer ID': 'ChIJ1', 'Ad': 'Moda Berber', 'Telefon': '', 'Website': 'moda.example.com'}])
+
+    assert store.count() == 3
+    bahariye = store.query(name_like='Bahariye')[0]
+    assert bahariye['Telefon'] == '0216 111 22 33'
+    assert bahariye['Puan/Yorum'] == '4,2(35)'  # boş yeni değer eskisini silmez
+    moda = store.query(name_like='Moda')[0]
+    assert moda['Telefon'] == '0216 345 67 89' and moda['Website'] == 'moda.example.com'
+    assert store.connection.execute(
+        "SELECT first_seen FROM places WHERE place_id = 'ChIJ2'").fetchone()[0] == first_seen
+
+
+def test_records_without_place_id_use_fallback_id(store):
+    record = {'Ad': 'Yeldeğirmeni Fırın', 'Adres': 'Karakolhane Cd. No:5, 34716 Kadıköy/İstanbul'}
+    store.add([record])
+    # Aynı ad + adres (büyük/küçük harf, boşluk farkı) aynı satırı günceller
+    store.add([dict(record, Ad=' yeldeğirmeni fırın ', Telefon='0216 444 55 66')])
+    store.add([{'Ad': ''}])  # adı olmayan kayıt yazılmaz
+
+    assert store.count() == 4
+    stored = store.query(name_like='Fırın')[0]
+    assert stored['Yer ID'] == fallback_place_id(record['Ad'], record['Adres'])
+    assert stored['Yer ID'].startswith('h:')
+    assert stored['Telefon'] == '0216 444 55 66'
+
+
+def test_export_keeps_fields_outside_export_columns(store, tmp_path):
+    store.add([{'Yer ID': 'ChIJ3', 'Ad': 'Beşiktaş Berber', 'Açılış Saatleri': '09:00-20:00', 'Özel Alan': 'x'}])
+    path = str(tmp_path / 'berberler.csv')
+
+    assert store.export(path, 'csv', chunk_size=1, category='Berber') == 2
+
+    with open(path, encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0])[:len(EXPORT_COLUMNS)] == EXPORT_COLUMNS
+    assert {'Özel Alan', 'İlçe', 'Şehir'} <= set(rows[0])
+    besiktas = next(row for row in rows if row['Ad'] == 'Beşiktaş Berber')
+    assert besiktas['Özel Alan'] == 'x' and besiktas['Açılış Saatleri'] == '09:00-20:00'
+    assert besiktas['Telefon (E.164)'] == '+902125551234'
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Öğrenen selector sıralayıcı: sıralama, ölü selector'lar ve öğrenilen sıranın diske yazılıp okunması"""
+
+import json
+
+from selector_resolver import STATS_VERSION, SelectorResolver
+
+PHONE = ["[data-item-id^='phone']", "a[href^='tel:']", '.Io6YTe.fontBodyMedium']
+
+
+def test_winner_is_tried_first():
+    resolver = SelectorResolver()
+    assert resolver.order('phone', PHONE + [PHONE[0]]) == PHONE  # tekrarsız, verilen sırayla
+
+    for _ in range(3):
+        resolver.record('phone', [(PHONE[0], False, 0.002), (PHONE[1], False, 0.001), (PHONE[2], True, 0.001)])
+
+    assert resolver.order('phone', PHONE) == [PHONE[2], PHONE[1], PHONE[0]]  # ıskalayanlar hızlıdan yavaşa
+
+
+def test_missing_field_does_not_count_as_miss():
+    resolver = SelectorResolver(dead_after=2)
+    for _ in range(5):
+        resolver.record('phone', [(selector, False, 0.001) for selector in PHONE])  # kartta telefon yok
+
+    assert resolver.order('phone', PHONE) == PHONE
+    assert resolver.summary()['phone']['found_rate'] == 0.0
+
+
+def test_dead_selectors_are_skipped_until_all_are_dead():
+    resolver = SelectorResolver(dead_after=2)
+    for _ in range(2):
+        resolver.record('phone', [(PHONE[0], False, 0.001), (PHONE[1], True, 0.001)])
+
+    assert resolver.order('phone', PHONE) == [PHONE[1], PHONE[2]]
+    assert resolver.summary()['phone']['selectors'][PHONE[0]]['dead']
+    assert resolver.order('phone', [PHONE[0]]) == [PHONE[0]]  # hepsi ölüyse tam liste
+
+
+def test_learned_order_survives_save_and_load(tmp_path):
+    path = str(tmp_path / 'selector_stats.json')
+    resolver = SelectorResolver(path, dead_after=3)
+    for _ in range(3):
+        resolver.record('phone', [(PHONE[0], False, 0.002), (PHONE[1], True, 0.001)])
+    resolver.record('name', [('h3', True, 0.001)])
+    learned = resolver.order('phone', PHONE)
+    resolver.save()
+
+    reloaded = SelectorResolver(path, dead_after=3)
+
+    assert learned == [PHONE[1], PHONE[2]]
+    assert reloaded.order('phone', PHONE) == learned
+    assert reloaded.summary() == resolver.summary()
+    assert list(tmp_path.iterdir()) == [tmp_path / 'selector_stats.json']  # geçici dosya kalmaz
+
+
+def test_unknown_or_broken_stats_file_starts_fresh(tmp_path):
+    old = tmp_path / 'eski.json'
+    old.write_text(json.dumps({'version': STATS_VERSION + 1, 'selectors': {'phone': {}}}), encoding='utf-8')
+    broken = tmp_path / 'bozuk.json'
+    broken.write_text('{', encoding='utf-8')
+
+    assert SelectorResolver(str(old)).selectors == {}
+    assert SelectorResolver(str(broken)).selectors == {}
+    assert SelectorResolver(str(tmp_path / 'yok.json')).order('phone', PHONE) == PHONE
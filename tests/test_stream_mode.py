@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Akış (MutationObserver) modu: gözlemci kurulumu, tampon, yeniden kurulum ve sayfa içi bekleme"""
+
+import pytest
+
+pytest.importorskip('selenium')
+
+from card_scripts import STREAM_DRAIN_SCRIPT, STREAM_INSTALL_SCRIPT, STREAM_NEXT_SCRIPT  # noqa: E402
+from google_maps_scraper import GoogleMapsScraper  # noqa: E402
+
+
+def cards(*indexes):
+    return [{'index': i, 'href': f"https://www.google.com/maps/place/{i}", 'fields': {}} for i in indexes]
+
+
+class StreamDriver:
+    """Her script için sıradaki yanıtı döndürür; çağrıları (script, argümanlar) olarak kaydeder"""
+
+    def __init__(self, **responses):
+        self.responses = {
+            STREAM_INSTALL_SCRIPT: responses.get('install', []),
+            STREAM_DRAIN_SCRIPT: responses.get('drain', []),
+            STREAM_NEXT_SCRIPT: responses.get('next', []),
+        }
+        self.calls = []
+
+    def _respond(self, script, args):
+        self.calls.append((script, args))
+        response = self.responses[script].pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def execute_script(self, script, *args):
+        return self._respond(script, args)
+
+    def execute_async_script(self, script, *args):
+        return self._respond(script, args)
+
+
+@pytest.fixture
+def scraper():
+    scraper = GoogleMapsScraper(notify=False, selector_stats_path=False, result_store=False, dedup_index=False,
+                                wait_timeout=5)
+    scraper.extraction_mode = 'stream'
+    return scraper
+
+
+def test_new_search_installs_observer(scraper):
+    scraper.driver = StreamDriver(install=[cards(0, 1, 2)])
+
+    assert [card['index'] for card in scraper._fetch_raw_cards(0)] == [0, 1, 2]
+    (script, (field_selectors, start)), = scraper.driver.calls
+    assert script == STREAM_INSTALL_SCRIPT and start == 0
+    assert set(field_selectors) >= {'name', 'phone', 'address', 'rating'}
+
+
+def test_cards_arriving_while_scrolling_need_no_extra_call(scraper):
+    scraper.driver = StreamDriver(next=[{'cards': cards(3, 4), 'ended': False}])
+
+    assert scraper._scroll_page(timeout=2) == 'grew'
+    assert scraper.driver.calls == [(STREAM_NEXT_SCRIPT, (2000,))]
+    assert [card['index'] for card in scraper._fetch_stream_cards({}, 3)] == [3, 4]
+    assert len(scraper.driver.calls) == 1
+    assert scraper._stream_buffer == []
+
+
+def test_empty_buffer_is_drained_and_old_cards_dropped(scraper):
+    scraper.driver = StreamDriver(drain=[{'cards': cards(4, 5, 6), 'ended': False}])
+
+    assert [card['index'] for card in scraper._fetch_stream_cards({}, 5)] == [5, 6]
+    assert [script for script, _ in scraper.driver.calls] == [STREAM_DRAIN_SCRIPT]
+
+
+def test_redrawn_feed_reinstalls_observer_from_cursor(scraper):
+    scraper.driver = StreamDriver(drain=[None], install=[cards(0, 1, 7, 8)])
+
+    assert [card['index'] for card in scraper._fetch_stream_cards({'name': ['h3']}, 7)] == [7, 8]
+    assert scraper.driver.calls == [(STREAM_DRAIN_SCRIPT, ()), (STREAM_INSTALL_SCRIPT, ({'name': ['h3']}, 7))]
+
+
+@pytest.mark.parametrize('response, expected', [
+    ({'cards': [], 'ended': True}, 'end'),
+    ({'cards': [], 'ended': False}, False),          # süre doldu
+    (None, False),                                   # gözlemci kayboldu
+    (RuntimeError('script zaman aşımı'), False),
+])
+def test_stream_next_results(scraper, response, expected):
+    scraper.driver = StreamDriver(next=[response])
+
+    assert scraper._stream_next(timeout=30) == expected
+    # Bekleme süresi wait_timeout'u aşmaz
+    assert scraper.driver.calls == [(STREAM_NEXT_SCRIPT, (5000,))]
+    assert scraper._stream_buffer == []
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""Tek taramalı metin sınıflandırıcı ve telefon / adres yardımcıları"""
+
+import pytest
+
+import text_classifier
+from text_classifier import classify, find_phone, find_rating, is_valid_phone, label_of
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('4,5(120)', 'rating'),
+    ('0216 345 6789', 'phone'),
+    ('Şu anda açık', 'status'),
+    ('Moda Caddesi No:12 Kadıköy', 'address'),
+    ('Restoran', 'category'),
+    ('Moda Kahvecisi', ''),
+])
+def test_label_of(text, expected):
+    assert label_of(text) == expected
+
+
+def test_classify_collects_every_label_once():
+    found = classify('4,5(120) · Restoran · Moda Caddesi No:12 · 0216 345 6789')
+    assert found['rating'] == '4,5(120)'
+    assert found['phone'].strip() == '0216 345 6789'
+    assert 'address' in found and 'category' in found
+    assert classify('') == {} and classify(None) == {}
+
+
+def test_short_address_line_is_not_address():
+    assert 'address' in classify('Cad. 5')
+    assert label_of('Cad. 5') != 'address'
+
+
+@pytest.mark.parametrize('text', ['0216 345 6789', '(0216) 345 6789', '444 0 123'])
+def test_matches_per_call_checks(text):
+    label = label_of(text)
+    assert (label == 'phone') == is_valid_phone(text)
+
+
+def test_find_phone_and_rating():
+    assert find_phone('Ara: 0216 345 6789 veya 123') == '0216 345 6789'
+    assert find_phone('No: 12') == ''
+    assert find_rating('Moda Kahvecisi 4,5(120) Kafe') == '4,5(120)'
+    assert find_rating(None) == ''
+
+
+def test_labels_follow_priority_order():
+    assert text_classifier.LABELS[:2] == ('rating', 'phone')
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""Feed bekleme koşulları: büyüme (kart / yükseklik), liste sonu ve kaydırma bütçesi"""
+
+import pytest
+
+from wait_conditions import (FEED_STATE_SCRIPT, SCROLL_FEED_SCRIPT, FeedState, feed_grew_or_ended, feed_state,
+                             scroll_feed)
+
+
+class FeedDriver:
+    """Feed script'lerine sırayla verilen [kart, yükseklik, liste_sonu] durumlarını döndürür"""
+
+    def __init__(self, *states):
+        self.states = list(states)
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+        if isinstance(self.states[0], Exception):
+            raise self.states.pop(0)
+        return self.states.pop(0) if len(self.states) > 1 else self.states[0]
+
+
+def test_feed_state_reads_one_script():
+    driver = FeedDriver([12, 4800, True])
+    assert feed_state(driver) == FeedState(12, 4800, True)
+    assert driver.scripts == [FEED_STATE_SCRIPT]
+
+    # Feed yok / driver hatası: boş durum
+    assert feed_state(FeedDriver(None)) == FeedState(0, 0, False)
+    assert feed_state(FeedDriver(RuntimeError('driver kapalı'))) == FeedState(0, 0, False)
+
+
+def test_scroll_feed_returns_state_before_scroll():
+    driver = FeedDriver([7, 2100, False])
+    assert scroll_feed(driver) == FeedState(7, 2100, False)
+    assert driver.scripts == [SCROLL_FEED_SCRIPT]
+
+
+@pytest.mark.parametrize('state, expected', [
+    ([8, 2100, False], 'grew'),   # yeni kart
+    ([7, 2600, False], 'grew'),   # aynı kart sayısı, feed uzadı (body yüksekliği değişmez)
+    ([7, 2100, True], 'end'),     # liste sonu işaretçisi
+    ([8, 2100, True], 'grew'),    # son kartlar da okunmalı
+    ([7, 2100, False], False),
+])
+def test_feed_grew_or_ended(state, expected):
+    assert feed_grew_or_ended(7, 2100)(FeedDriver(state)) == expected
+
+
+def test_height_is_ignored_without_previous_height():
+    assert feed_grew_or_ended(7)(FeedDriver([7, 9999, False])) is False
+
+
+selenium = pytest.importorskip('selenium')
+
+from google_maps_scraper import GoogleMapsScraper  # noqa: E402
+
+
+@pytest.fixture
+def scraper():
+    scraper = GoogleMapsScraper(notify=False, selector_stats_path=False, result_store=False, dedup_index=False,
+                                wait_timeout=1, stall_budget=6.0)
+    scraper.extraction_mode = 'bulk'
+    return scraper
+
+
+def test_stall_budget_is_short_for_tiles(scraper):
+    assert scraper._stall_budget() == 6.0
+    assert scraper._stall_budget(patient=False) == scraper.retry_wait_timeout == 1
+
+
+def test_scroll_page_waits_until_feed_grows_or_ends(scraper):
+    scraper.driver = FeedDriver([7, 2100, False], [7, 2100, False], [7, 2600, False])
+    assert scraper._scroll_page() == 'grew'
+    assert scraper.driver.scripts[0] == SCROLL_FEED_SCRIPT
+
+    scraper.driver = FeedDriver([20, 9000, False], [20, 9000, True])
+    assert scraper._scroll_page() == 'end'
+
+    scraper.driver = FeedDriver([20, 9000, True])
+    assert scraper._scroll_page(timeout=0.3) == 'end'
+
+    # Kaydırma hatasında önceki durum ayrıca okunur; feed değişmezse zaman aşımı
+    scraper.driver = FeedDriver(RuntimeError('kaydırılamadı'), [20, 9000, False])
+    assert scraper._scroll_page(timeout=0.3) is False
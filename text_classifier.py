@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kart metni sınıflandırıcı
+
+Telefon, adres, puan, çalışma saati, durum ve kategori kalıpları modül
+yüklenirken bir kez derlenir. `classify` tüm kalıpları isimli gruplarla
+tek bir alternasyonda birleştirir ve metni tek taramada etiketler (scraper
+birleşik kart metninin satırlarını bununla etiketler); `is_*` / `find_*`
+fonksiyonları scraper'ın eski yardımcılarıyla birebir aynı sonucu veren
+derlenmiş karşılıklardır.
+
+Eski yardımcılarla karşılaştırmalı ölçüm:
+    python text_classifier.py
+"""
+
+import re
+
+
+def _any_of(patterns, flags=0):
+    """Kalıp listesini tek derlenmiş alternasyona çevir ('herhangi biri eşleşir mi' ile eşdeğer)"""
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in dict.fromkeys(patterns)), flags)
+
+
+def _words(words):
+    """Alt metin arayan tek derlenmiş kalıp"""
+    return re.compile('|'.join(map(re.escape, dict.fromkeys(words))))
+
+
+NON_DIGIT_RE = re.compile(r'[^\d]')
+
+# Türkiye telefon numarası biçimleri (geçerlilik kontrolü)
+VALID_PHONE_RE = _any_of([
+    r'\(\d{3,4}\)\s*\d{3,4}\s*\d{2,4}',     # (0212) 123 45 67
+    r'0\d{3,4}\s*\d{3,4}\s*\d{2,4}',        # 0212 123 45 67
+    r'\d{3,4}\s*\d{3,4}\s*\d{2,4}',         # 212 123 45 67
+    r'05\d{2}\s*\d{3}\s*\d{2}\s*\d{2}',     # 0543 823 00 00
+    r'5\d{2}\s*\d{3}\s*\d{2}\s*\d{2}',      # 543 823 00 00
+    r'\+90\s*\d{3,4}\s*\d{3,4}\s*\d{2,4}',  # +90 212 123 45 67
+    r'90\s*\d{3,4}\s*\d{3,4}\s*\d{2,4}',    # 90 212 123 45 67
+    r'\d{3,4}\s*\d{3,4}',                   # 212 123 45
+])
+
+# Metin içinden telefon çıkarma - sıra önemli (eşit uzunlukta ilk bulunan seçilir)
+PHONE_FIND_RES = tuple(re.compile(pattern) for pattern in [
+    r'\(\d{3,4}\)\s*\d{3,4}\s*\d{2,4}',
+    r'0\d{3,4}\s*\d{3,4}\s*\d{2,4}',
+    r'\d{3,4}\s*\d{3,4}\s*\d{2,4}',
+    r'05\d{2}\s*\d{3}\s*\d{2}\s*\d{2}',
+    r'5\d{2}\s*\d{3}\s*\d{2}\s*\d{2}',
+    r'\+90\s*\d{3,4}\s*\d{3,4}\s*\d{2,4}',
+    r'90\s*\d{3,4}\s*\d{3,4}\s*\d{2,4}',
+    r'\d{3,4}-\d{3,4}-\d{2,4}',             # 212-123-45-67
+    r'\d{3,4}\.\d{3,4}\.\d{2,4}',           # 212.123.45.67
+    r'\b\d{10}\b',
+    r'\b\d{9}\b',
+])
+
+# Kısa telefon kontrolü (birleşik metinde adres adayını elemek için)
+PHONE_LIKE_RE = _any_of([
+    r'\(\d{3,4}\)\s*\d{3,4}\s*\d{2,4}',
+    r'\d{3,4}\s*\d{3,4}\s*\d{2,4}',
+    r'\+90\s*\d{3,4}\s*\d{3,4}\s*\d{2,4}',
+])
+
+# Puan/yorum: 4,5(120)
+RATING_RE = re.compile(r'\d+,\d+\(\d+\)')
+
+# Detay paneli aria-label'leri
+PHONE_LABEL_RE = re.compile(r'Telefon:\s*([0-9\s\(\)]+)')
+ADDRESS_LABEL_RE = re.compile(r'Adres:\s*(.+)')
+
+# Adres olmayan metinler
+_NOT_ADDRESS_PATTERNS = [
+    r'^\d+,\d+\(\d+\)',       # Puan bilgisi (ile başlayan)
+    r'^\d+$',                 # Sadece sayı
+    r'^[A-Za-z\s]{1,10}$',    # Çok kısa sadece harf
+]
+NOT_ADDRESS_RE = _any_of(_NOT_ADDRESS_PATTERNS)
+NOT_CLEAN_ADDRESS_RE = _any_of(_NOT_ADDRESS_PATTERNS + [
+    r'\(0\d{3,4}\)',          # Telefon numarası
+    r'0\d{3,4}\s*\d{3,4}',    # Telefon numarası
+    r'Web sitesi', r'Yol tarifi', r'Şoförleri', r'Deneyimli', r'Günün', r'Taksi durağı',
+])
+
+_ADDRESS_WORDS = [
+    'sokak', 'sk', 'cadde', 'cd', 'bulvar', 'blv', 'mahalle', 'mah',
+    'no:', 'no ', 'apt', 'daire', 'kat', 'sok', 'cad',
+]
+ADDRESS_HINT_RE = _words(_ADDRESS_WORDS + ['taksi', 'durak', 'durağı', 'merkez', 'plaza', 'avm', 'center'])
+CLEAN_ADDRESS_HINT_RE = _words(_ADDRESS_WORDS + [
+    'profesör', 'doktor', 'caddesi', 'mimoza', 'meşrutiyet', 'paşa', 'atif', 'yılmaz', 'yüzyıl', 'galericiler'
+])
+ADDRESS_LINE_HINT_RE = _words([
+    'Mah', 'Cad', 'Sok', 'No:', 'Blok', 'Kat', 'Daire', 'Mahallesi', 'Caddesi', 'Sokağı', 'Sk.', 'Cd.', 'Apt.', 'Sitesi'
+])
+CATEGORY_HINT_RE = _words([
+    'Taksi', 'Eczane', 'Restoran', 'Market', 'Cafe', 'Otel', 'Hastane',
+    'Okul', 'Banka', 'Emlak', 'Berber', 'Kuaför', 'Spor', 'Fitness',
+    'Durağı', 'Merkezi', 'Şubesi', 'Mağazası', 'Dükkanı', 'Çilingir',
+    'Anahtarcı', 'Hizmetleri', 'Servisi', 'Elektronik', 'Oto'
+])
+WEBSITE_HINT_RE = _words(['www.', 'http', '.com', '.tr', '.org', '.net'])
+HOURS_RE = _any_of([
+    r'\d{1,2}:\d{2}',
+    r'\d{1,2}\.\d{2}',
+    r'Pazartesi|Salı|Çarşamba|Perşembe|Cuma|Cumartesi|Pazar',
+    r'Kapalı|Açık|Hafta|Gün',
+], re.IGNORECASE)
+STATUS_RE = _words(['Açık', 'Kapalı', 'Open', 'Closed', 'Şu anda açık', 'Şu anda kapalı'])
+
+# Tek taramalı sınıflandırıcı: öncelik sırasıyla isimli gruplar
+_LABEL_PATTERNS = [
+    ('rating', RATING_RE.pattern),
+    ('phone', VALID_PHONE_RE.pattern),
+    ('status', STATUS_RE.pattern),
+    ('hours', '(?i:' + HOURS_RE.pattern + ')'),
+    ('address', ADDRESS_LINE_HINT_RE.pattern),
+    ('category', CATEGORY_HINT_RE.pattern),
+]
+LABELS = tuple(label for label, _ in _LABEL_PATTERNS)
+CLASSIFIER_RE = re.compile('|'.join(f'(?P<{label}>{pattern})' for label, pattern in _LABEL_PATTERNS))
+
+
+def classify(text):
+    """
+    Metni tek taramada etiketle
+
+    Returns:
+        dict: Bulunan etiket -> ilk eşleşen parça (örn. {'rating': '4,5(120)', 'phone': '0212 555 00 00'})
+    """
+    found = {}
+    for match in CLASSIFIER_RE.finditer(text or ''):
+        label = match.lastgroup
+        if label not in found:
+            found[label] = match.group()
+    return found
+
+
+def label_of(text):
+    """Metin bloğunun tek etiketi: rating, phone, status, hours, address, category veya ''"""
+    found = classify(text)
+    for label in LABELS:
+        if label in found and (label != 'address' or len(text) > 15) and (label != 'category' or len(text) < 60):
+            return label
+    return ''
+
+
+def is_valid_phone(text):
+    """7-11 haneli ve bilinen bir telefon biçiminde mi"""
+    if not text:
+        return False
+    digits = len(NON_DIGIT_RE.sub('', text))
+    return 7 <= digits <= 11 and VALID_PHONE_RE.search(text) is not None
+
+
+def is_phone_number(text):
+    return PHONE_LIKE_RE.search(text) is not None
+
+
+def find_phone(text):
+    """Metindeki en uzun telefon numarasını döndür (en az 9 hane), yoksa ''"""
+    # Hiçbir kalıp metindekinden fazla hane bulamaz - hanesi az metni hiç tarama
+    if not text or len(NON_DIGIT_RE.sub('', text)) < 9:
+        return ''
+    found = [
+        match.strip()
+        for pattern in PHONE_FIND_RES
+        for match in pattern.findall(text)
+        if len(NON_DIGIT_RE.sub('', match)) >= 9
+    ]
+    return max(found, key=len) if found else ''
+
+
+def find_rating(text):
+    match = RATING_RE.search(text or '')
+    return match.group() if match else ''
+
+
+def is_valid_address(text):
+    if not text or NOT_ADDRESS_RE.search(text):
+        return False
+    return ADDRESS_HINT_RE.search(text.lower()) is not None or len(text) > 10
+
+
+def is_clean_address(text):
+    if not text or NOT_CLEAN_ADDRESS_RE.search(text):
+        return False
+    return CLEAN_ADDRESS_HINT_RE.search(text.lower()) is not None or len(text) > 20
+
+
+def is_address(text):
+    return len(text) > 15 and ADDRESS_LINE_HINT_RE.search(text) is not None
+
+
+def is_category(text):
+    return len(text) < 60 and CATEGORY_HINT_RE.search(text) is not None
+
+
+def is_website(text):
+    return WEBSITE_HINT_RE.search(text.lower()) is not None
+
+
+def is_opening_hours(text):
+    return HOURS_RE.search(text) is not None
+
+
+def is_status(text):
+    return STATUS_RE.search(text) is not None
+
+
+def phone_from_label(aria_label):
+    """'Telefon: 0212 ...' aria-label'inden numarayı al"""
+    match = PHONE_LABEL_RE.search(aria_label or '')
+    return match.group(1).strip() if match else ''
+
+
+def address_from_label(aria_label):
+    """'Adres: ...' aria-label'inden adresi al"""
+    match = ADDRESS_LABEL_RE.search(aria_label or '')
+    return match.group(1).strip() if match else ''
+
+
+if __name__ == "__main__":
+    import time
+
+    # Eski yardımcılar (her çağrıda liste gezen, derlenmemiş kalıplar) - yalnızca karşılaştırma için
+    def legacy_is_valid_phone(text):
+        if not text:
+            return False
+        clean_text = re.sub(r'[^\d]', '', text)
+        if len(clean_text) < 7 or len(clean_text) > 11:
+            return False
+        for pattern in [r'\(\d{3,4}\)\s*\d{3,4}\s*\d{2,4}', r'0\d{3,4}\s*\d{3,4}\s*\d{2,4}',
+                        r'\d{3,4}\s*\d{3,4}\s*\d{2,4}', r'05\d{2}\s*\d{3}\s*\d{2}\s*\d{2}',
+                        r'5\d{2}\s*\d{3}\s*\d{2}\s*\d{2}', r'\+90\s*\d{3,4}\s*\d{3,4}\s*\d{2,4}',
+                        r'90\s*\d{3,4}\s*\d{3,4}\s*\d{2,4}', r'\d{3,4}\s*\d{3,4}\s*\d{2,4}',
+                        r'\d{3,4}\s*\d{3,4}', r'\d{3,4}\s*\d{3,4}\s*\d{2}']:
+            if re.search(pattern, text):
+                return True
+        return False
+
+    def legacy_is_clean_address(text):
+        if not text:
+            return False
+        for pattern in [r'^\d+,\d+\(\d+\)$', r'^\d+,\d+\(\d+\)', r'^\d+$', r'^[A-Za-z\s]{1,10}$',
+                        r'\(0\d{3,4}\)', r'0\d{3,4}\s*\d{3,4}', r'Web sitesi', r'Yol tarifi',
+                        r'Şoförleri', r'Deneyimli', r'Günün', r'Taksi durağı']:
+            if re.search(pattern, text):
+                return False
+        for indicator in ['sokak', 'sk', 'cadde', 'cd', 'bulvar', 'blv', 'mahalle', 'mah', 'no:', 'no ',
+                          'apt', 'daire', 'kat', 'sok', 'cad', 'blv', 'profesör', 'doktor', 'caddesi',
+                          'mimoza', 'meşrutiyet', 'paşa', 'atif', 'yılmaz', 'yüzyıl', 'galericiler']:
+            if indicator in text.lower():
+                return True
+        return len(text) > 20
+
+    def legacy_find_phone(text):
+        found = []
+        for pattern in [r'\(\d{3,4}\)\s*\d{3,4}\s*\d{2,4}', r'0\d{3,4}\s*\d{3,4}\s*\d{2,4}',
+                        r'\d{3,4}\s*\d{3,4}\s*\d{2,4}', r'05\d{2}\s*\d{3}\s*\d{2}\s*\d{2}',
+                        r'5\d{2}\s*\d{3}\s*\d{2}\s*\d{2}', r'\+90\s*\d{3,4}\s*\d{3,4}\s*\d{2,4}',
+                        r'90\s*\d{3,4}\s*\d{3,4}\s*\d{2,4}', r'\d{3,4}-\d{3,4}-\d{2,4}',
+                        r'\d{3,4}\.\d{3,4}\.\d{2,4}', r'\b\d{10}\b', r'\b\d{9}\b']:
+            for match in re.findall(pattern, text):
+                if len(re.sub(r'[^\d]', '', match)) >= 9:
+                    found.append(match.strip())
+        return max(found, key=len) if found else ''
+
+    def legacy_is_opening_hours(text):
+        for pattern in [r'\d{1,2}:\d{2}', r'\d{1,2}\.\d{2}',
+                        r'Pazartesi|Salı|Çarşamba|Perşembe|Cuma|Cumartesi|Pazar', r'Kapalı|Açık|Hafta|Gün']:
+            if re.search(pattern, text, re.IGNORECASE):
+                return True
+        return False
+
+    def legacy_is_status(text):
+        return any(indicator in text for indicator in ['Açık', 'Kapalı', 'Open', 'Closed',
+                                                       'Şu anda açık', 'Şu anda kapalı'])
+
+    def legacy_is_category(text):
+        return any(indicator in text for indicator in [
+            'Taksi', 'Eczane', 'Restoran', 'Market', 'Cafe', 'Otel', 'Hastane', 'Okul', 'Banka', 'Emlak',
+            'Berber', 'Kuaför', 'Spor', 'Fitness', 'Durağı', 'Merkezi', 'Şubesi', 'Mağazası', 'Dükkanı',
+            'Çilingir', 'Anahtarcı', 'Hizmetleri', 'Servisi', 'Elektronik', 'Oto'
+        ]) and len(text) < 60
+
+    # Kart metinlerinden tipik satırlar
+    corpus = [
+        "Kafe Moda", "4,5(120)", "4,8(1.204)", "Kafe · Moda Cd. No:12", "Caferağa Mah. Moda Cd. No:12, 34710 Kadıköy",
+        "0216 345 67 89", "(0212) 555 44 33", "+90 532 111 22 33", "0543 823 00 00", "Açık · Kapanış: 23:00",
+        "Şu anda kapalı", "Pazartesi 09:00–18:00", "Eczane", "Taksi durağı", "Web sitesi", "Yol tarifi",
+        "Bağdat Cd. No:245 D:3, Suadiye", "Berber · 12 yıllık", "www.ornekkafe.com.tr", "Mimoza Sk. 4/1",
+        "Deneyimli şoförleri ile hizmetinizde", "₺₺ · Restoran", "Otoyol Servisi", "34710", "Kat 3 Daire 7",
+        "Restoran\n4,3(87)\nBağdat Cd. No:10\n0216 444 55 66\nAçık · Kapanış: 22:00",
+    ] * 40
+
+    checks = [
+        ('is_valid_phone', legacy_is_valid_phone, is_valid_phone),
+        ('is_clean_address', legacy_is_clean_address, is_clean_address),
+        ('find_phone', legacy_find_phone, find_phone),
+        ('is_opening_hours', legacy_is_opening_hours, is_opening_hours),
+        ('is_status', legacy_is_status, is_status),
+        ('is_category', legacy_is_category, is_category),
+    ]
+
+    def timed(function, repeat=20):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for text in corpus:
+                function(text)
+        return (time.perf_counter() - started) / (repeat * len(corpus)) * 1e6
+
+    print(f"Korpus: {len(corpus)} metin\n")
+    print(f"{'Fonksiyon':<18} {'Eski (µs)':>10} {'Yeni (µs)':>10} {'Hızlanma':>9}  Uyum")
+    legacy_total = new_total = 0.0
+    for name, legacy, new in checks:
+        mismatches = sum(legacy(text) != new(text) for text in corpus)
+        legacy_us, new_us = timed(legacy), timed(new)
+        legacy_total += legacy_us
+        new_total += new_us
+        print(f"{name:<18} {legacy_us:>10.2f} {new_us:>10.2f} {legacy_us / new_us:>8.1f}x  "
+              f"{'✓' if not mismatches else f'{mismatches} fark'}")
+
+    # Scraper'ın satır etiketlemesi: eski ayrı kontroller ile tek taramalı classify aynı kararı vermeli
+    def legacy_line_label(line):
+        if re.match(r'^\d+,\d+\(\d+\)$', line):
+            return 'rating'
+        return 'address' if is_address(line) else ''
+
+    def line_label(line):
+        labels = classify(line)
+        if labels.get('rating') == line:
+            return 'rating'
+        return 'address' if 'address' in labels and len(line) > 15 else ''
+
+    lines = [line.strip() for text in corpus for line in text.split('\n') if line.strip()]
+    differences = sum(legacy_line_label(line) != line_label(line) for line in lines)
+    print(f"\nSatır etiketleme (scraper): {'✓' if not differences else f'{differences} fark'}")
+
+    # Bir metni tüm etiketler için ayrı ayrı sınamak yerine tek tarama
+    classify_us = timed(classify)
+    print(f"\nTüm eski kontroller (metin başına): {legacy_total:.2f} µs")
+    print(f"Tek taramalı classify():            {classify_us:.2f} µs ({legacy_total / classify_us:.1f}x)")
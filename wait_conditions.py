@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WebDriverWait için Google Maps'e özel bekleme koşulları
+
+Her koşul `expected_conditions` gibi driver alan bir callable'dır;
+koşul sağlanmadığında False, sağlandığında anlamlı bir değer döndürür.
+"""
+
+from collections import namedtuple
+
+# Feed'in tek istekte okunan durumu: kart sayısı, kendi kaydırma yüksekliği, liste sonu
+FeedState = namedtuple('FeedState', 'count height ended')
+
+# Sonuç listesindeki (feed) eleman sayısı
+FEED_CHILD_COUNT_SCRIPT = """
+var feed = document.querySelector("[role='feed']");
+return feed ? feed.children.length : 0;
+"""
+
+# "Listenin sonuna ulaştınız" işaretçisi görünür mü? (akış script'leri de kullanır: card_scripts)
+FEED_ENDED_JS = """
+function feedEnded(feed) {
+    var marker = feed.querySelector('.HlvSq');
+    if (marker && marker.offsetParent !== null) { return true; }
+    var tail = feed.lastElementChild;
+    return /sonuna ulaştınız|end of the list/i.test(tail ? (tail.innerText || '') : '');
+}
+"""
+
+# Feed durumu tek çağrıda (body yüksekliği iç feed büyüyünce değişmez, feed'in kendisi ölçülür)
+FEED_STATE_SCRIPT = FEED_ENDED_JS + """
+var feed = document.querySelector("[role='feed']");
+if (!feed) { return [0, 0, false]; }
+return [feed.children.length, feed.scrollHeight, feedEnded(feed)];
+"""
+
+# Feed'i (yoksa ana paneli) sonuna kaydır; kaydırmadan önceki durumu döndür
+SCROLL_FEED_SCRIPT = """
+var state = (function () {""" + FEED_STATE_SCRIPT + """})();
+var feed = document.querySelector("[role='feed']");
+var panel = document.querySelector("[role='main']");
+if (feed) { feed.scrollTop = feed.scrollHeight; }
+if (panel) { panel.scrollTop = panel.scrollHeight; }
+window.scrollTo(0, document.body.scrollHeight);
+return state;
+"""
+
+# Detay panelindeki işletme başlığı
+DETAIL_TITLE_SCRIPT = """
+var heading = document.querySelector("h1.DUwDvf") || document.querySelector("[role='main'] h1");
+return heading ? (heading.innerText || heading.textContent || '').trim() : '';
+"""
+
+
+def feed_child_count(driver):
+    """Feed içindeki mevcut eleman sayısını döndür"""
+    try:
+        return driver.execute_script(FEED_CHILD_COUNT_SCRIPT) or 0
+    except Exception:
+        return 0
+
+
+def _feed_state(value):
+    if not value:
+        return FeedState(0, 0, False)
+    count, height, ended = value
+    return FeedState(count or 0, height or 0, bool(ended))
+
+
+def feed_state(driver):
+    """Feed'in kart sayısı, kaydırma yüksekliği ve liste sonu durumu"""
+    try:
+        return _feed_state(driver.execute_script(FEED_STATE_SCRIPT))
+    except Exception:
+        return FeedState(0, 0, False)
+
+
+def scroll_feed(driver):
+    """Feed'i sonuna kaydır (tek istek); kaydırmadan önceki FeedState'i döndür"""
+    return _feed_state(driver.execute_script(SCROLL_FEED_SCRIPT))
+
+
+def detail_title(driver):
+    """Detay panelindeki mevcut başlığı döndür"""
+    try:
+        return driver.execute_script(DETAIL_TITLE_SCRIPT) or ''
+    except Exception:
+        return ''
+
+
+class feed_has_children:
+    """Feed en az bir eleman içeriyorsa eleman sayısını döndür"""
+
+    def __call__(self, driver):
+        count = feed_child_count(driver)
+        return count if count > 0 else False
+
+
+class feed_grew_or_ended:
+    """
+    Feed büyüdüğünde 'grew', liste sonu göründüğünde 'end' döndür
+
+    Büyüme feed'in kart sayısı veya kendi kaydırma yüksekliğiyle ölçülür
+    (her yoklama tek istek).
+    """
+
+    def __init__(self, previous_count, previous_height=None):
+        self.previous_count = previous_count
+        self.previous_height = previous_height
+
+    def __call__(self, driver):
+        state = feed_state(driver)
+        if state.count > self.previous_count:
+            return 'grew'
+        if self.previous_height is not None and state.height > self.previous_height:
+            return 'grew'
+        if state.ended:
+            return 'end'
+        return False
+
+
+class detail_title_matches:
+    """
+    Detay paneli beklenen işletmenin başlığını gösterdiğinde başlığı döndür
+
+    Beklenen ad tam eşleşmese de (kısaltma vb.) başlık önceki değerden
+    farklılaştıysa panel yeni işletmeye geçmiş sayılır.
+    """
+
+    def __init__(self, expected_title, previous_title=''):
+        self.expected_title = (expected_title or '').strip().casefold()
+        self.previous_title = previous_title
+
+    def __call__(self, driver):
+        title = detail_title(driver)
+        if not title:
+            return False
+        if self.expected_title and title.casefold() == self.expected_title:
+            return title
+        return title if title != self.previous_title else False